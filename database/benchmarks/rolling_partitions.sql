@@ -0,0 +1,131 @@
+-- Rolling load on plain versus monthly range-partitioned task/comment tables.
+--
+-- Simulates months of traffic: each month inserts tasks and comments into both layouts, reads
+-- comments of recent tasks, and once the retention window is full removes the oldest month
+-- (DELETE on the plain tables, DETACH + DROP on the partitioned ones). One NOTICE line per month
+-- shows whether insert, read and expiry cost stay flat as data ages. Runs in its own schema.
+--
+--   docker exec my_postgres_db psql -U myuser -d mydatabase -f /benchmarks/rolling_partitions.sql \
+--       -v months=24 -v tasks_per_month=50000 -v comments_per_task=3 -v retention=12
+
+\set ON_ERROR_STOP on
+\if :{?months} \else \set months 24 \endif
+\if :{?tasks_per_month} \else \set tasks_per_month 50000 \endif
+\if :{?comments_per_task} \else \set comments_per_task 3 \endif
+\if :{?retention} \else \set retention 12 \endif
+SET bench.months = :months;
+SET bench.tasks_per_month = :tasks_per_month;
+SET bench.comments_per_task = :comments_per_task;
+SET bench.retention = :retention;
+
+DROP SCHEMA IF EXISTS bench_partitions CASCADE;
+CREATE SCHEMA bench_partitions;
+SET search_path = bench_partitions, public;
+
+CREATE TABLE task_plain (id BIGSERIAL PRIMARY KEY, author BIGINT, title VARCHAR(255), created_at TIMESTAMP NOT NULL);
+CREATE INDEX ON task_plain (author, id);
+CREATE TABLE comment_plain (id BIGSERIAL PRIMARY KEY, task_id BIGINT, text VARCHAR(255), created_at TIMESTAMP NOT NULL);
+CREATE INDEX ON comment_plain (task_id, id);
+
+CREATE TABLE task_part (id BIGSERIAL, author BIGINT, title VARCHAR(255), created_at TIMESTAMP NOT NULL,
+                        PRIMARY KEY (id, created_at)) PARTITION BY RANGE (created_at);
+CREATE INDEX ON task_part (author, id);
+CREATE TABLE comment_part (id BIGSERIAL, task_id BIGINT, text VARCHAR(255), created_at TIMESTAMP NOT NULL,
+                           PRIMARY KEY (id, created_at)) PARTITION BY RANGE (created_at);
+CREATE INDEX ON comment_part (task_id, id);
+
+DO
+$$
+DECLARE
+    month_count       integer := current_setting('bench.months')::integer;
+    tasks_per_month   integer := current_setting('bench.tasks_per_month')::integer;
+    comments_per_task integer := current_setting('bench.comments_per_task')::integer;
+    retention_months  integer := current_setting('bench.retention')::integer;
+    origin            timestamp := date_trunc('month', localtimestamp) - make_interval(months => month_count);
+    month_start       timestamp;
+    started           timestamp;
+    probe             record;
+    plain_insert      numeric;
+    part_insert       numeric;
+    plain_read        numeric;
+    part_read         numeric;
+    plain_expire      numeric;
+    part_expire       numeric;
+BEGIN
+    RAISE NOTICE 'month  insert_plain_ms  insert_part_ms  read_plain_ms  read_part_ms  expire_plain_ms  expire_part_ms';
+    FOR m IN 0..month_count - 1 LOOP
+        month_start := origin + make_interval(months => m);
+        EXECUTE format('CREATE TABLE task_part_%s PARTITION OF task_part FOR VALUES FROM (%L) TO (%L)',
+                       m, month_start, month_start + interval '1 month');
+        EXECUTE format('CREATE TABLE comment_part_%s PARTITION OF comment_part FOR VALUES FROM (%L) TO (%L)',
+                       m, month_start, month_start + interval '1 month');
+
+        started := clock_timestamp();
+        WITH inserted AS (
+            INSERT INTO task_plain (author, title, created_at)
+            SELECT floor(random() * 10000), 'Task', month_start + random() * interval '27 days'
+            FROM generate_series(1, tasks_per_month)
+            RETURNING id, created_at)
+        INSERT INTO comment_plain (task_id, text, created_at)
+        SELECT i.id, 'Comment', i.created_at + random() * interval '1 day'
+        FROM inserted i, generate_series(1, comments_per_task);
+        plain_insert := extract(epoch FROM clock_timestamp() - started) * 1000;
+
+        started := clock_timestamp();
+        WITH inserted AS (
+            INSERT INTO task_part (author, title, created_at)
+            SELECT floor(random() * 10000), 'Task', month_start + random() * interval '27 days'
+            FROM generate_series(1, tasks_per_month)
+            RETURNING id, created_at)
+        INSERT INTO comment_part (task_id, text, created_at)
+        SELECT i.id, 'Comment', i.created_at + random() * interval '1 day'
+        FROM inserted i, generate_series(1, comments_per_task);
+        part_insert := extract(epoch FROM clock_timestamp() - started) * 1000;
+
+        ANALYZE task_plain, comment_plain, task_part, comment_part;
+
+        -- Comments of 500 random tasks from the current month, as the details endpoint reads them
+        started := clock_timestamp();
+        FOR probe IN SELECT id, created_at FROM task_plain WHERE created_at >= month_start
+                     ORDER BY random() LIMIT 500 LOOP
+            PERFORM count(*) FROM comment_plain WHERE task_id = probe.id;
+        END LOOP;
+        plain_read := extract(epoch FROM clock_timestamp() - started) * 1000;
+
+        started := clock_timestamp();
+        FOR probe IN SELECT id, created_at FROM task_part WHERE created_at >= month_start
+                     ORDER BY random() LIMIT 500 LOOP
+            PERFORM count(*) FROM comment_part WHERE task_id = probe.id AND created_at >= probe.created_at;
+        END LOOP;
+        part_read := extract(epoch FROM clock_timestamp() - started) * 1000;
+
+        plain_expire := 0;
+        part_expire := 0;
+        IF m >= retention_months THEN
+            started := clock_timestamp();
+            DELETE FROM comment_plain WHERE created_at < month_start - make_interval(months => retention_months - 1);
+            DELETE FROM task_plain WHERE created_at < month_start - make_interval(months => retention_months - 1);
+            plain_expire := extract(epoch FROM clock_timestamp() - started) * 1000;
+
+            started := clock_timestamp();
+            EXECUTE format('ALTER TABLE comment_part DETACH PARTITION comment_part_%s', m - retention_months);
+            EXECUTE format('DROP TABLE comment_part_%s', m - retention_months);
+            EXECUTE format('ALTER TABLE task_part DETACH PARTITION task_part_%s', m - retention_months);
+            EXECUTE format('DROP TABLE task_part_%s', m - retention_months);
+            part_expire := extract(epoch FROM clock_timestamp() - started) * 1000;
+        END IF;
+
+        RAISE NOTICE '%  % % % % % %', lpad(m::text, 5),
+            lpad(round(plain_insert)::text, 15), lpad(round(part_insert)::text, 15),
+            lpad(round(plain_read)::text, 14), lpad(round(part_read)::text, 13),
+            lpad(round(plain_expire)::text, 16), lpad(round(part_expire)::text, 15);
+    END LOOP;
+END
+$$;
+
+SELECT 'plain' AS layout, pg_size_pretty(pg_total_relation_size('task_plain') + pg_total_relation_size('comment_plain')) AS size
+UNION ALL
+SELECT 'partitioned', pg_size_pretty(sum(pg_total_relation_size(inhrelid)))
+FROM pg_inherits WHERE inhparent IN ('task_part'::regclass, 'comment_part'::regclass);
+
+DROP SCHEMA bench_partitions CASCADE;
@@ -0,0 +1,100 @@
+-- Shared versus per-type partial indexes on a skewed task/note mix.
+--
+-- Builds its own copy of the task table in the bench_task_type schema: 2M tasks and 20k notes,
+-- with authors drawn so a few heavy users own most rows. It then runs the list queries against
+-- (a) shared (author, task_type, id) style indexes and (b) the partial indexes from
+-- V2__task_type_partial_indexes.sql, printing index sizes and EXPLAIN (ANALYZE, BUFFERS).
+-- The last section shows why the repository inlines the type: a generic plan with task_type
+-- bound as a parameter cannot use a partial index.
+--
+--   docker compose -f database/docker-compose.yml up -d
+--   docker exec my_postgres_db psql -U myuser -d mydatabase -f /benchmarks/task_type_partial_indexes.sql
+
+\set ON_ERROR_STOP on
+DROP SCHEMA IF EXISTS bench_task_type CASCADE;
+CREATE SCHEMA bench_task_type;
+SET search_path = bench_task_type;
+
+CREATE TABLE task
+(
+    id          BIGSERIAL PRIMARY KEY,
+    author      BIGINT,
+    title       VARCHAR(255),
+    task_type   BIGINT,
+    description VARCHAR(255) NOT NULL,
+    group_id    BIGINT,
+    doer        BIGINT,
+    created_at  TIMESTAMP,
+    status      VARCHAR(255),
+    priority    VARCHAR(255)
+);
+
+INSERT INTO task (author, title, task_type, description, group_id, doer, created_at, status, priority)
+SELECT floor(20000 * power(random(), 3))::bigint + 1,
+       'Task ' || g,
+       0,
+       'Benchmark task description',
+       CASE WHEN random() < 0.6 THEN floor(2000 * power(random(), 2))::bigint + 1 END,
+       floor(20000 * random())::bigint + 1,
+       now() - random() * interval '365 days',
+       CASE WHEN random() < 0.3 THEN 'DONE' ELSE 'UNDONE' END,
+       'MIDDLE'
+FROM generate_series(1, 2000000) g;
+
+INSERT INTO task (author, title, task_type, description, group_id, created_at)
+SELECT floor(20000 * power(random(), 3))::bigint + 1,
+       'Note ' || g,
+       1,
+       'Benchmark note description',
+       CASE WHEN random() < 0.6 THEN floor(2000 * power(random(), 2))::bigint + 1 END,
+       now() - random() * interval '365 days'
+FROM generate_series(1, 20000) g;
+
+VACUUM ANALYZE task;
+
+\echo '=== (a) shared indexes ==='
+CREATE INDEX shared_author ON task (author, task_type, id);
+CREATE INDEX shared_group ON task (group_id, task_type, id);
+ANALYZE task;
+
+SELECT relname AS index, pg_size_pretty(pg_relation_size(oid)) AS size
+FROM pg_class WHERE relname LIKE 'shared_%' ORDER BY relname;
+
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT id, title FROM task WHERE task_type = 1 AND author = 1 ORDER BY id;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT id, title FROM task WHERE task_type = 1 AND group_id = 1 ORDER BY id;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT id, title FROM task WHERE task_type = 0 AND author = 1 ORDER BY id;
+
+DROP INDEX shared_author;
+DROP INDEX shared_group;
+
+\echo '=== (b) partial indexes ==='
+CREATE INDEX idx_task_tasks_author ON task (author, id) WHERE task_type = 0;
+CREATE INDEX idx_task_tasks_group ON task (group_id, id) WHERE task_type = 0;
+CREATE INDEX idx_task_notes_author ON task (author, id) WHERE task_type = 1;
+CREATE INDEX idx_task_notes_group ON task (group_id, id) WHERE task_type = 1;
+ANALYZE task;
+
+SELECT relname AS index, pg_size_pretty(pg_relation_size(oid)) AS size
+FROM pg_class WHERE relname LIKE 'idx_task_%' ORDER BY relname;
+
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT id, title FROM task WHERE task_type = 1 AND author = 1 ORDER BY id;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT id, title FROM task WHERE task_type = 1 AND group_id = 1 ORDER BY id;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT id, title FROM task WHERE task_type = 0 AND author = 1 ORDER BY id;
+
+\echo '=== generic plans: bound versus inlined task_type ==='
+SET plan_cache_mode = force_generic_plan;
+PREPARE bound_type(bigint, bigint) AS
+    SELECT id, title FROM task WHERE task_type = $2 AND author = $1 ORDER BY id;
+PREPARE inlined_type(bigint) AS
+    SELECT id, title FROM task WHERE task_type = 1 AND author = $1 ORDER BY id;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE bound_type(1, 1);
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE inlined_type(1);
+RESET plan_cache_mode;
+
+DROP SCHEMA bench_task_type CASCADE;
@@ -0,0 +1,68 @@
+-- Checks expire_task_partitions() on scratch copies of task, comment, subtask, location and reminder.
+--
+-- The function resolves those tables through search_path, so it runs here against a schema of its
+-- own with three monthly partitions from 2000. Fails with an assertion error on the first mismatch.
+--
+--   docker exec my_postgres_db psql -U myuser -d mydatabase -f /tests/partition_retention.sql
+
+\set ON_ERROR_STOP on
+
+DROP SCHEMA IF EXISTS test_partition_retention CASCADE;
+CREATE SCHEMA test_partition_retention;
+SET search_path = test_partition_retention, public;
+
+CREATE TABLE location (id BIGINT PRIMARY KEY);
+CREATE TABLE reminder (id BIGINT PRIMARY KEY);
+CREATE TABLE subtask (id BIGINT PRIMARY KEY, task_id BIGINT NOT NULL);
+CREATE TABLE task (id BIGINT, task_type BIGINT, status VARCHAR(255), location_id BIGINT, deadline_id BIGINT,
+                   created_at TIMESTAMP NOT NULL, PRIMARY KEY (id, created_at)) PARTITION BY RANGE (created_at);
+CREATE TABLE comment (id BIGINT, task_id BIGINT, created_at TIMESTAMP NOT NULL,
+                      PRIMARY KEY (id, created_at)) PARTITION BY RANGE (created_at);
+
+CREATE TABLE task_p200001 PARTITION OF task FOR VALUES FROM ('2000-01-01') TO ('2000-02-01');
+CREATE TABLE task_p200002 PARTITION OF task FOR VALUES FROM ('2000-02-01') TO ('2000-03-01');
+CREATE TABLE task_p200003 PARTITION OF task FOR VALUES FROM ('2000-03-01') TO ('2000-04-01');
+CREATE TABLE comment_p200001 PARTITION OF comment FOR VALUES FROM ('2000-01-01') TO ('2000-02-01');
+CREATE TABLE comment_p200002 PARTITION OF comment FOR VALUES FROM ('2000-02-01') TO ('2000-03-01');
+CREATE TABLE comment_p200003 PARTITION OF comment FOR VALUES FROM ('2000-03-01') TO ('2000-04-01');
+
+-- January: a done task with a location, reminder, subtask and a comment from February, and a note
+INSERT INTO location VALUES (1);
+INSERT INTO reminder VALUES (1);
+INSERT INTO task VALUES (1, 0, 'DONE', 1, 1, '2000-01-10'), (2, 1, NULL, NULL, NULL, '2000-01-11');
+INSERT INTO subtask VALUES (1, 1);
+INSERT INTO comment VALUES (1, 1, '2000-01-12'), (2, 1, '2000-02-03'), (3, 2, '2000-01-13');
+-- February: done tasks only. March: an open task
+INSERT INTO task VALUES (3, 0, 'DONE', NULL, NULL, '2000-02-10'), (4, 0, 'UNDONE', NULL, NULL, '2000-03-10');
+
+DO
+$$
+BEGIN
+    ASSERT expire_task_partitions(interval '1 month', true) = 0, 'a month holding a note expired';
+    ASSERT (SELECT count(*) FROM task) = 4, 'rows were removed from a kept partition';
+    ASSERT (SELECT count(*) FROM comment) = 3, 'comments of kept tasks were removed';
+    ASSERT (SELECT count(*) FROM subtask) = 1, 'subtasks of kept tasks were removed';
+END
+$$;
+
+DELETE FROM comment WHERE task_id = 2;
+DELETE FROM task WHERE id = 2;
+
+DO
+$$
+BEGIN
+    ASSERT expire_task_partitions(interval '1 month', true) = 2, 'January and February did not expire';
+    ASSERT to_regclass('task_p200001') IS NULL AND to_regclass('comment_p200001') IS NULL,
+        'January partitions were not dropped';
+    ASSERT to_regclass('task_p200003') IS NOT NULL, 'the month with an open task expired';
+    ASSERT NOT EXISTS (SELECT 1 FROM comment WHERE task_id = 1), 'a later comment of an expired task remained';
+    ASSERT NOT EXISTS (SELECT 1 FROM subtask), 'a subtask of an expired task remained';
+    ASSERT NOT EXISTS (SELECT 1 FROM location) AND NOT EXISTS (SELECT 1 FROM reminder),
+        'the location or reminder of a dropped task remained';
+    ASSERT (SELECT array_agg(id) FROM task) = ARRAY[4]::bigint[], 'the open task is gone';
+END
+$$;
+
+DROP SCHEMA test_partition_retention CASCADE;
+RESET search_path;
+\echo partition_retention: ok
@@ -2,8 +2,10 @@ package ru.tcai.taskservice;
 
 import org.springframework.boot.SpringApplication;
 import org.springframework.boot.autoconfigure.SpringBootApplication;
+import org.springframework.boot.context.properties.ConfigurationPropertiesScan;
 
 @SpringBootApplication
+@ConfigurationPropertiesScan
 public class Main {
     public static void main(String[] args) {
         SpringApplication.run(Main.class, args);
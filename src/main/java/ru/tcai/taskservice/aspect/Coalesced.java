@@ -0,0 +1,18 @@
+package ru.tcai.taskservice.aspect;
+
+import java.lang.annotation.ElementType;
+import java.lang.annotation.Retention;
+import java.lang.annotation.RetentionPolicy;
+import java.lang.annotation.Target;
+
+/**
+ * Marks a read-only method whose concurrent calls with equal arguments may
+ * share a single execution, see {@link CoalescingAspect}. A request only
+ * shares an execution that began after it arrived, so it sees the writes
+ * committed before it; with {@code task-service.coalescing.share-window}
+ * set, results up to that old are shared regardless.
+ */
+@Target(ElementType.METHOD)
+@Retention(RetentionPolicy.RUNTIME)
+public @interface Coalesced {
+}
@@ -0,0 +1,162 @@
+package ru.tcai.taskservice.aspect;
+
+import io.micrometer.core.instrument.MeterRegistry;
+import org.aspectj.lang.ProceedingJoinPoint;
+import org.aspectj.lang.annotation.Around;
+import org.aspectj.lang.annotation.Aspect;
+import org.aspectj.lang.reflect.MethodSignature;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.core.Ordered;
+import org.springframework.core.annotation.Order;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+import org.springframework.web.context.request.RequestAttributes;
+import org.springframework.web.context.request.RequestContextHolder;
+import ru.tcai.taskservice.config.CoalescingProperties;
+import ru.tcai.taskservice.filter.RequestStartFilter;
+
+import java.lang.reflect.Method;
+import java.util.Arrays;
+import java.util.List;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.TimeUnit;
+
+/**
+ * Single-flight for {@link Coalesced} methods: while a call is running, calls
+ * with equal arguments wait for it and receive the same result (or exception)
+ * instead of querying again. A call only joins one that started after its own
+ * request arrived, so a client reading after its write committed never gets a
+ * result read before it; otherwise it runs and later callers join it instead.
+ * With a non-zero {@code share-window} a completed result is also handed out
+ * for that long afterwards, at the price of reads, the client's own included,
+ * being up to that stale.
+ *
+ * <p>Runs outside the transaction advice, so followers never open a
+ * transaction of their own. Calls made inside an existing transaction are
+ * not coalesced since they may need to see that transaction's writes.
+ */
+@Aspect
+@Component
+@Order(Ordered.HIGHEST_PRECEDENCE)
+@ConditionalOnProperty(prefix = "task-service.coalescing", name = "enabled", havingValue = "true")
+public class CoalescingAspect {
+
+    private final ConcurrentHashMap<CallKey, Flight> flights = new ConcurrentHashMap<>();
+    private final MeterRegistry meterRegistry;
+    private final long shareWindowMillis;
+
+    public CoalescingAspect(MeterRegistry meterRegistry, CoalescingProperties properties) {
+        this.meterRegistry = meterRegistry;
+        this.shareWindowMillis = properties.getShareWindow().toMillis();
+    }
+
+    @Around("@annotation(ru.tcai.taskservice.aspect.Coalesced)")
+    public Object coalesce(ProceedingJoinPoint joinPoint) throws Throwable {
+        if (TransactionSynchronizationManager.isActualTransactionActive()) {
+            return joinPoint.proceed();
+        }
+
+        Method method = ((MethodSignature) joinPoint.getSignature()).getMethod();
+        CallKey key = new CallKey(method, Arrays.asList(joinPoint.getArgs()));
+
+        long requestStart = requestStart();
+        Flight flight = new Flight(System.nanoTime());
+        while (true) {
+            Flight existing = flights.putIfAbsent(key, flight);
+            if (existing == null) {
+                break;
+            }
+            if (existing.startedAt - requestStart >= 0 || (shareWindowMillis > 0 && existing.result.isDone())) {
+                record(method, "collapsed");
+                return await(existing.result);
+            }
+            if (flights.replace(key, existing, flight)) {
+                break;
+            }
+        }
+
+        record(method, "executed");
+        try {
+            Object result = joinPoint.proceed();
+            flight.result.complete(result);
+            return result;
+        } catch (Throwable e) {
+            flight.result.completeExceptionally(e);
+            throw e;
+        } finally {
+            release(key, flight);
+        }
+    }
+
+    // Outside a request (jobs, async streams) the call's own start stands in, so such calls run on their own
+    private static long requestStart() {
+        RequestAttributes attributes = RequestContextHolder.getRequestAttributes();
+        Object start = attributes != null
+                ? attributes.getAttribute(RequestStartFilter.START_ATTRIBUTE, RequestAttributes.SCOPE_REQUEST)
+                : null;
+        return start instanceof Long ? (Long) start : System.nanoTime();
+    }
+
+    private void release(CallKey key, Flight flight) {
+        if (shareWindowMillis <= 0 || flight.result.isCompletedExceptionally()) {
+            flights.remove(key, flight);
+            return;
+        }
+        CompletableFuture.delayedExecutor(shareWindowMillis, TimeUnit.MILLISECONDS)
+                .execute(() -> flights.remove(key, flight));
+    }
+
+    private Object await(CompletableFuture<Object> flight) throws Throwable {
+        try {
+            return flight.get();
+        } catch (ExecutionException e) {
+            throw e.getCause();
+        }
+    }
+
+    private void record(Method method, String outcome) {
+        meterRegistry.counter("coalescing.calls",
+                "method", method.getDeclaringClass().getSimpleName() + "." + method.getName(),
+                "outcome", outcome).increment();
+    }
+
+    private static final class Flight {
+        private final long startedAt;
+        private final CompletableFuture<Object> result = new CompletableFuture<>();
+
+        private Flight(long startedAt) {
+            this.startedAt = startedAt;
+        }
+    }
+
+    private static final class CallKey {
+        private final Method method;
+        private final List<Object> args;
+        private final int hash;
+
+        private CallKey(Method method, List<Object> args) {
+            this.method = method;
+            this.args = args;
+            this.hash = 31 * method.hashCode() + args.hashCode();
+        }
+
+        @Override
+        public boolean equals(Object other) {
+            if (this == other) {
+                return true;
+            }
+            if (!(other instanceof CallKey)) {
+                return false;
+            }
+            CallKey that = (CallKey) other;
+            return method.equals(that.method) && args.equals(that.args);
+        }
+
+        @Override
+        public int hashCode() {
+            return hash;
+        }
+    }
+}
@@ -0,0 +1,39 @@
+package ru.tcai.taskservice.config;
+
+import lombok.AllArgsConstructor;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+import java.util.List;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.admission")
+public class AdmissionProperties {
+    private boolean enabled = false;
+    private RateLimit user = new RateLimit(200, 400);
+    private RateLimit global = new RateLimit(5000, 10000);
+    private int maxTrackedUsers = 100_000;
+    private Concurrency concurrency = new Concurrency();
+    // Streaming export and import hold a slot for minutes and would skew the latency signal
+    private List<String> unlimitedConcurrencyPaths = List.of("/tasks/export", "/tasks/import");
+
+    @Data
+    @NoArgsConstructor
+    @AllArgsConstructor
+    public static class RateLimit {
+        private double rate;
+        private int burst;
+    }
+
+    @Data
+    public static class Concurrency {
+        private int initialLimit = 50;
+        private int minLimit = 4;
+        private int maxLimit = 200;
+        private double latencyTolerance = 2.0;
+        private double backoffRatio = 0.9;
+        private Duration adjustInterval = Duration.ofMillis(100);
+    }
+}
@@ -0,0 +1,18 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.archive")
+public class ArchiveProperties {
+    private boolean enabled = false;
+    private Duration minAge = Duration.ofDays(30);
+    private int batchSize = 500;
+    private Duration batchPause = Duration.ofMillis(200);
+    private Duration maxRunDuration = Duration.ofMinutes(30);
+    private Duration lockTimeout = Duration.ofSeconds(1);
+    private double maxPoolUsage = 0.5;
+}
@@ -0,0 +1,28 @@
+package ru.tcai.taskservice.config;
+
+import com.fasterxml.jackson.databind.MapperFeature;
+import com.fasterxml.jackson.databind.SerializationFeature;
+import com.fasterxml.jackson.dataformat.cbor.CBORFactory;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.http.converter.cbor.MappingJackson2CborHttpMessageConverter;
+import org.springframework.http.converter.json.Jackson2ObjectMapperBuilder;
+
+@Configuration
+public class CborConfig {
+
+    /**
+     * Replaces the default CBOR converter in place, so JSON stays the default for
+     * {@code Accept: *}{@code /*}, and gives it Boot's Jackson settings. Properties
+     * are written alphabetically so the layout does not depend on field
+     * declaration order in the DTOs.
+     */
+    @Bean
+    public MappingJackson2CborHttpMessageConverter cborHttpMessageConverter(Jackson2ObjectMapperBuilder builder) {
+        return new MappingJackson2CborHttpMessageConverter(builder
+                .factory(new CBORFactory())
+                .featuresToEnable(MapperFeature.SORT_PROPERTIES_ALPHABETICALLY,
+                        SerializationFeature.ORDER_MAP_ENTRIES_BY_KEYS)
+                .build());
+    }
+}
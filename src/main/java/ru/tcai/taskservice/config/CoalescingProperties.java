@@ -0,0 +1,13 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.coalescing")
+public class CoalescingProperties {
+    private boolean enabled = false;
+    private Duration shareWindow = Duration.ZERO;
+}
@@ -0,0 +1,10 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.comments.activity")
+public class CommentActivityProperties {
+    private boolean writeBehind = false;
+}
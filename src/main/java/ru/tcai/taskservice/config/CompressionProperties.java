@@ -0,0 +1,17 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.util.List;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.compression")
+public class CompressionProperties {
+    private boolean enabled = false;
+    private int minResponseSize = 1024;
+    private int gzipLevel = 6;
+    private boolean brotli = true;
+    private int brotliQuality = 4;
+    private List<String> mimeTypes = List.of("application/json", "application/x-ndjson", "text/csv", "application/cbor");
+}
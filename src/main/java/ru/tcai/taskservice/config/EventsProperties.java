@@ -0,0 +1,20 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.events")
+public class EventsProperties {
+    private boolean enabled = false;
+    private String channel = "task_events";
+    private int maxSubscribers = 10000;
+    private int subscriberQueueSize = 256;
+    private int writerThreads = 4;
+    private Duration subscriptionTimeout = Duration.ofMinutes(30);
+    private long heartbeatIntervalMs = 15000;
+    private Duration pollTimeout = Duration.ofMillis(500);
+    private Duration reconnectDelay = Duration.ofSeconds(5);
+}
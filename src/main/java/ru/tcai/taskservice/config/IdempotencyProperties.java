@@ -0,0 +1,23 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+import java.util.List;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.idempotency")
+public class IdempotencyProperties {
+    private boolean enabled = false;
+    private Duration ttl = Duration.ofHours(24);
+    // A key whose request never finished (the instance died) is given up after this long; running
+    // requests renew it every third of this
+    private Duration inFlightTimeout = Duration.ofMinutes(10);
+    private int maxKeyLength = 255;
+    private int maxResponseSize = 1024 * 1024;
+    private int compressMinSize = 512;
+    private int cleanupBatchSize = 10_000;
+    private List<String> paths = List.of("/tasks", "/tasks/note", "/tasks/*/comment", "/tasks/note/*/comment",
+            "/tasks/*/subtask", "/tasks/import");
+}
@@ -0,0 +1,12 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.import")
+public class ImportProperties {
+    private int chunkSize = 500;
+    // Longer records are rejected without being buffered whole
+    private int maxRecordLength = 64 * 1024;
+}
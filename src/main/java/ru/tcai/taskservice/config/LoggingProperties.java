@@ -0,0 +1,19 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+/**
+ * Everything except {@code entityDumps} is read by logback-spring.xml.
+ */
+@Data
+@ConfigurationProperties(prefix = "task-service.logging")
+public class LoggingProperties {
+    private String format = "json";
+    private String mode = "async";
+    private int queueSize = 8192;
+    private String sampledLoggers = "ru.tcai.taskservice.service.TaskServiceImpl";
+    private int debugSampleRate = 1;
+    private int infoSampleRate = 1;
+    private boolean entityDumps = false;
+}
@@ -0,0 +1,31 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.outbox")
+public class OutboxProperties {
+    private boolean enabled = false;
+    private String sink = "file";
+    private int batchSize = 500;
+    private int maxBatchesPerRun = 100;
+    private long pollIntervalMs = 200;
+    private Duration maxBackoff = Duration.ofSeconds(30);
+    private FileSink file = new FileSink();
+    private HttpSink http = new HttpSink();
+
+    @Data
+    public static class FileSink {
+        private String path = "outbox/task-events.ndjson";
+    }
+
+    @Data
+    public static class HttpSink {
+        private String url;
+        private Duration connectTimeout = Duration.ofSeconds(2);
+        private Duration readTimeout = Duration.ofSeconds(10);
+    }
+}
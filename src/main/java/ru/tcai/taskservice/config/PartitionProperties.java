@@ -0,0 +1,15 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.util.List;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.partitions")
+public class PartitionProperties {
+    private List<String> tables = List.of("task", "comment");
+    private int monthsAhead = 3;
+    private int retentionMonths = 0;
+    private boolean dropExpired = false;
+}
@@ -0,0 +1,25 @@
+package ru.tcai.taskservice.config;
+
+import jakarta.persistence.EntityManagerFactory;
+import org.springframework.boot.LazyInitializationExcludeFilter;
+import org.springframework.boot.autoconfigure.flyway.FlywayMigrationInitializer;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import ru.tcai.taskservice.events.TaskEventListener;
+
+@Configuration
+public class StartupConfig {
+
+    // With lazy initialization (fast-start profile) migrations and Hibernate would otherwise run on the
+    // first request instead of during startup. Scheduled beans are already kept eager by Spring Boot.
+    @Bean
+    static LazyInitializationExcludeFilter persistenceLazyInitializationExcludeFilter() {
+        return LazyInitializationExcludeFilter.forBeanTypes(FlywayMigrationInitializer.class, EntityManagerFactory.class);
+    }
+
+    // Nothing injects the listener, so lazily it would never start listening
+    @Bean
+    static LazyInitializationExcludeFilter eventsLazyInitializationExcludeFilter() {
+        return LazyInitializationExcludeFilter.forBeanTypes(TaskEventListener.class);
+    }
+}
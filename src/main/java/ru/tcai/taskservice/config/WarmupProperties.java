@@ -0,0 +1,15 @@
+package ru.tcai.taskservice.config;
+
+import lombok.Data;
+import org.springframework.boot.context.properties.ConfigurationProperties;
+
+import java.time.Duration;
+
+@Data
+@ConfigurationProperties(prefix = "task-service.warmup")
+public class WarmupProperties {
+    private boolean enabled = true;
+    private int iterations = 200;
+    private Duration maxDuration = Duration.ofSeconds(30);
+    private long groupId = -1;
+}
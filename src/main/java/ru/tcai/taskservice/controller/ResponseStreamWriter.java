@@ -0,0 +1,72 @@
+package ru.tcai.taskservice.controller;
+
+import com.fasterxml.jackson.core.JsonGenerator;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.fasterxml.jackson.databind.ObjectWriter;
+import com.fasterxml.jackson.databind.SerializationFeature;
+import org.springframework.http.MediaType;
+import org.springframework.http.ResponseEntity;
+import org.springframework.stereotype.Component;
+import org.springframework.web.servlet.mvc.method.annotation.StreamingResponseBody;
+
+import java.io.IOException;
+import java.io.UncheckedIOException;
+import java.util.function.Consumer;
+
+@Component
+public class ResponseStreamWriter {
+
+    private static final int FLUSH_EVERY = 64;
+
+    private final ObjectWriter objectWriter;
+
+    public ResponseStreamWriter(ObjectMapper objectMapper) {
+        // Flushing is batched below instead of after every row
+        this.objectWriter = objectMapper.writer().without(SerializationFeature.FLUSH_AFTER_WRITE_VALUE);
+    }
+
+    public <T> ResponseEntity<StreamingResponseBody> ndjson(Consumer<Consumer<T>> producer) {
+        return ResponseEntity.ok()
+                .contentType(MediaType.APPLICATION_NDJSON)
+                .body(body(producer, false));
+    }
+
+    public <T> ResponseEntity<StreamingResponseBody> jsonArray(Consumer<Consumer<T>> producer) {
+        return ResponseEntity.ok()
+                .contentType(MediaType.APPLICATION_JSON)
+                .body(body(producer, true));
+    }
+
+    private <T> StreamingResponseBody body(Consumer<Consumer<T>> producer, boolean array) {
+        return outputStream -> {
+            try (JsonGenerator generator = objectWriter.createGenerator(outputStream)) {
+                if (array) {
+                    generator.writeStartArray();
+                } else {
+                    generator.setRootValueSeparator(null);
+                }
+
+                int[] written = {0};
+                producer.accept(item -> {
+                    try {
+                        objectWriter.writeValue(generator, item);
+                        if (!array) {
+                            generator.writeRaw('\n');
+                        }
+                        // Flush the first row right away so time-to-first-byte does not depend on list size
+                        written[0]++;
+                        if (written[0] == 1 || written[0] % FLUSH_EVERY == 0) {
+                            generator.flush();
+                        }
+                    } catch (IOException e) {
+                        throw new UncheckedIOException(e);
+                    }
+                });
+
+                if (array) {
+                    generator.writeEndArray();
+                }
+            }
+        };
+    }
+}
@@ -6,8 +6,10 @@ import ru.tcai.taskservice.dto.response.*;
 import ru.tcai.taskservice.service.TaskService;
 import lombok.RequiredArgsConstructor;
 import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.*;
+import org.springframework.web.servlet.mvc.method.annotation.StreamingResponseBody;
 
 import java.util.List;
 
@@ -17,6 +19,7 @@ import java.util.List;
 public class TaskController {
 
     private final TaskService taskService;
+    private final ResponseStreamWriter responseStreamWriter;
 
     @PostMapping
     public ResponseEntity<TaskResponse> createTask(@RequestBody @Valid TaskRequest taskRequest) {
@@ -24,6 +27,18 @@ public class TaskController {
         return ResponseEntity.status(HttpStatus.CREATED).body(response);
     }
 
+    @GetMapping(params = "ids")
+    public ResponseEntity<List<TaskLookupResponse>> getTasksByIds(@RequestParam List<Long> ids) {
+        List<TaskLookupResponse> response = taskService.getTasksByIds(ids);
+        return ResponseEntity.ok(response);
+    }
+
+    @PostMapping("/batch")
+    public ResponseEntity<List<TaskLookupResponse>> getTasksByIds(@RequestBody @Valid TaskIdsRequest taskIdsRequest) {
+        List<TaskLookupResponse> response = taskService.getTasksByIds(taskIdsRequest.getIds());
+        return ResponseEntity.ok(response);
+    }
+
     @GetMapping("/{taskId}")
     public ResponseEntity<TaskResponse> getTaskById(@PathVariable Long taskId) {
         TaskResponse response = taskService.getTaskById(taskId);
@@ -54,6 +69,56 @@ public class TaskController {
         return ResponseEntity.ok(response);
     }
 
+    @GetMapping("/inbox/{userId}")
+    public ResponseEntity<TaskPageResponse> getInbox(@PathVariable Long userId,
+                                                     @RequestParam(defaultValue = "") List<Long> groupIds,
+                                                     @RequestParam(defaultValue = "DEADLINE") InboxSort sort,
+                                                     @RequestParam(defaultValue = "0") int page,
+                                                     @RequestParam(defaultValue = "50") int size) {
+        TaskPageResponse response = taskService.getInbox(userId, groupIds, sort, page, size);
+        return ResponseEntity.ok(response);
+    }
+
+    @GetMapping(value = "/personal/{userId}", produces = MediaType.APPLICATION_NDJSON_VALUE)
+    public ResponseEntity<StreamingResponseBody> streamPersonalTasksByAuthorId(@PathVariable Long userId) {
+        return responseStreamWriter.<TaskResponse>ndjson(consumer -> taskService.streamPersonalTasksByAuthorId(userId, consumer));
+    }
+
+    @GetMapping(value = "/personal/{userId}", params = "stream=true")
+    public ResponseEntity<StreamingResponseBody> streamPersonalTasksByAuthorIdAsArray(@PathVariable Long userId) {
+        return responseStreamWriter.<TaskResponse>jsonArray(consumer -> taskService.streamPersonalTasksByAuthorId(userId, consumer));
+    }
+
+    @GetMapping(value = "/user/{userId}", produces = MediaType.APPLICATION_NDJSON_VALUE)
+    public ResponseEntity<StreamingResponseBody> streamTasksByAuthorId(@PathVariable Long userId) {
+        return responseStreamWriter.<TaskResponse>ndjson(consumer -> taskService.streamTasksByAuthorId(userId, consumer));
+    }
+
+    @GetMapping(value = "/user/{userId}", params = "stream=true")
+    public ResponseEntity<StreamingResponseBody> streamTasksByAuthorIdAsArray(@PathVariable Long userId) {
+        return responseStreamWriter.<TaskResponse>jsonArray(consumer -> taskService.streamTasksByAuthorId(userId, consumer));
+    }
+
+    @GetMapping(value = "/group/{groupId}", produces = MediaType.APPLICATION_NDJSON_VALUE)
+    public ResponseEntity<StreamingResponseBody> streamTasksByGroupId(@PathVariable Long groupId) {
+        return responseStreamWriter.<TaskResponse>ndjson(consumer -> taskService.streamTasksByGroupId(groupId, consumer));
+    }
+
+    @GetMapping(value = "/group/{groupId}", params = "stream=true")
+    public ResponseEntity<StreamingResponseBody> streamTasksByGroupIdAsArray(@PathVariable Long groupId) {
+        return responseStreamWriter.<TaskResponse>jsonArray(consumer -> taskService.streamTasksByGroupId(groupId, consumer));
+    }
+
+    @GetMapping(value = "/doer/{doerId}", produces = MediaType.APPLICATION_NDJSON_VALUE)
+    public ResponseEntity<StreamingResponseBody> streamTasksByDoerId(@PathVariable Long doerId) {
+        return responseStreamWriter.<TaskResponse>ndjson(consumer -> taskService.streamTasksByDoerId(doerId, consumer));
+    }
+
+    @GetMapping(value = "/doer/{doerId}", params = "stream=true")
+    public ResponseEntity<StreamingResponseBody> streamTasksByDoerIdAsArray(@PathVariable Long doerId) {
+        return responseStreamWriter.<TaskResponse>jsonArray(consumer -> taskService.streamTasksByDoerId(doerId, consumer));
+    }
+
     @GetMapping("/details/{taskId}")
     public ResponseEntity<TaskDetailsResponse> getTaskDetailsById(@PathVariable Long taskId) {
         TaskDetailsResponse response = taskService.getTaskDetailsById(taskId);
@@ -74,6 +139,32 @@ public class TaskController {
         return ResponseEntity.ok(response);
     }
 
+    @PostMapping("/{taskId}/subtask")
+    public ResponseEntity<SubtaskResponse> addSubtask(@PathVariable Long taskId,
+                                                      @RequestBody @Valid SubtaskRequest subtaskRequest) {
+        SubtaskResponse response = taskService.addSubtask(taskId, subtaskRequest);
+        return ResponseEntity.status(HttpStatus.CREATED).body(response);
+    }
+
+    @GetMapping("/{taskId}/subtasks")
+    public ResponseEntity<List<SubtaskResponse>> getSubtasksByTaskId(@PathVariable Long taskId) {
+        List<SubtaskResponse> response = taskService.getSubtasksByTaskId(taskId);
+        return ResponseEntity.ok(response);
+    }
+
+    @PutMapping("/subtasks/{subtaskId}/status")
+    public ResponseEntity<SubtaskResponse> updateSubtaskStatus(@PathVariable Long subtaskId,
+                                                               @RequestBody @Valid SubtaskStatusRequest subtaskStatusRequest) {
+        SubtaskResponse response = taskService.updateSubtaskStatus(subtaskId, subtaskStatusRequest);
+        return ResponseEntity.ok(response);
+    }
+
+    @DeleteMapping("/subtasks/{subtaskId}")
+    public ResponseEntity<Void> deleteSubtask(@PathVariable Long subtaskId) {
+        taskService.deleteSubtask(subtaskId);
+        return ResponseEntity.noContent().build();
+    }
+
     @DeleteMapping("/comment/{id}")
     public ResponseEntity<Void> deleteComment(@PathVariable Long id) {
         taskService.deleteComment(id);
@@ -110,6 +201,36 @@ public class TaskController {
         return ResponseEntity.ok(response);
     }
 
+    @GetMapping(value = "/note/personal/{userId}", produces = MediaType.APPLICATION_NDJSON_VALUE)
+    public ResponseEntity<StreamingResponseBody> streamPersonalNotesByAuthorId(@PathVariable Long userId) {
+        return responseStreamWriter.<NoteResponse>ndjson(consumer -> taskService.streamPersonalNotesByAuthorId(userId, consumer));
+    }
+
+    @GetMapping(value = "/note/personal/{userId}", params = "stream=true")
+    public ResponseEntity<StreamingResponseBody> streamPersonalNotesByAuthorIdAsArray(@PathVariable Long userId) {
+        return responseStreamWriter.<NoteResponse>jsonArray(consumer -> taskService.streamPersonalNotesByAuthorId(userId, consumer));
+    }
+
+    @GetMapping(value = "/note/user/{userId}", produces = MediaType.APPLICATION_NDJSON_VALUE)
+    public ResponseEntity<StreamingResponseBody> streamNotesByAuthorId(@PathVariable Long userId) {
+        return responseStreamWriter.<NoteResponse>ndjson(consumer -> taskService.streamNotesByAuthorId(userId, consumer));
+    }
+
+    @GetMapping(value = "/note/user/{userId}", params = "stream=true")
+    public ResponseEntity<StreamingResponseBody> streamNotesByAuthorIdAsArray(@PathVariable Long userId) {
+        return responseStreamWriter.<NoteResponse>jsonArray(consumer -> taskService.streamNotesByAuthorId(userId, consumer));
+    }
+
+    @GetMapping(value = "/note/group/{groupId}", produces = MediaType.APPLICATION_NDJSON_VALUE)
+    public ResponseEntity<StreamingResponseBody> streamNotesByGroupId(@PathVariable Long groupId) {
+        return responseStreamWriter.<NoteResponse>ndjson(consumer -> taskService.streamNotesByGroupId(groupId, consumer));
+    }
+
+    @GetMapping(value = "/note/group/{groupId}", params = "stream=true")
+    public ResponseEntity<StreamingResponseBody> streamNotesByGroupIdAsArray(@PathVariable Long groupId) {
+        return responseStreamWriter.<NoteResponse>jsonArray(consumer -> taskService.streamNotesByGroupId(groupId, consumer));
+    }
+
     @DeleteMapping("/note/{id}")
     public ResponseEntity<Void> deleteNote(@PathVariable Long id) {
         taskService.deleteNote(id);
@@ -2,14 +2,19 @@ package ru.tcai.taskservice.controller;
 
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
+import org.springframework.http.HttpHeaders;
 import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.ExceptionHandler;
 import org.springframework.web.bind.annotation.RestControllerAdvice;
 import ru.tcai.taskservice.dto.response.ErrorResponse;
 import ru.tcai.taskservice.exception.CommentNotFoundException;
 import ru.tcai.taskservice.exception.NoteNotFoundException;
+import ru.tcai.taskservice.exception.SubtaskNotFoundException;
 import ru.tcai.taskservice.exception.TaskNotFoundException;
+import ru.tcai.taskservice.exception.TooManyIdsException;
+import ru.tcai.taskservice.exception.TooManySubscribersException;
 
 import java.time.LocalDateTime;
 
@@ -55,4 +60,47 @@ public class TaskControllerAdvice {
 
         return new ResponseEntity<>(errorResponse, HttpStatus.NOT_FOUND);
     }
+
+    @ExceptionHandler(SubtaskNotFoundException.class)
+    public ResponseEntity<ErrorResponse> subtaskNotFoundExceptionHandler(SubtaskNotFoundException exception) {
+        log.info(exception.getMessage());
+
+        ErrorResponse errorResponse = ErrorResponse.builder()
+                .timestamp(LocalDateTime.now())
+                .status(HttpStatus.NOT_FOUND.value())
+                .message(exception.getMessage())
+                .build();
+
+        return new ResponseEntity<>(errorResponse, HttpStatus.NOT_FOUND);
+    }
+
+    @ExceptionHandler(TooManyIdsException.class)
+    public ResponseEntity<ErrorResponse> tooManyIdsExceptionHandler(TooManyIdsException exception) {
+        log.info(exception.getMessage());
+
+        ErrorResponse errorResponse = ErrorResponse.builder()
+                .timestamp(LocalDateTime.now())
+                .status(HttpStatus.BAD_REQUEST.value())
+                .message(exception.getMessage())
+                .build();
+
+        return new ResponseEntity<>(errorResponse, HttpStatus.BAD_REQUEST);
+    }
+
+    // Explicit content type, since the subscription endpoints only produce text/event-stream
+    @ExceptionHandler(TooManySubscribersException.class)
+    public ResponseEntity<ErrorResponse> tooManySubscribersExceptionHandler(TooManySubscribersException exception) {
+        log.info(exception.getMessage());
+
+        ErrorResponse errorResponse = ErrorResponse.builder()
+                .timestamp(LocalDateTime.now())
+                .status(HttpStatus.SERVICE_UNAVAILABLE.value())
+                .message(exception.getMessage())
+                .build();
+
+        return ResponseEntity.status(HttpStatus.SERVICE_UNAVAILABLE)
+                .header(HttpHeaders.RETRY_AFTER, "5")
+                .contentType(MediaType.APPLICATION_JSON)
+                .body(errorResponse);
+    }
 }
@@ -0,0 +1,27 @@
+package ru.tcai.taskservice.controller;
+
+import lombok.RequiredArgsConstructor;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.http.MediaType;
+import org.springframework.web.bind.annotation.*;
+import org.springframework.web.servlet.mvc.method.annotation.SseEmitter;
+import ru.tcai.taskservice.events.TaskEventHub;
+
+@RestController
+@RequestMapping("/tasks/events")
+@RequiredArgsConstructor
+@ConditionalOnProperty(prefix = "task-service.events", name = "enabled", havingValue = "true")
+public class TaskEventController {
+
+    private final TaskEventHub taskEventHub;
+
+    @GetMapping(value = "/group/{groupId}", produces = MediaType.TEXT_EVENT_STREAM_VALUE)
+    public SseEmitter subscribeToGroup(@PathVariable Long groupId) {
+        return taskEventHub.subscribeToGroup(groupId);
+    }
+
+    @GetMapping(value = "/user/{userId}", produces = MediaType.TEXT_EVENT_STREAM_VALUE)
+    public SseEmitter subscribeToUser(@PathVariable Long userId) {
+        return taskEventHub.subscribeToUser(userId);
+    }
+}
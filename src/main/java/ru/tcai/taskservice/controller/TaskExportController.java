@@ -0,0 +1,47 @@
+package ru.tcai.taskservice.controller;
+
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ContentDisposition;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.MediaType;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.*;
+import org.springframework.web.servlet.mvc.method.annotation.StreamingResponseBody;
+import ru.tcai.taskservice.dto.request.ExportFormat;
+import ru.tcai.taskservice.service.TaskExportService;
+
+@RestController
+@RequestMapping("/tasks/export")
+@RequiredArgsConstructor
+public class TaskExportController {
+
+    private static final MediaType TEXT_CSV = MediaType.parseMediaType("text/csv");
+
+    private final TaskExportService taskExportService;
+
+    @GetMapping("/group/{groupId}")
+    public ResponseEntity<StreamingResponseBody> exportGroup(@PathVariable Long groupId,
+                                                             @RequestParam(defaultValue = "NDJSON") ExportFormat format,
+                                                             @RequestParam(defaultValue = "false") boolean comments) {
+        StreamingResponseBody body = outputStream ->
+                taskExportService.exportGroup(groupId, format, comments, outputStream);
+        return export("group-" + groupId, format, body);
+    }
+
+    @GetMapping("/user/{userId}")
+    public ResponseEntity<StreamingResponseBody> exportUser(@PathVariable Long userId,
+                                                            @RequestParam(defaultValue = "NDJSON") ExportFormat format,
+                                                            @RequestParam(defaultValue = "false") boolean comments) {
+        StreamingResponseBody body = outputStream ->
+                taskExportService.exportUser(userId, format, comments, outputStream);
+        return export("user-" + userId, format, body);
+    }
+
+    private ResponseEntity<StreamingResponseBody> export(String name, ExportFormat format, StreamingResponseBody body) {
+        String fileName = name + (format == ExportFormat.CSV ? ".csv" : ".ndjson");
+        return ResponseEntity.ok()
+                .contentType(format == ExportFormat.CSV ? TEXT_CSV : MediaType.APPLICATION_NDJSON)
+                .header(HttpHeaders.CONTENT_DISPOSITION, ContentDisposition.attachment().filename(fileName).build().toString())
+                .body(body);
+    }
+}
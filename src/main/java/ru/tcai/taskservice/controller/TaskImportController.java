@@ -0,0 +1,48 @@
+package ru.tcai.taskservice.controller;
+
+import com.fasterxml.jackson.core.JsonGenerator;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
+import org.springframework.web.bind.annotation.*;
+import ru.tcai.taskservice.dto.request.ImportFormat;
+import ru.tcai.taskservice.dto.request.ImportType;
+import ru.tcai.taskservice.service.TaskImportService;
+
+import java.io.IOException;
+import java.io.UncheckedIOException;
+
+@RestController
+@RequestMapping("/tasks/import")
+@RequiredArgsConstructor
+public class TaskImportController {
+
+    private final TaskImportService taskImportService;
+    private final ObjectMapper objectMapper;
+
+    @PostMapping
+    public void importRecords(@RequestParam(defaultValue = "TASK") ImportType type,
+                              @RequestParam(defaultValue = "NDJSON") ImportFormat format,
+                              HttpServletRequest request,
+                              HttpServletResponse response) throws IOException {
+        response.setStatus(HttpStatus.OK.value());
+        response.setContentType(MediaType.APPLICATION_NDJSON_VALUE);
+
+        // The body is read while events are written, so a slow client also slows the import down
+        try (JsonGenerator generator = objectMapper.getFactory().createGenerator(response.getOutputStream())) {
+            generator.setRootValueSeparator(null);
+            taskImportService.importRecords(request.getInputStream(), type, format, event -> {
+                try {
+                    generator.writeObject(event);
+                    generator.writeRaw('\n');
+                    generator.flush();
+                } catch (IOException e) {
+                    throw new UncheckedIOException(e);
+                }
+            });
+        }
+    }
+}
@@ -0,0 +1,35 @@
+package ru.tcai.taskservice.controller;
+
+import lombok.RequiredArgsConstructor;
+import org.springframework.http.ResponseEntity;
+import org.springframework.web.bind.annotation.*;
+import ru.tcai.taskservice.dto.response.TaskStatsResponse;
+import ru.tcai.taskservice.service.TaskStatsService;
+
+import java.util.Map;
+
+@RestController
+@RequestMapping("/tasks/stats")
+@RequiredArgsConstructor
+public class TaskStatsController {
+
+    private final TaskStatsService taskStatsService;
+
+    @GetMapping("/group/{groupId}")
+    public ResponseEntity<TaskStatsResponse> getGroupStats(@PathVariable Long groupId) {
+        TaskStatsResponse response = taskStatsService.getGroupStats(groupId);
+        return ResponseEntity.ok(response);
+    }
+
+    @GetMapping("/user/{userId}")
+    public ResponseEntity<TaskStatsResponse> getUserStats(@PathVariable Long userId) {
+        TaskStatsResponse response = taskStatsService.getUserStats(userId);
+        return ResponseEntity.ok(response);
+    }
+
+    @PostMapping("/rebuild")
+    public ResponseEntity<Map<String, Long>> rebuild() {
+        long rows = taskStatsService.rebuild();
+        return ResponseEntity.ok(Map.of("rows", rows));
+    }
+}
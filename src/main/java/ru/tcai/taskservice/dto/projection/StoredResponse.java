@@ -0,0 +1,17 @@
+package ru.tcai.taskservice.dto.projection;
+
+import lombok.Value;
+
+/**
+ * What is kept of a request made with an idempotency key. A null status
+ * code means it is still in flight, a null body that the response was too
+ * large to keep.
+ */
+@Value
+public class StoredResponse {
+    byte[] fingerprint;
+    Integer statusCode;
+    String contentType;
+    byte[] body;
+    boolean compressed;
+}
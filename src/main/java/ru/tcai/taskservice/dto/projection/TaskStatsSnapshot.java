@@ -0,0 +1,15 @@
+package ru.tcai.taskservice.dto.projection;
+
+import lombok.Value;
+
+/**
+ * The fields of a task that the dashboard counters depend on.
+ */
+@Value
+public class TaskStatsSnapshot {
+    Long authorId;
+    Long groupId;
+    String status;
+    String priority;
+    String deadline;
+}
@@ -0,0 +1,31 @@
+package ru.tcai.taskservice.dto.projection;
+
+import lombok.Value;
+
+import java.time.LocalDateTime;
+
+@Value
+public class TaskView {
+    Long id;
+    String title;
+    String description;
+    Long taskType;
+    Long authorId;
+    Long groupId;
+    Long doerId;
+    String status;
+    String priority;
+    LocalDateTime createdAt;
+    Integer commentCount;
+    LocalDateTime lastCommentAt;
+    Integer subtasksTotal;
+    Integer subtasksDone;
+    Long locationPointId;
+    Double latitude;
+    Double longitude;
+    String locationName;
+    Boolean remindByLocation;
+    Long reminderId;
+    String deadlineTime;
+    Boolean remindByTime;
+}
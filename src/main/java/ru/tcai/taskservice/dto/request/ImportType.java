@@ -0,0 +1,6 @@
+package ru.tcai.taskservice.dto.request;
+
+public enum ImportType {
+    TASK,
+    NOTE
+}
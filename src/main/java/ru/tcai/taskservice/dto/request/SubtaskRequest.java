@@ -0,0 +1,24 @@
+package ru.tcai.taskservice.dto.request;
+
+import jakarta.validation.constraints.NotBlank;
+import jakarta.validation.constraints.NotNull;
+import jakarta.validation.constraints.Pattern;
+import jakarta.validation.constraints.Size;
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class SubtaskRequest {
+    @NotNull
+    @NotBlank
+    @Size(min = 1, max = 255)
+    private String text;
+
+    @Pattern(regexp = "UNDONE|DONE", message = "status must be DONE or UNDONE")
+    private String status;
+}
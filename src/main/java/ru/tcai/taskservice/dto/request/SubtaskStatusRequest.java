@@ -0,0 +1,18 @@
+package ru.tcai.taskservice.dto.request;
+
+import jakarta.validation.constraints.NotNull;
+import jakarta.validation.constraints.Pattern;
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class SubtaskStatusRequest {
+    @NotNull
+    @Pattern(regexp = "UNDONE|DONE", message = "status must be DONE or UNDONE")
+    private String status;
+}
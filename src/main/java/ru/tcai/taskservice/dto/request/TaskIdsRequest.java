@@ -0,0 +1,18 @@
+package ru.tcai.taskservice.dto.request;
+
+import jakarta.validation.constraints.NotNull;
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import java.util.List;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class TaskIdsRequest {
+    @NotNull(message = "Ids are required")
+    private List<Long> ids;
+}
@@ -0,0 +1,21 @@
+package ru.tcai.taskservice.dto.response;
+
+import com.fasterxml.jackson.annotation.JsonInclude;
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+@JsonInclude(JsonInclude.Include.NON_NULL)
+public class ImportEventResponse {
+    private String event;
+    private Long line;
+    private String message;
+    private Long processed;
+    private Long imported;
+    private Long failed;
+}
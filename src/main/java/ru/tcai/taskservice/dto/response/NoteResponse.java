@@ -20,4 +20,6 @@ public class NoteResponse {
     private Long authorId;
     private Long groupId;
     private LocalDateTime createdAt;
+    private Integer commentCount;
+    private LocalDateTime lastCommentAt;
 }
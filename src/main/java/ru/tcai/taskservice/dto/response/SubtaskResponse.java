@@ -0,0 +1,20 @@
+package ru.tcai.taskservice.dto.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import java.time.LocalDateTime;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class SubtaskResponse {
+    private Long id;
+    private Long taskId;
+    private String text;
+    private String status;
+    private LocalDateTime createdAt;
+}
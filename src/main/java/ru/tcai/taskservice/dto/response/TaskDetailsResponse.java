@@ -26,4 +26,7 @@ public class TaskDetailsResponse {
     private String priority;
     private LocalDateTime createdAt;
     private List<CommentResponse> comments;
+    private Integer subtasksTotal;
+    private Integer subtasksDone;
+    private List<SubtaskResponse> subtasks;
 }
@@ -0,0 +1,20 @@
+package ru.tcai.taskservice.dto.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class TaskEventResponse {
+    private String type;
+    private Long taskId;
+    private Long taskType;
+    private Long groupId;
+    private Long previousGroupId;
+    private Long authorId;
+    private Long doerId;
+}
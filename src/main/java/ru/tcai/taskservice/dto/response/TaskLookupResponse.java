@@ -0,0 +1,21 @@
+package ru.tcai.taskservice.dto.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+/**
+ * One entry of a multi-get, in request order. {@code task} is set for tasks,
+ * {@code note} for notes and neither when {@code found} is false.
+ */
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class TaskLookupResponse {
+    private Long id;
+    private Boolean found;
+    private TaskResponse task;
+    private NoteResponse note;
+}
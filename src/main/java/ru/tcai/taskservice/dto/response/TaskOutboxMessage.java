@@ -0,0 +1,18 @@
+package ru.tcai.taskservice.dto.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import java.time.LocalDateTime;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class TaskOutboxMessage {
+    private Long id;
+    private LocalDateTime occurredAt;
+    private TaskEventResponse event;
+}
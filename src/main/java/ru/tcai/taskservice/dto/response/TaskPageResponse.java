@@ -0,0 +1,19 @@
+package ru.tcai.taskservice.dto.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import java.util.List;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class TaskPageResponse {
+    private List<TaskResponse> items;
+    private Integer page;
+    private Integer size;
+    private Boolean hasMore;
+}
@@ -26,4 +26,8 @@ public class TaskResponse {
     private LocalDateTime createdAt;
     private String priority;
     private String status;
+    private Integer commentCount;
+    private LocalDateTime lastCommentAt;
+    private Integer subtasksTotal;
+    private Integer subtasksDone;
 }
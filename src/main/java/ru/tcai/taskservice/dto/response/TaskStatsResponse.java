@@ -0,0 +1,21 @@
+package ru.tcai.taskservice.dto.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import java.util.Map;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class TaskStatsResponse {
+    private String scopeType;
+    private Long scopeId;
+    private Long total;
+    private Map<String, Long> byStatus;
+    private Map<String, Long> byPriority;
+    private Long overdue;
+}
@@ -6,6 +6,8 @@ import lombok.Builder;
 import lombok.Data;
 import lombok.NoArgsConstructor;
 
+import java.time.LocalDateTime;
+
 @Entity
 @Embeddable
 @Data
@@ -24,4 +26,8 @@ public class Reminder {
 
     @Column(name = "remindByTime")
     private Boolean remindByTime;
+
+    // time parsed like TaskStatsServiceImpl.parseDeadline, for ordering in SQL
+    @Column(name = "deadline_at")
+    private LocalDateTime deadlineAt;
 }
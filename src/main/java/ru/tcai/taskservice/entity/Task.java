@@ -5,6 +5,7 @@ import lombok.AllArgsConstructor;
 import lombok.Builder;
 import lombok.Data;
 import lombok.NoArgsConstructor;
+import org.hibernate.annotations.DynamicUpdate;
 
 import java.time.LocalDateTime;
 
@@ -14,6 +15,7 @@ import java.time.LocalDateTime;
 @Builder
 @NoArgsConstructor
 @AllArgsConstructor
+@DynamicUpdate
 @Table(name = "task")
 public class Task {
     @Id
@@ -56,4 +58,16 @@ public class Task {
 
     @Column(name = "priority")
     private String priority;
+
+    @Column(name = "comment_count")
+    private Integer commentCount;
+
+    @Column(name = "last_comment_at")
+    private LocalDateTime lastCommentAt;
+
+    @Column(name = "subtasks_total")
+    private Integer subtasksTotal;
+
+    @Column(name = "subtasks_done")
+    private Integer subtasksDone;
 }
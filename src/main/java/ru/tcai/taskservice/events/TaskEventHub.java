@@ -0,0 +1,226 @@
+package ru.tcai.taskservice.events;
+
+import io.micrometer.core.instrument.Counter;
+import io.micrometer.core.instrument.Gauge;
+import io.micrometer.core.instrument.MeterRegistry;
+import jakarta.annotation.PreDestroy;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.http.MediaType;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import org.springframework.web.servlet.mvc.method.annotation.SseEmitter;
+import ru.tcai.taskservice.config.EventsProperties;
+import ru.tcai.taskservice.dto.response.TaskEventResponse;
+import ru.tcai.taskservice.exception.TooManySubscribersException;
+
+import java.io.IOException;
+import java.util.LinkedHashSet;
+import java.util.Set;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.ThreadPoolExecutor;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.concurrent.atomic.AtomicInteger;
+
+/**
+ * Open SSE subscriptions of this instance, keyed by group or user. An idle
+ * subscription is only its emitter and the parked async request, no thread.
+ * Every subscription has a bounded queue of pending events that a small pool
+ * of writer threads drains, one drain per subscription at a time, so each
+ * subscriber gets events in notification order. A subscriber whose queue
+ * fills up is too slow to keep up and is dropped, and a client blocking its
+ * writer only holds up its own events.
+ */
+@Slf4j
+@Component
+@ConditionalOnProperty(prefix = "task-service.events", name = "enabled", havingValue = "true")
+public class TaskEventHub {
+
+    private static final String GROUP_SCOPE = "group:";
+    private static final String USER_SCOPE = "user:";
+
+    // Queued like an event, sent as an SSE comment
+    private static final TaskEventResponse HEARTBEAT = new TaskEventResponse();
+
+    private final EventsProperties properties;
+    private final ConcurrentHashMap<String, Set<Subscription>> subscribers = new ConcurrentHashMap<>();
+    private final AtomicInteger subscriberCount = new AtomicInteger();
+    private final ThreadPoolExecutor writers;
+    private final Counter delivered;
+    private final Counter dropped;
+
+    public TaskEventHub(EventsProperties properties, MeterRegistry meterRegistry) {
+        this.properties = properties;
+        AtomicInteger writerNumber = new AtomicInteger();
+        // A subscription is queued at most once, so this queue never holds more than the subscriber limit
+        this.writers = new ThreadPoolExecutor(properties.getWriterThreads(), properties.getWriterThreads(),
+                0, TimeUnit.MILLISECONDS, new ArrayBlockingQueue<>(properties.getMaxSubscribers()), runnable -> {
+            Thread thread = new Thread(runnable, "task-event-writer-" + writerNumber.incrementAndGet());
+            thread.setDaemon(true);
+            return thread;
+        });
+        this.delivered = meterRegistry.counter("events.delivered");
+        this.dropped = meterRegistry.counter("events.dropped");
+        Gauge.builder("events.subscribers", subscriberCount, AtomicInteger::get).register(meterRegistry);
+    }
+
+    public SseEmitter subscribeToGroup(Long groupId) {
+        return subscribe(GROUP_SCOPE + groupId);
+    }
+
+    public SseEmitter subscribeToUser(Long userId) {
+        return subscribe(USER_SCOPE + userId);
+    }
+
+    public void dispatch(TaskEventResponse event) {
+        Set<String> scopes = new LinkedHashSet<>();
+        if (event.getGroupId() != null) {
+            scopes.add(GROUP_SCOPE + event.getGroupId());
+        }
+        if (event.getPreviousGroupId() != null) {
+            scopes.add(GROUP_SCOPE + event.getPreviousGroupId());
+        }
+        if (event.getAuthorId() != null) {
+            scopes.add(USER_SCOPE + event.getAuthorId());
+        }
+        if (event.getDoerId() != null) {
+            scopes.add(USER_SCOPE + event.getDoerId());
+        }
+
+        // A subscriber of both the task's group and its author still gets the event once
+        Set<Subscription> recipients = new LinkedHashSet<>();
+        for (String scope : scopes) {
+            Set<Subscription> subscriptions = subscribers.get(scope);
+            if (subscriptions != null) {
+                recipients.addAll(subscriptions);
+            }
+        }
+        recipients.forEach(subscription -> subscription.offer(event));
+    }
+
+    @Scheduled(fixedDelayString = "${task-service.events.heartbeat-interval-ms:15000}")
+    public void heartbeat() {
+        // Also how subscriptions whose client went away are noticed and released
+        subscribers.values().forEach(subscriptions ->
+                subscriptions.forEach(subscription -> subscription.offer(HEARTBEAT)));
+    }
+
+    @PreDestroy
+    public void close() {
+        writers.shutdownNow();
+        subscribers.values().forEach(subscriptions ->
+                subscriptions.forEach(subscription -> subscription.emitter.complete()));
+    }
+
+    private SseEmitter subscribe(String scope) {
+        if (subscriberCount.incrementAndGet() > properties.getMaxSubscribers()) {
+            subscriberCount.decrementAndGet();
+            throw new TooManySubscribersException("Too many event subscriptions, retry later");
+        }
+
+        SseEmitter emitter = new SseEmitter(properties.getSubscriptionTimeout().toMillis());
+        Subscription subscription = new Subscription(emitter, properties.getSubscriberQueueSize());
+        // Added and removed under the map's lock for the scope, so an emptied set is never reused
+        subscribers.compute(scope, (key, subscriptions) -> {
+            Set<Subscription> current = subscriptions != null ? subscriptions : ConcurrentHashMap.newKeySet();
+            current.add(subscription);
+            return current;
+        });
+
+        Runnable unsubscribe = () -> {
+            subscription.closed = true;
+            subscribers.computeIfPresent(scope, (key, subscriptions) -> {
+                if (subscriptions.remove(subscription)) {
+                    subscriberCount.decrementAndGet();
+                }
+                return subscriptions.isEmpty() ? null : subscriptions;
+            });
+        };
+        emitter.onCompletion(unsubscribe);
+        emitter.onTimeout(unsubscribe);
+        emitter.onError(error -> unsubscribe.run());
+
+        // Commits the response headers so the client knows the subscription is live
+        try {
+            emitter.send(SseEmitter.event().comment("subscribed " + scope));
+        } catch (IOException e) {
+            emitter.completeWithError(e);
+        }
+        return emitter;
+    }
+
+    private void drop(Subscription subscription, Exception cause) {
+        subscription.closed = true;
+        subscription.pending.clear();
+        dropped.increment();
+        log.debug("Dropping event subscription: {}", cause.getMessage());
+        subscription.emitter.completeWithError(cause);
+    }
+
+    private final class Subscription implements Runnable {
+
+        private final SseEmitter emitter;
+        private final BlockingQueue<TaskEventResponse> pending;
+        private final AtomicBoolean scheduled = new AtomicBoolean();
+        private volatile boolean closed;
+
+        private Subscription(SseEmitter emitter, int queueSize) {
+            this.emitter = emitter;
+            this.pending = new ArrayBlockingQueue<>(queueSize);
+        }
+
+        void offer(TaskEventResponse event) {
+            if (closed) {
+                return;
+            }
+            if (!pending.offer(event)) {
+                drop(this, new IllegalStateException("Subscriber fell " + pending.size() + " events behind"));
+                return;
+            }
+            schedule();
+        }
+
+        @Override
+        public void run() {
+            try {
+                TaskEventResponse event;
+                while (!closed && (event = pending.poll()) != null) {
+                    send(event);
+                }
+            } finally {
+                scheduled.set(false);
+            }
+            // An event offered while the flag was still set would otherwise wait for the next one
+            if (!pending.isEmpty()) {
+                schedule();
+            }
+        }
+
+        private void schedule() {
+            if (!closed && scheduled.compareAndSet(false, true)) {
+                try {
+                    writers.execute(this);
+                } catch (RejectedExecutionException e) {
+                    scheduled.set(false);
+                }
+            }
+        }
+
+        private void send(TaskEventResponse event) {
+            try {
+                if (event == HEARTBEAT) {
+                    emitter.send(SseEmitter.event().comment("heartbeat"));
+                } else {
+                    emitter.send(SseEmitter.event().name(event.getType()).data(event, MediaType.APPLICATION_JSON));
+                    delivered.increment();
+                }
+            } catch (IOException | IllegalStateException e) {
+                drop(this, e);
+            }
+        }
+    }
+}
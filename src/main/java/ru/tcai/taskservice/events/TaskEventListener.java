@@ -0,0 +1,111 @@
+package ru.tcai.taskservice.events;
+
+import com.fasterxml.jackson.core.JsonProcessingException;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import jakarta.annotation.PostConstruct;
+import jakarta.annotation.PreDestroy;
+import lombok.extern.slf4j.Slf4j;
+import org.postgresql.PGConnection;
+import org.postgresql.PGNotification;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.boot.autoconfigure.jdbc.DataSourceProperties;
+import org.springframework.stereotype.Component;
+import ru.tcai.taskservice.config.EventsProperties;
+import ru.tcai.taskservice.dto.response.TaskEventResponse;
+
+import java.sql.Connection;
+import java.sql.DriverManager;
+import java.sql.SQLException;
+import java.sql.Statement;
+import java.util.regex.Pattern;
+
+/**
+ * Listens on the events channel over a connection of its own, outside the
+ * pool, since a LISTEN session has to stay open for as long as the instance
+ * runs. Notifications are handed to the {@link TaskEventHub}; if the
+ * connection drops, it reconnects after {@code reconnect-delay}. Events
+ * committed while disconnected are lost, clients refetch on reconnect.
+ */
+@Slf4j
+@Component
+@ConditionalOnProperty(prefix = "task-service.events", name = "enabled", havingValue = "true")
+public class TaskEventListener {
+
+    private static final Pattern CHANNEL = Pattern.compile("[a-z_][a-z0-9_]*");
+
+    private final TaskEventHub hub;
+    private final ObjectMapper objectMapper;
+    private final DataSourceProperties dataSourceProperties;
+    private final EventsProperties properties;
+    private volatile boolean running;
+    private Thread thread;
+
+    public TaskEventListener(TaskEventHub hub,
+                             ObjectMapper objectMapper,
+                             DataSourceProperties dataSourceProperties,
+                             EventsProperties properties) {
+        if (!CHANNEL.matcher(properties.getChannel()).matches()) {
+            throw new IllegalArgumentException("Invalid events channel: " + properties.getChannel());
+        }
+        this.hub = hub;
+        this.objectMapper = objectMapper;
+        this.dataSourceProperties = dataSourceProperties;
+        this.properties = properties;
+    }
+
+    @PostConstruct
+    public void start() {
+        running = true;
+        thread = new Thread(this::run, "task-event-listener");
+        thread.setDaemon(true);
+        thread.start();
+    }
+
+    @PreDestroy
+    public void stop() throws InterruptedException {
+        running = false;
+        thread.join(properties.getPollTimeout().toMillis() * 2);
+    }
+
+    private void run() {
+        while (running) {
+            try (Connection connection = DriverManager.getConnection(dataSourceProperties.determineUrl(),
+                    dataSourceProperties.determineUsername(), dataSourceProperties.determinePassword())) {
+                try (Statement statement = connection.createStatement()) {
+                    statement.execute("LISTEN " + properties.getChannel());
+                }
+                log.info("Listening for task events on channel {}", properties.getChannel());
+                PGConnection pgConnection = connection.unwrap(PGConnection.class);
+                int timeout = (int) properties.getPollTimeout().toMillis();
+                while (running) {
+                    PGNotification[] notifications = pgConnection.getNotifications(timeout);
+                    if (notifications == null) {
+                        continue;
+                    }
+                    for (PGNotification notification : notifications) {
+                        dispatch(notification.getParameter());
+                    }
+                }
+            } catch (SQLException e) {
+                if (!running) {
+                    return;
+                }
+                log.warn("Task event listener lost its connection, reconnecting in {}", properties.getReconnectDelay(), e);
+                try {
+                    Thread.sleep(properties.getReconnectDelay().toMillis());
+                } catch (InterruptedException interrupted) {
+                    Thread.currentThread().interrupt();
+                    return;
+                }
+            }
+        }
+    }
+
+    private void dispatch(String payload) {
+        try {
+            hub.dispatch(objectMapper.readValue(payload, TaskEventResponse.class));
+        } catch (JsonProcessingException e) {
+            log.warn("Ignoring malformed task event: {}", payload);
+        }
+    }
+}
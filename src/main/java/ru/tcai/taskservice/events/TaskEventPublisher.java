@@ -0,0 +1,90 @@
+package ru.tcai.taskservice.events;
+
+import com.fasterxml.jackson.core.JsonProcessingException;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import lombok.RequiredArgsConstructor;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.stereotype.Component;
+import ru.tcai.taskservice.config.EventsProperties;
+import ru.tcai.taskservice.config.OutboxProperties;
+import ru.tcai.taskservice.dto.response.TaskEventResponse;
+import ru.tcai.taskservice.entity.Task;
+import ru.tcai.taskservice.repository.TaskOutboxRepository;
+
+import java.util.List;
+import java.util.Objects;
+
+/**
+ * Records a task change on the caller's connection, so that it commits or
+ * rolls back with the change itself: as a {@code pg_notify} for live
+ * subscribers on every instance, and as a row in the outbox that
+ * {@link ru.tcai.taskservice.job.OutboxRelay} delivers downstream.
+ * Callers passing a {@link Task} must have read it with
+ * {@code TaskRepository.findByIdForUpdate} (or created it): the outbox row is
+ * inserted before Hibernate flushes the change, and the row lock held until
+ * commit keeps the changes of one task in commit order. Comment events are
+ * appended without the lock; they only carry the task's routing columns.
+ */
+@Component
+@RequiredArgsConstructor
+public class TaskEventPublisher {
+
+    private static final String NOTIFY = "SELECT pg_notify(?, ?)";
+
+    // For writes that never load the task: the scopes are read from the row in the same statement
+    private static final String NOTIFY_FROM_ROW = "SELECT pg_notify(?, json_build_object(" +
+            "'type', ?, 'taskId', id, 'taskType', task_type, 'groupId', group_id, " +
+            "'authorId', author, 'doerId', doer)::text) FROM task WHERE id = ?";
+
+    private final JdbcTemplate jdbcTemplate;
+    private final ObjectMapper objectMapper;
+    private final TaskOutboxRepository taskOutboxRepository;
+    private final EventsProperties eventsProperties;
+    private final OutboxProperties outboxProperties;
+
+    public void publish(TaskEventType type, Task task) {
+        publish(type, task, task.getGroupId());
+    }
+
+    public void publish(TaskEventType type, Task task, Long previousGroupId) {
+        TaskEventResponse event = TaskEventResponse.builder()
+                .type(type.name())
+                .taskId(task.getId())
+                .taskType(task.getTaskType())
+                .groupId(task.getGroupId())
+                .previousGroupId(Objects.equals(previousGroupId, task.getGroupId()) ? null : previousGroupId)
+                .authorId(task.getAuthorId())
+                .doerId(task.getDoerId())
+                .build();
+
+        if (outboxProperties.isEnabled()) {
+            taskOutboxRepository.append(event);
+        }
+        if (eventsProperties.isEnabled()) {
+            try {
+                jdbcTemplate.queryForList(NOTIFY, eventsProperties.getChannel(), objectMapper.writeValueAsString(event));
+            } catch (JsonProcessingException e) {
+                throw new IllegalStateException("Failed to serialize task event", e);
+            }
+        }
+    }
+
+    /**
+     * Bulk imports only go to the outbox; a notification per imported row
+     * would flood every subscriber, who refetch after an import anyway.
+     */
+    public void publishImported(List<TaskEventResponse> events) {
+        if (outboxProperties.isEnabled() && !events.isEmpty()) {
+            taskOutboxRepository.appendAll(events);
+        }
+    }
+
+    public void publish(TaskEventType type, Long taskId) {
+        if (outboxProperties.isEnabled()) {
+            taskOutboxRepository.appendFromRow(type.name(), taskId);
+        }
+        if (eventsProperties.isEnabled()) {
+            jdbcTemplate.queryForList(NOTIFY_FROM_ROW, eventsProperties.getChannel(), type.name(), taskId);
+        }
+    }
+}
@@ -0,0 +1,8 @@
+package ru.tcai.taskservice.events;
+
+public enum TaskEventType {
+    CREATED,
+    UPDATED,
+    DELETED,
+    COMMENTED
+}
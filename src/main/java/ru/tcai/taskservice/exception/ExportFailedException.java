@@ -0,0 +1,7 @@
+package ru.tcai.taskservice.exception;
+
+public class ExportFailedException extends RuntimeException {
+    public ExportFailedException(String message, Throwable cause) {
+        super(message, cause);
+    }
+}
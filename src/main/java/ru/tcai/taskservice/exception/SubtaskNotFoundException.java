@@ -0,0 +1,7 @@
+package ru.tcai.taskservice.exception;
+
+public class SubtaskNotFoundException extends RuntimeException {
+    public SubtaskNotFoundException(String message) {
+        super(message);
+    }
+}
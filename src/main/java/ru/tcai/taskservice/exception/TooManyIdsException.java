@@ -0,0 +1,7 @@
+package ru.tcai.taskservice.exception;
+
+public class TooManyIdsException extends RuntimeException {
+    public TooManyIdsException(String message) {
+        super(message);
+    }
+}
@@ -0,0 +1,7 @@
+package ru.tcai.taskservice.exception;
+
+public class TooManySubscribersException extends RuntimeException {
+    public TooManySubscribersException(String message) {
+        super(message);
+    }
+}
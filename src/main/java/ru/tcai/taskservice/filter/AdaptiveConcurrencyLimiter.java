@@ -0,0 +1,85 @@
+package ru.tcai.taskservice.filter;
+
+import ru.tcai.taskservice.config.AdmissionProperties;
+
+import java.util.concurrent.atomic.AtomicInteger;
+
+/**
+ * AIMD limit on requests in flight. Latency of completed requests, which on
+ * this service is mostly time spent waiting on and inside the database, is
+ * compared against a baseline of recent best latency: while it stays within
+ * {@code latencyTolerance} of the baseline the limit grows by one per
+ * adjustment interval, once it exceeds it the limit is multiplied by
+ * {@code backoffRatio}.
+ */
+class AdaptiveConcurrencyLimiter {
+
+    private static final double SMOOTHING = 0.1;
+    // Lets the baseline rise again after the database got permanently slower, e.g. after a failover
+    private static final double BASELINE_DRIFT = 1.001;
+
+    private final AdmissionProperties.Concurrency properties;
+    private final long adjustIntervalNanos;
+    private final AtomicInteger inFlight = new AtomicInteger();
+    private volatile int limit;
+
+    private double smoothedNanos;
+    private double baselineNanos;
+    private boolean utilized;
+    private long adjustedAt;
+
+    AdaptiveConcurrencyLimiter(AdmissionProperties.Concurrency properties) {
+        this.properties = properties;
+        this.adjustIntervalNanos = properties.getAdjustInterval().toNanos();
+        this.limit = properties.getInitialLimit();
+        this.adjustedAt = System.nanoTime();
+    }
+
+    boolean tryAcquire() {
+        while (true) {
+            int current = inFlight.get();
+            if (current >= limit) {
+                return false;
+            }
+            if (inFlight.compareAndSet(current, current + 1)) {
+                return true;
+            }
+        }
+    }
+
+    void release() {
+        inFlight.decrementAndGet();
+    }
+
+    void release(long latencyNanos, long now) {
+        int current = inFlight.getAndDecrement();
+        update(latencyNanos, current, now);
+    }
+
+    int getLimit() {
+        return limit;
+    }
+
+    int getInFlight() {
+        return inFlight.get();
+    }
+
+    private synchronized void update(long latencyNanos, int inFlightAtCompletion, long now) {
+        smoothedNanos = smoothedNanos == 0 ? latencyNanos : smoothedNanos + SMOOTHING * (latencyNanos - smoothedNanos);
+        baselineNanos = baselineNanos == 0 ? latencyNanos : Math.min(latencyNanos, baselineNanos * BASELINE_DRIFT);
+        // Only grow a limit that is actually being used, otherwise it drifts up to the maximum while idle
+        utilized |= inFlightAtCompletion * 2 >= limit;
+
+        if (now - adjustedAt < adjustIntervalNanos) {
+            return;
+        }
+        adjustedAt = now;
+
+        if (smoothedNanos > baselineNanos * properties.getLatencyTolerance()) {
+            limit = Math.max(properties.getMinLimit(), (int) (limit * properties.getBackoffRatio()));
+        } else if (utilized) {
+            limit = Math.min(properties.getMaxLimit(), limit + 1);
+        }
+        utilized = false;
+    }
+}
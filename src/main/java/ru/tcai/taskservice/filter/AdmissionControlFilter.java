@@ -0,0 +1,155 @@
+package ru.tcai.taskservice.filter;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import io.micrometer.core.instrument.Gauge;
+import io.micrometer.core.instrument.MeterRegistry;
+import jakarta.servlet.FilterChain;
+import jakarta.servlet.ServletException;
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.core.Ordered;
+import org.springframework.core.annotation.Order;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
+import org.springframework.stereotype.Component;
+import org.springframework.web.filter.OncePerRequestFilter;
+import ru.tcai.taskservice.config.AdmissionProperties;
+import ru.tcai.taskservice.dto.response.ErrorResponse;
+
+import java.io.IOException;
+import java.time.LocalDateTime;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.TimeUnit;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
+
+/**
+ * Sheds excess load on {@code /tasks} before it reaches the connection pool.
+ * Requests attributable to a user (a user id in the path, otherwise the
+ * {@code X-User-Id} header) first go through a per-user token bucket (429 when empty),
+ * then every request through a global one and the adaptive concurrency limit
+ * (503 when exhausted). Rejections carry {@code Retry-After} and are answered
+ * immediately instead of queueing for a connection.
+ */
+@Component
+@Order(Ordered.HIGHEST_PRECEDENCE + 5)
+@ConditionalOnProperty(prefix = "task-service.admission", name = "enabled", havingValue = "true")
+public class AdmissionControlFilter extends OncePerRequestFilter {
+
+    static final String USER_ID_HEADER = "X-User-Id";
+    static final String LIMIT_HEADER = "X-RateLimit-Limit";
+    static final String REMAINING_HEADER = "X-RateLimit-Remaining";
+
+    private static final Pattern USER_PATH = Pattern.compile("^/tasks/(?:note/|export/|stats/|events/)?(?:personal|user|doer|inbox)/(\\d+)");
+
+    private final AdmissionProperties properties;
+    private final ObjectMapper objectMapper;
+    private final MeterRegistry meterRegistry;
+    private final ConcurrentHashMap<String, TokenBucket> userBuckets = new ConcurrentHashMap<>();
+    private final TokenBucket globalBucket;
+    private final AdaptiveConcurrencyLimiter concurrencyLimiter;
+
+    public AdmissionControlFilter(AdmissionProperties properties, ObjectMapper objectMapper, MeterRegistry meterRegistry) {
+        this.properties = properties;
+        this.objectMapper = objectMapper;
+        this.meterRegistry = meterRegistry;
+        this.globalBucket = new TokenBucket(properties.getGlobal(), System.nanoTime());
+        this.concurrencyLimiter = new AdaptiveConcurrencyLimiter(properties.getConcurrency());
+
+        Gauge.builder("admission.concurrency.limit", concurrencyLimiter, AdaptiveConcurrencyLimiter::getLimit)
+                .register(meterRegistry);
+        Gauge.builder("admission.concurrency.in_flight", concurrencyLimiter, AdaptiveConcurrencyLimiter::getInFlight)
+                .register(meterRegistry);
+    }
+
+    @Override
+    protected boolean shouldNotFilter(HttpServletRequest request) {
+        return !request.getRequestURI().startsWith("/tasks");
+    }
+
+    @Override
+    protected void doFilterInternal(HttpServletRequest request,
+                                    HttpServletResponse response,
+                                    FilterChain filterChain) throws ServletException, IOException {
+        long now = System.nanoTime();
+
+        String userId = userId(request);
+        if (userId != null) {
+            TokenBucket bucket = userBucket(userId, now);
+            response.setIntHeader(LIMIT_HEADER, properties.getUser().getBurst());
+            if (!bucket.tryAcquire(now)) {
+                response.setIntHeader(REMAINING_HEADER, 0);
+                reject(response, HttpStatus.TOO_MANY_REQUESTS, bucket.nanosUntilToken(now), "user_rate",
+                        "Too many requests for user " + userId);
+                return;
+            }
+            response.setIntHeader(REMAINING_HEADER, bucket.remaining(now));
+        }
+
+        if (!globalBucket.tryAcquire(now)) {
+            reject(response, HttpStatus.SERVICE_UNAVAILABLE, globalBucket.nanosUntilToken(now), "global_rate",
+                    "Service is over its request rate, retry later");
+            return;
+        }
+
+        if (properties.getUnlimitedConcurrencyPaths().stream().anyMatch(request.getRequestURI()::startsWith)) {
+            filterChain.doFilter(request, response);
+            return;
+        }
+
+        if (!concurrencyLimiter.tryAcquire()) {
+            reject(response, HttpStatus.SERVICE_UNAVAILABLE, TimeUnit.SECONDS.toNanos(1), "concurrency",
+                    "Service is overloaded, retry later");
+            return;
+        }
+
+        boolean completed = false;
+        try {
+            filterChain.doFilter(request, response);
+            completed = !request.isAsyncStarted();
+        } finally {
+            // Latency of streamed bodies and failed requests says nothing about database load
+            if (completed && response.getStatus() < 500) {
+                long finished = System.nanoTime();
+                concurrencyLimiter.release(finished - now, finished);
+            } else {
+                concurrencyLimiter.release();
+            }
+        }
+    }
+
+    // The path names whose data is read, so a changing header cannot move those requests to fresh buckets
+    private String userId(HttpServletRequest request) {
+        Matcher matcher = USER_PATH.matcher(request.getRequestURI());
+        if (matcher.find()) {
+            return matcher.group(1);
+        }
+        String header = request.getHeader(USER_ID_HEADER);
+        return header != null && !header.isBlank() ? header.trim() : null;
+    }
+
+    private TokenBucket userBucket(String userId, long now) {
+        if (userBuckets.size() >= properties.getMaxTrackedUsers()) {
+            // A full bucket behaves exactly like a fresh one, so idle users can be forgotten
+            userBuckets.values().removeIf(bucket -> bucket.isFull(now));
+        }
+        return userBuckets.computeIfAbsent(userId, key -> new TokenBucket(properties.getUser(), now));
+    }
+
+    private void reject(HttpServletResponse response, HttpStatus status, long retryAfterNanos, String reason,
+                        String message) throws IOException {
+        meterRegistry.counter("admission.rejected", "reason", reason).increment();
+
+        long retryAfterSeconds = Math.max(1, TimeUnit.NANOSECONDS.toSeconds(retryAfterNanos + 999_999_999L));
+        response.setStatus(status.value());
+        response.setHeader(HttpHeaders.RETRY_AFTER, Long.toString(retryAfterSeconds));
+        response.setContentType(MediaType.APPLICATION_JSON_VALUE);
+        objectMapper.writeValue(response.getOutputStream(), ErrorResponse.builder()
+                .timestamp(LocalDateTime.now())
+                .status(status.value())
+                .message(message)
+                .build());
+    }
+}
@@ -0,0 +1,52 @@
+package ru.tcai.taskservice.filter;
+
+import io.micrometer.core.instrument.DistributionSummary;
+import io.micrometer.core.instrument.MeterRegistry;
+import jakarta.servlet.FilterChain;
+import jakarta.servlet.ServletException;
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.stereotype.Component;
+import org.springframework.web.filter.OncePerRequestFilter;
+import org.springframework.web.servlet.HandlerMapping;
+
+import java.io.IOException;
+import java.lang.management.ManagementFactory;
+
+/**
+ * Records heap bytes allocated by the request thread per handler pattern as
+ * {@code http.server.requests.allocated}. Only allocations on the servlet
+ * thread are counted, so async response bodies are not included.
+ */
+@Component
+@ConditionalOnProperty(prefix = "task-service.metrics", name = "request-allocation", havingValue = "true")
+public class AllocationMetricsFilter extends OncePerRequestFilter {
+
+    private final MeterRegistry meterRegistry;
+    private final com.sun.management.ThreadMXBean threadMXBean;
+
+    public AllocationMetricsFilter(MeterRegistry meterRegistry) {
+        this.meterRegistry = meterRegistry;
+        this.threadMXBean = (com.sun.management.ThreadMXBean) ManagementFactory.getThreadMXBean();
+    }
+
+    @Override
+    protected void doFilterInternal(HttpServletRequest request,
+                                    HttpServletResponse response,
+                                    FilterChain filterChain) throws ServletException, IOException {
+        long before = threadMXBean.getCurrentThreadAllocatedBytes();
+        try {
+            filterChain.doFilter(request, response);
+        } finally {
+            long allocated = threadMXBean.getCurrentThreadAllocatedBytes() - before;
+            Object pattern = request.getAttribute(HandlerMapping.BEST_MATCHING_PATTERN_ATTRIBUTE);
+            DistributionSummary.builder("http.server.requests.allocated")
+                    .baseUnit("bytes")
+                    .tag("method", request.getMethod())
+                    .tag("uri", pattern != null ? pattern.toString() : "UNKNOWN")
+                    .register(meterRegistry)
+                    .record(allocated);
+        }
+    }
+}
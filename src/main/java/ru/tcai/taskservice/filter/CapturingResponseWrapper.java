@@ -0,0 +1,135 @@
+package ru.tcai.taskservice.filter;
+
+import jakarta.servlet.ServletOutputStream;
+import jakarta.servlet.WriteListener;
+import jakarta.servlet.http.HttpServletResponse;
+import jakarta.servlet.http.HttpServletResponseWrapper;
+
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.io.OutputStreamWriter;
+import java.io.PrintWriter;
+
+/**
+ * Writes the body through to the client as usual and keeps a copy of up to
+ * {@code maxSize} bytes of it. Streamed responses are not held back.
+ */
+class CapturingResponseWrapper extends HttpServletResponseWrapper {
+
+    private final int maxSize;
+    private final ByteArrayOutputStream copy = new ByteArrayOutputStream();
+    private boolean overflowed;
+    private CapturingOutputStream outputStream;
+    private PrintWriter writer;
+
+    CapturingResponseWrapper(HttpServletResponse response, int maxSize) {
+        super(response);
+        this.maxSize = maxSize;
+    }
+
+    @Override
+    public ServletOutputStream getOutputStream() throws IOException {
+        if (writer != null) {
+            throw new IllegalStateException("getWriter() has already been called for this response");
+        }
+        if (outputStream == null) {
+            outputStream = new CapturingOutputStream(getResponse().getOutputStream());
+        }
+        return outputStream;
+    }
+
+    @Override
+    public PrintWriter getWriter() throws IOException {
+        if (writer == null) {
+            if (outputStream != null) {
+                throw new IllegalStateException("getOutputStream() has already been called for this response");
+            }
+            outputStream = new CapturingOutputStream(getResponse().getOutputStream());
+            writer = new PrintWriter(new OutputStreamWriter(outputStream, getCharacterEncoding()));
+        }
+        return writer;
+    }
+
+    @Override
+    public void flushBuffer() throws IOException {
+        if (writer != null) {
+            writer.flush();
+        }
+        super.flushBuffer();
+    }
+
+    @Override
+    public void resetBuffer() {
+        super.resetBuffer();
+        copy.reset();
+        overflowed = false;
+    }
+
+    @Override
+    public void reset() {
+        super.reset();
+        copy.reset();
+        overflowed = false;
+    }
+
+    /**
+     * The body written so far, or null when it outgrew {@code maxSize}.
+     */
+    byte[] getBody() {
+        if (writer != null) {
+            writer.flush();
+        }
+        return overflowed ? null : copy.toByteArray();
+    }
+
+    private void capture(byte[] bytes, int offset, int length) {
+        if (overflowed) {
+            return;
+        }
+        if (copy.size() + length > maxSize) {
+            overflowed = true;
+            copy.reset();
+            return;
+        }
+        copy.write(bytes, offset, length);
+    }
+
+    private class CapturingOutputStream extends ServletOutputStream {
+        private final ServletOutputStream raw;
+
+        CapturingOutputStream(ServletOutputStream raw) {
+            this.raw = raw;
+        }
+
+        @Override
+        public void write(int b) throws IOException {
+            write(new byte[]{(byte) b}, 0, 1);
+        }
+
+        @Override
+        public void write(byte[] bytes, int offset, int length) throws IOException {
+            raw.write(bytes, offset, length);
+            capture(bytes, offset, length);
+        }
+
+        @Override
+        public void flush() throws IOException {
+            raw.flush();
+        }
+
+        @Override
+        public void close() throws IOException {
+            raw.close();
+        }
+
+        @Override
+        public boolean isReady() {
+            return raw.isReady();
+        }
+
+        @Override
+        public void setWriteListener(WriteListener writeListener) {
+            raw.setWriteListener(writeListener);
+        }
+    }
+}
@@ -0,0 +1,259 @@
+package ru.tcai.taskservice.filter;
+
+import com.aayushatharva.brotli4j.encoder.BrotliOutputStream;
+import com.aayushatharva.brotli4j.encoder.Encoder;
+import jakarta.servlet.ServletOutputStream;
+import jakarta.servlet.WriteListener;
+import jakarta.servlet.http.HttpServletResponse;
+import jakarta.servlet.http.HttpServletResponseWrapper;
+import org.springframework.http.HttpHeaders;
+import org.springframework.util.MimeType;
+import ru.tcai.taskservice.config.CompressionProperties;
+
+import java.io.FilterOutputStream;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.io.PrintWriter;
+import java.util.List;
+import java.util.zip.GZIPOutputStream;
+
+/**
+ * Holds back the first {@code minResponseSize} bytes of the body. Responses
+ * that end below the threshold, or whose content type is not compressible,
+ * are written as is; larger ones are compressed with the negotiated encoding.
+ * Flushes before the threshold is reached are deferred, later ones sync-flush
+ * the compressor so streamed rows still reach the client.
+ */
+class CompressingResponseWrapper extends HttpServletResponseWrapper {
+
+    static final String GZIP = "gzip";
+    static final String BROTLI = "br";
+
+    private final String encoding;
+    private final CompressionProperties properties;
+    private final List<MimeType> mimeTypes;
+    private CompressingOutputStream outputStream;
+    private PrintWriter writer;
+    private long contentLength = -1;
+
+    CompressingResponseWrapper(HttpServletResponse response, String encoding,
+                               CompressionProperties properties, List<MimeType> mimeTypes) {
+        super(response);
+        this.encoding = encoding;
+        this.properties = properties;
+        this.mimeTypes = mimeTypes;
+    }
+
+    @Override
+    public ServletOutputStream getOutputStream() throws IOException {
+        if (writer != null) {
+            throw new IllegalStateException("getWriter() has already been called for this response");
+        }
+        if (outputStream == null) {
+            outputStream = new CompressingOutputStream();
+        }
+        return outputStream;
+    }
+
+    @Override
+    public PrintWriter getWriter() throws IOException {
+        if (writer == null) {
+            if (outputStream != null) {
+                throw new IllegalStateException("getOutputStream() has already been called for this response");
+            }
+            outputStream = new CompressingOutputStream();
+            writer = new PrintWriter(new OutputStreamWriter(outputStream, getCharacterEncoding()));
+        }
+        return writer;
+    }
+
+    @Override
+    public void setContentLength(int length) {
+        contentLength = length;
+    }
+
+    @Override
+    public void setContentLengthLong(long length) {
+        contentLength = length;
+    }
+
+    @Override
+    public void setHeader(String name, String value) {
+        if (HttpHeaders.CONTENT_LENGTH.equalsIgnoreCase(name)) {
+            contentLength = value != null ? Long.parseLong(value) : -1;
+        } else {
+            super.setHeader(name, value);
+        }
+    }
+
+    @Override
+    public void addHeader(String name, String value) {
+        if (HttpHeaders.CONTENT_LENGTH.equalsIgnoreCase(name)) {
+            contentLength = value != null ? Long.parseLong(value) : -1;
+        } else {
+            super.addHeader(name, value);
+        }
+    }
+
+    @Override
+    public void flushBuffer() throws IOException {
+        if (writer != null) {
+            writer.flush();
+        } else if (outputStream != null) {
+            outputStream.flush();
+        }
+    }
+
+    @Override
+    public void resetBuffer() {
+        super.resetBuffer();
+        if (outputStream != null) {
+            outputStream.resetBuffer();
+        }
+    }
+
+    @Override
+    public void reset() {
+        super.reset();
+        contentLength = -1;
+        if (outputStream != null) {
+            outputStream.resetBuffer();
+        }
+    }
+
+    void finish() throws IOException {
+        if (writer != null) {
+            writer.flush();
+        }
+        if (outputStream != null) {
+            outputStream.finish();
+        } else if (contentLength >= 0) {
+            super.setContentLengthLong(contentLength);
+        }
+    }
+
+    private boolean isCompressible() {
+        if (getHeader(HttpHeaders.CONTENT_ENCODING) != null || getContentType() == null) {
+            return false;
+        }
+        MimeType contentType = MimeType.valueOf(getContentType());
+        return mimeTypes.stream().anyMatch(mimeType -> mimeType.includes(contentType));
+    }
+
+    private OutputStream createCompressor(OutputStream target) throws IOException {
+        if (BROTLI.equals(encoding)) {
+            Encoder.Parameters parameters = new Encoder.Parameters().setQuality(properties.getBrotliQuality());
+            return new BrotliOutputStream(target, parameters);
+        }
+        return new LeveledGzipOutputStream(target, properties.getGzipLevel());
+    }
+
+    private class CompressingOutputStream extends ServletOutputStream {
+        private byte[] buffer = new byte[Math.max(properties.getMinResponseSize(), 1)];
+        private int count;
+        private ServletOutputStream raw;
+        private OutputStream target;
+        private boolean finished;
+
+        @Override
+        public void write(int b) throws IOException {
+            write(new byte[]{(byte) b}, 0, 1);
+        }
+
+        @Override
+        public void write(byte[] bytes, int offset, int length) throws IOException {
+            if (target == null) {
+                if (count + length < buffer.length) {
+                    System.arraycopy(bytes, offset, buffer, count, length);
+                    count += length;
+                    return;
+                }
+                start(true);
+            }
+            target.write(bytes, offset, length);
+        }
+
+        @Override
+        public void flush() throws IOException {
+            if (target != null) {
+                target.flush();
+            }
+        }
+
+        @Override
+        public void close() throws IOException {
+            finish();
+        }
+
+        @Override
+        public boolean isReady() {
+            return raw == null || raw.isReady();
+        }
+
+        @Override
+        public void setWriteListener(WriteListener writeListener) {
+            try {
+                getResponse().getOutputStream().setWriteListener(writeListener);
+            } catch (IOException e) {
+                throw new IllegalStateException(e);
+            }
+        }
+
+        private void resetBuffer() {
+            if (target == null) {
+                count = 0;
+            }
+        }
+
+        private void finish() throws IOException {
+            if (finished) {
+                return;
+            }
+            finished = true;
+            if (target == null) {
+                start(false);
+            }
+            target.close();
+        }
+
+        private void start(boolean overThreshold) throws IOException {
+            raw = getResponse().getOutputStream();
+            // Closing the compressor must finish the encoding without completing the servlet response
+            OutputStream unclosable = new FilterOutputStream(raw) {
+                @Override
+                public void write(byte[] bytes, int offset, int length) throws IOException {
+                    raw.write(bytes, offset, length);
+                }
+
+                @Override
+                public void close() throws IOException {
+                    raw.flush();
+                }
+            };
+
+            if (overThreshold && isCompressible()) {
+                CompressingResponseWrapper.super.setHeader(HttpHeaders.CONTENT_ENCODING, encoding);
+                target = createCompressor(unclosable);
+            } else {
+                if (!overThreshold) {
+                    if (count > 0) {
+                        CompressingResponseWrapper.super.setContentLengthLong(count);
+                    }
+                } else if (contentLength >= 0) {
+                    CompressingResponseWrapper.super.setContentLengthLong(contentLength);
+                }
+                target = unclosable;
+            }
+            target.write(buffer, 0, count);
+            buffer = null;
+        }
+    }
+
+    private static class LeveledGzipOutputStream extends GZIPOutputStream {
+        LeveledGzipOutputStream(OutputStream out, int level) throws IOException {
+            super(out, 8192, true);
+            def.setLevel(level);
+        }
+    }
+}
@@ -0,0 +1,129 @@
+package ru.tcai.taskservice.filter;
+
+import com.aayushatharva.brotli4j.Brotli4jLoader;
+import jakarta.servlet.FilterChain;
+import jakarta.servlet.ServletException;
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.core.Ordered;
+import org.springframework.core.annotation.Order;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.HttpMethod;
+import org.springframework.stereotype.Component;
+import org.springframework.util.MimeType;
+import org.springframework.web.filter.OncePerRequestFilter;
+import org.springframework.web.util.WebUtils;
+import ru.tcai.taskservice.config.CompressionProperties;
+
+import java.io.IOException;
+import java.util.List;
+import java.util.Locale;
+
+/**
+ * Compresses response bodies with brotli or gzip depending on
+ * {@code Accept-Encoding}. Brotli is only offered when its native library
+ * could be loaded on this platform.
+ */
+@Slf4j
+@Component
+@Order(Ordered.HIGHEST_PRECEDENCE + 10)
+@ConditionalOnProperty(prefix = "task-service.compression", name = "enabled", havingValue = "true")
+public class CompressionFilter extends OncePerRequestFilter {
+
+    private final CompressionProperties properties;
+    private final List<MimeType> mimeTypes;
+    private final boolean brotliAvailable;
+
+    public CompressionFilter(CompressionProperties properties) {
+        this.properties = properties;
+        this.mimeTypes = properties.getMimeTypes().stream().map(MimeType::valueOf).toList();
+        this.brotliAvailable = properties.isBrotli() && Brotli4jLoader.isAvailable();
+        if (properties.isBrotli() && !brotliAvailable) {
+            log.warn("Brotli native library is not available, falling back to gzip", Brotli4jLoader.getUnavailabilityCause());
+        }
+    }
+
+    @Override
+    protected boolean shouldNotFilter(HttpServletRequest request) {
+        // Each event has to reach the subscriber when written, not once enough bytes are buffered to compress
+        return request.getRequestURI().startsWith("/tasks/events/");
+    }
+
+    @Override
+    protected boolean shouldNotFilterAsyncDispatch() {
+        // Streamed bodies finish on the async dispatch, where the compressor has to be closed
+        return false;
+    }
+
+    @Override
+    protected void doFilterInternal(HttpServletRequest request,
+                                    HttpServletResponse response,
+                                    FilterChain filterChain) throws ServletException, IOException {
+        CompressingResponseWrapper wrapper = WebUtils.getNativeResponse(response, CompressingResponseWrapper.class);
+        if (wrapper == null) {
+            if (HttpMethod.HEAD.matches(request.getMethod())) {
+                filterChain.doFilter(request, response);
+                return;
+            }
+
+            if (!response.containsHeader(HttpHeaders.VARY)) {
+                response.addHeader(HttpHeaders.VARY, HttpHeaders.ACCEPT_ENCODING);
+            }
+            String encoding = negotiate(request.getHeader(HttpHeaders.ACCEPT_ENCODING));
+            if (encoding == null) {
+                filterChain.doFilter(request, response);
+                return;
+            }
+            wrapper = new CompressingResponseWrapper(response, encoding, properties, mimeTypes);
+            filterChain.doFilter(request, wrapper);
+        } else {
+            filterChain.doFilter(request, response);
+        }
+
+        if (!isAsyncStarted(request)) {
+            wrapper.finish();
+        }
+    }
+
+    private String negotiate(String acceptEncoding) {
+        if (acceptEncoding == null) {
+            return null;
+        }
+
+        double brotli = -1;
+        double gzip = -1;
+        double any = -1;
+        for (String coding : acceptEncoding.split(",")) {
+            String[] parts = coding.split(";");
+            String name = parts[0].trim().toLowerCase(Locale.ROOT);
+            double quality = 1;
+            for (int i = 1; i < parts.length; i++) {
+                String parameter = parts[i].trim();
+                if (parameter.startsWith("q=")) {
+                    try {
+                        quality = Double.parseDouble(parameter.substring(2));
+                    } catch (NumberFormatException e) {
+                        quality = 0;
+                    }
+                }
+            }
+
+            if (name.equals(CompressingResponseWrapper.BROTLI)) {
+                brotli = quality;
+            } else if (name.equals(CompressingResponseWrapper.GZIP) || name.equals("x-gzip")) {
+                gzip = quality;
+            } else if (name.equals("*")) {
+                any = quality;
+            }
+        }
+
+        brotli = brotli >= 0 ? brotli : any;
+        gzip = gzip >= 0 ? gzip : any;
+        if (brotliAvailable && brotli > 0 && brotli >= gzip) {
+            return CompressingResponseWrapper.BROTLI;
+        }
+        return gzip > 0 ? CompressingResponseWrapper.GZIP : null;
+    }
+}
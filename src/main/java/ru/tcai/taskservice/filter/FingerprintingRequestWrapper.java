@@ -0,0 +1,111 @@
+package ru.tcai.taskservice.filter;
+
+import jakarta.servlet.ReadListener;
+import jakarta.servlet.ServletInputStream;
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletRequestWrapper;
+
+import java.io.BufferedReader;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.InputStreamReader;
+import java.nio.charset.Charset;
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+
+/**
+ * Hands the body to the application unchanged while adding every byte read
+ * to a digest, so that bodies of any size are fingerprinted whole without
+ * being held in memory.
+ */
+class FingerprintingRequestWrapper extends HttpServletRequestWrapper {
+
+    private final MessageDigest digest;
+    private DigestingInputStream inputStream;
+    private BufferedReader reader;
+
+    FingerprintingRequestWrapper(HttpServletRequest request, MessageDigest digest) {
+        super(request);
+        this.digest = digest;
+    }
+
+    /**
+     * Digests whatever part of the body the application left unread and
+     * returns the fingerprint of the whole request.
+     */
+    byte[] fingerprint() throws IOException {
+        InputStream raw = getRequest().getInputStream();
+        byte[] buffer = new byte[8192];
+        int read;
+        while ((read = raw.read(buffer)) != -1) {
+            digest.update(buffer, 0, read);
+        }
+        return digest.digest();
+    }
+
+    @Override
+    public ServletInputStream getInputStream() throws IOException {
+        if (reader != null) {
+            throw new IllegalStateException("getReader() has already been called for this request");
+        }
+        if (inputStream == null) {
+            inputStream = new DigestingInputStream(getRequest().getInputStream());
+        }
+        return inputStream;
+    }
+
+    @Override
+    public BufferedReader getReader() throws IOException {
+        if (reader == null) {
+            if (inputStream != null) {
+                throw new IllegalStateException("getInputStream() has already been called for this request");
+            }
+            inputStream = new DigestingInputStream(getRequest().getInputStream());
+            String encoding = getCharacterEncoding();
+            Charset charset = encoding != null ? Charset.forName(encoding) : StandardCharsets.UTF_8;
+            reader = new BufferedReader(new InputStreamReader(inputStream, charset));
+        }
+        return reader;
+    }
+
+    private class DigestingInputStream extends ServletInputStream {
+        private final ServletInputStream raw;
+
+        DigestingInputStream(ServletInputStream raw) {
+            this.raw = raw;
+        }
+
+        @Override
+        public int read() throws IOException {
+            int value = raw.read();
+            if (value != -1) {
+                digest.update((byte) value);
+            }
+            return value;
+        }
+
+        @Override
+        public int read(byte[] bytes, int offset, int length) throws IOException {
+            int count = raw.read(bytes, offset, length);
+            if (count > 0) {
+                digest.update(bytes, offset, count);
+            }
+            return count;
+        }
+
+        @Override
+        public boolean isFinished() {
+            return raw.isFinished();
+        }
+
+        @Override
+        public boolean isReady() {
+            return raw.isReady();
+        }
+
+        @Override
+        public void setReadListener(ReadListener readListener) {
+            raw.setReadListener(readListener);
+        }
+    }
+}
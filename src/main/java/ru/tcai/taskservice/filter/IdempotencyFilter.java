@@ -0,0 +1,232 @@
+package ru.tcai.taskservice.filter;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import io.micrometer.core.instrument.MeterRegistry;
+import jakarta.servlet.FilterChain;
+import jakarta.servlet.ServletException;
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.core.Ordered;
+import org.springframework.core.annotation.Order;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.HttpMethod;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
+import org.springframework.scheduling.TaskScheduler;
+import org.springframework.stereotype.Component;
+import org.springframework.util.AntPathMatcher;
+import org.springframework.web.filter.OncePerRequestFilter;
+import ru.tcai.taskservice.config.IdempotencyProperties;
+import ru.tcai.taskservice.dto.projection.StoredResponse;
+import ru.tcai.taskservice.dto.response.ErrorResponse;
+import ru.tcai.taskservice.repository.IdempotencyKeyRepository;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.time.Duration;
+import java.time.Instant;
+import java.time.LocalDateTime;
+import java.util.Arrays;
+import java.util.HexFormat;
+import java.util.concurrent.ScheduledFuture;
+import java.util.zip.GZIPInputStream;
+import java.util.zip.GZIPOutputStream;
+
+/**
+ * Makes create, comment and import requests safe to retry. The first request
+ * with a given {@code Idempotency-Key} claims the key and has its response
+ * stored once it completes; a retry is answered with the stored response
+ * without reaching the controller. A retry while the first request is still
+ * running gets 409, reusing a key for another request 422. Server errors
+ * release the key so that the retry runs again.
+ * <p>
+ * Keys are chosen by clients, so each is scoped by the {@code X-User-Id}
+ * header, method and path: the same key from another user or on another
+ * endpoint names a different operation. While a request runs its in-flight
+ * lease is renewed, so long imports are not taken over by their retries.
+ * <p>
+ * Ordered inside the compression filter, so bodies are kept uncompressed and
+ * replays are encoded for the retrying client.
+ */
+@Component
+@Order(Ordered.HIGHEST_PRECEDENCE + 15)
+@ConditionalOnProperty(prefix = "task-service.idempotency", name = "enabled", havingValue = "true")
+public class IdempotencyFilter extends OncePerRequestFilter {
+
+    static final String KEY_HEADER = "Idempotency-Key";
+    static final String REPLAYED_HEADER = "Idempotent-Replayed";
+
+    private final IdempotencyProperties properties;
+    private final IdempotencyKeyRepository idempotencyKeyRepository;
+    private final ObjectMapper objectMapper;
+    private final MeterRegistry meterRegistry;
+    private final TaskScheduler taskScheduler;
+    private final AntPathMatcher pathMatcher = new AntPathMatcher();
+
+    public IdempotencyFilter(IdempotencyProperties properties,
+                             IdempotencyKeyRepository idempotencyKeyRepository,
+                             ObjectMapper objectMapper,
+                             MeterRegistry meterRegistry,
+                             TaskScheduler taskScheduler) {
+        this.properties = properties;
+        this.idempotencyKeyRepository = idempotencyKeyRepository;
+        this.objectMapper = objectMapper;
+        this.meterRegistry = meterRegistry;
+        this.taskScheduler = taskScheduler;
+    }
+
+    @Override
+    protected boolean shouldNotFilter(HttpServletRequest request) {
+        if (request.getHeader(KEY_HEADER) == null) {
+            return true;
+        }
+        if (!HttpMethod.POST.matches(request.getMethod()) && !HttpMethod.PUT.matches(request.getMethod())) {
+            return true;
+        }
+        String path = request.getRequestURI();
+        return properties.getPaths().stream().noneMatch(pattern -> pathMatcher.match(pattern, path));
+    }
+
+    @Override
+    protected void doFilterInternal(HttpServletRequest request,
+                                    HttpServletResponse response,
+                                    FilterChain filterChain) throws ServletException, IOException {
+        String key = request.getHeader(KEY_HEADER).trim();
+        if (key.isEmpty() || key.length() > properties.getMaxKeyLength()) {
+            reject(response, HttpStatus.BAD_REQUEST, "invalid",
+                    KEY_HEADER + " must be 1 to " + properties.getMaxKeyLength() + " characters");
+            return;
+        }
+
+        String scopedKey = scopedKey(request, key);
+        FingerprintingRequestWrapper fingerprinting = new FingerprintingRequestWrapper(request, requestDigest(request));
+        // The body is fingerprinted as the application reads it, so the key is claimed before it is known
+        if (!idempotencyKeyRepository.claim(scopedKey, new byte[0], properties.getTtl(),
+                properties.getInFlightTimeout())) {
+            replay(scopedKey, fingerprinting, response);
+            return;
+        }
+        meterRegistry.counter("idempotency.requests", "outcome", "executed").increment();
+
+        Duration renewal = properties.getInFlightTimeout().dividedBy(3);
+        ScheduledFuture<?> lease = taskScheduler.scheduleAtFixedRate(
+                () -> idempotencyKeyRepository.renew(scopedKey), Instant.now().plus(renewal), renewal);
+        CapturingResponseWrapper wrapper = new CapturingResponseWrapper(response, properties.getMaxResponseSize());
+        boolean stored = false;
+        try {
+            filterChain.doFilter(fingerprinting, wrapper);
+            if (!request.isAsyncStarted() && wrapper.getStatus() < 500) {
+                store(scopedKey, fingerprinting.fingerprint(), wrapper);
+                stored = true;
+            }
+        } finally {
+            lease.cancel(false);
+            if (!stored) {
+                idempotencyKeyRepository.release(scopedKey);
+            }
+        }
+    }
+
+    private void store(String key, byte[] fingerprint, CapturingResponseWrapper wrapper) throws IOException {
+        byte[] body = wrapper.getBody();
+        boolean compressed = body != null && body.length >= properties.getCompressMinSize();
+        if (compressed) {
+            ByteArrayOutputStream gzipped = new ByteArrayOutputStream(body.length / 2);
+            try (GZIPOutputStream gzip = new GZIPOutputStream(gzipped)) {
+                gzip.write(body);
+            }
+            body = gzipped.toByteArray();
+        }
+        idempotencyKeyRepository.complete(key, fingerprint, wrapper.getStatus(), wrapper.getContentType(), body, compressed);
+    }
+
+    private void replay(String key, FingerprintingRequestWrapper request, HttpServletResponse response)
+            throws IOException {
+        StoredResponse stored = idempotencyKeyRepository.find(key);
+        if (stored == null || stored.getStatusCode() == null) {
+            response.setHeader(HttpHeaders.RETRY_AFTER, "1");
+            reject(response, HttpStatus.CONFLICT, "in_flight",
+                    "A request with this " + KEY_HEADER + " is still in progress, retry later");
+            return;
+        }
+        // Reads the retried body through to the end, without keeping it
+        if (!Arrays.equals(stored.getFingerprint(), request.fingerprint())) {
+            reject(response, HttpStatus.UNPROCESSABLE_ENTITY, "mismatch",
+                    KEY_HEADER + " was already used for a different request");
+            return;
+        }
+        if (stored.getBody() == null) {
+            reject(response, HttpStatus.CONFLICT, "too_large",
+                    "The request with this " + KEY_HEADER + " already completed with status "
+                            + stored.getStatusCode() + ", its response was too large to keep");
+            return;
+        }
+
+        meterRegistry.counter("idempotency.requests", "outcome", "replayed").increment();
+        byte[] body = stored.getBody();
+        if (stored.isCompressed()) {
+            try (InputStream gzip = new GZIPInputStream(new ByteArrayInputStream(body))) {
+                body = gzip.readAllBytes();
+            }
+        }
+        response.setStatus(stored.getStatusCode());
+        response.setHeader(REPLAYED_HEADER, "true");
+        if (stored.getContentType() != null) {
+            response.setContentType(stored.getContentType());
+        }
+        response.setContentLength(body.length);
+        response.getOutputStream().write(body);
+    }
+
+    private static String scopedKey(HttpServletRequest request, String key) {
+        MessageDigest digest = sha256();
+        for (String part : new String[]{request.getHeader(AdmissionControlFilter.USER_ID_HEADER),
+                request.getMethod(), request.getRequestURI(), key}) {
+            if (part != null) {
+                digest.update(part.getBytes(StandardCharsets.UTF_8));
+            }
+            digest.update((byte) 0);
+        }
+        return HexFormat.of().formatHex(digest.digest());
+    }
+
+    /**
+     * Starts the fingerprint of the request a key was first used for with its
+     * query; the whole body is added as it is read.
+     */
+    private static MessageDigest requestDigest(HttpServletRequest request) {
+        MessageDigest digest = sha256();
+        if (request.getQueryString() != null) {
+            digest.update(request.getQueryString().getBytes(StandardCharsets.UTF_8));
+        }
+        digest.update((byte) 0);
+        return digest;
+    }
+
+    private static MessageDigest sha256() {
+        try {
+            return MessageDigest.getInstance("SHA-256");
+        } catch (NoSuchAlgorithmException e) {
+            throw new IllegalStateException("SHA-256 is not available", e);
+        }
+    }
+
+    private void reject(HttpServletResponse response, HttpStatus status, String outcome, String message)
+            throws IOException {
+        meterRegistry.counter("idempotency.requests", "outcome", outcome).increment();
+
+        response.setStatus(status.value());
+        response.setContentType(MediaType.APPLICATION_JSON_VALUE);
+        objectMapper.writeValue(response.getOutputStream(), ErrorResponse.builder()
+                .timestamp(LocalDateTime.now())
+                .status(status.value())
+                .message(message)
+                .build());
+    }
+}
@@ -0,0 +1,34 @@
+package ru.tcai.taskservice.filter;
+
+import jakarta.servlet.FilterChain;
+import jakarta.servlet.ServletException;
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.core.Ordered;
+import org.springframework.core.annotation.Order;
+import org.springframework.stereotype.Component;
+import org.springframework.web.filter.OncePerRequestFilter;
+
+import java.io.IOException;
+
+/**
+ * Stamps each request with the {@link System#nanoTime()} it arrived at, for
+ * {@link ru.tcai.taskservice.aspect.CoalescingAspect} to tell which running
+ * calls began late enough to see everything the client wrote before.
+ */
+@Component
+@Order(Ordered.HIGHEST_PRECEDENCE)
+@ConditionalOnProperty(prefix = "task-service.coalescing", name = "enabled", havingValue = "true")
+public class RequestStartFilter extends OncePerRequestFilter {
+
+    public static final String START_ATTRIBUTE = RequestStartFilter.class.getName() + ".start";
+
+    @Override
+    protected void doFilterInternal(HttpServletRequest request,
+                                    HttpServletResponse response,
+                                    FilterChain filterChain) throws ServletException, IOException {
+        request.setAttribute(START_ATTRIBUTE, System.nanoTime());
+        filterChain.doFilter(request, response);
+    }
+}
@@ -0,0 +1,53 @@
+package ru.tcai.taskservice.filter;
+
+import ru.tcai.taskservice.config.AdmissionProperties;
+
+/**
+ * Token bucket refilled continuously at {@code rate} tokens per second up to
+ * {@code burst} tokens. Time is passed in as {@link System#nanoTime()}.
+ */
+class TokenBucket {
+
+    private final double capacity;
+    private final double tokensPerNano;
+    private double tokens;
+    private long refilledAt;
+
+    TokenBucket(AdmissionProperties.RateLimit limit, long now) {
+        this.capacity = limit.getBurst();
+        this.tokensPerNano = limit.getRate() / 1_000_000_000d;
+        this.tokens = capacity;
+        this.refilledAt = now;
+    }
+
+    synchronized boolean tryAcquire(long now) {
+        refill(now);
+        if (tokens < 1) {
+            return false;
+        }
+        tokens -= 1;
+        return true;
+    }
+
+    synchronized int remaining(long now) {
+        refill(now);
+        return (int) tokens;
+    }
+
+    synchronized long nanosUntilToken(long now) {
+        refill(now);
+        return tokens >= 1 ? 0 : (long) Math.ceil((1 - tokens) / tokensPerNano);
+    }
+
+    synchronized boolean isFull(long now) {
+        refill(now);
+        return tokens >= capacity;
+    }
+
+    private void refill(long now) {
+        if (now > refilledAt) {
+            tokens = Math.min(capacity, tokens + (now - refilledAt) * tokensPerNano);
+            refilledAt = now;
+        }
+    }
+}
@@ -0,0 +1,47 @@
+package ru.tcai.taskservice.job;
+
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import ru.tcai.taskservice.repository.TaskRepository;
+import ru.tcai.taskservice.service.CommentActivityBuffer;
+
+import java.time.LocalDateTime;
+
+@Slf4j
+@Component
+@RequiredArgsConstructor
+public class CommentCountReconciler {
+
+    private final TaskRepository taskRepository;
+    private final CommentActivityBuffer commentActivityBuffer;
+
+    @Value("${task-service.comments.reconcile-batch-size:10000}")
+    private long batchSize;
+
+    @Value("${task-service.comments.reconcile-settle-time-ms:60000}")
+    private long settleTimeMs;
+
+    @Scheduled(cron = "${task-service.comments.reconcile-cron:0 30 3 * * *}")
+    public void reconcile() {
+        Long maxId = taskRepository.findMaxId();
+        if (maxId == null) {
+            return;
+        }
+
+        log.info("Reconciling comment counts for task ids up to {}", maxId);
+
+        // Buffered comments are already in the comment table, a flush after the repair would count them twice
+        commentActivityBuffer.flush();
+        LocalDateTime settledBefore = LocalDateTime.now().minusNanos(settleTimeMs * 1_000_000);
+
+        int repaired = 0;
+        for (long fromId = 1; fromId <= maxId; fromId += batchSize) {
+            repaired += taskRepository.reconcileCommentCounts(fromId, fromId + batchSize - 1, settledBefore);
+        }
+
+        log.info("Reconciled comment counts, repaired {} tasks", repaired);
+    }
+}
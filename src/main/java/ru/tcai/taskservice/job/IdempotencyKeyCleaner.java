@@ -0,0 +1,34 @@
+package ru.tcai.taskservice.job;
+
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import ru.tcai.taskservice.config.IdempotencyProperties;
+import ru.tcai.taskservice.repository.IdempotencyKeyRepository;
+
+@Slf4j
+@Component
+@RequiredArgsConstructor
+@ConditionalOnProperty(prefix = "task-service.idempotency", name = "enabled", havingValue = "true")
+public class IdempotencyKeyCleaner {
+
+    private final IdempotencyKeyRepository idempotencyKeyRepository;
+    private final IdempotencyProperties properties;
+
+    @Scheduled(cron = "${task-service.idempotency.cleanup-cron:0 */5 * * * *}")
+    public void deleteExpired() {
+        // Expired keys are also taken over by a new claim, this only keeps the table small
+        int deleted = 0;
+        int batch;
+        do {
+            batch = idempotencyKeyRepository.deleteExpired(properties.getCleanupBatchSize());
+            deleted += batch;
+        } while (batch == properties.getCleanupBatchSize());
+
+        if (deleted > 0) {
+            log.info("Deleted {} expired idempotency keys", deleted);
+        }
+    }
+}
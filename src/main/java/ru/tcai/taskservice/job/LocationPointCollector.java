@@ -0,0 +1,43 @@
+package ru.tcai.taskservice.job;
+
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.dao.DataIntegrityViolationException;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import ru.tcai.taskservice.repository.SharedLocationPointRepository;
+
+/**
+ * Removes location points that no location references any more. Points are
+ * shared, so the writes that drop a reference leave them to this job.
+ */
+@Slf4j
+@Component
+@RequiredArgsConstructor
+public class LocationPointCollector {
+
+    private final SharedLocationPointRepository sharedLocationPointRepository;
+
+    @Value("${task-service.locations.gc-batch-size:10000}")
+    private int batchSize;
+
+    @Scheduled(cron = "${task-service.locations.gc-cron:0 0 4 * * *}")
+    public void collect() {
+        int deleted = 0;
+        int batch;
+        try {
+            do {
+                batch = sharedLocationPointRepository.deleteUnused(batchSize);
+                deleted += batch;
+            } while (batch == batchSize);
+        } catch (DataIntegrityViolationException e) {
+            // A point was referenced again after this run's snapshot; it stays and the rest waits for the next run
+            log.info("Stopped collecting location points early: {}", e.getMessage());
+        }
+
+        if (deleted > 0) {
+            log.info("Deleted {} unused location points", deleted);
+        }
+    }
+}
@@ -0,0 +1,116 @@
+package ru.tcai.taskservice.job;
+
+import io.micrometer.core.instrument.Counter;
+import io.micrometer.core.instrument.Gauge;
+import io.micrometer.core.instrument.MeterRegistry;
+import io.micrometer.core.instrument.Timer;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.support.TransactionTemplate;
+import ru.tcai.taskservice.config.OutboxProperties;
+import ru.tcai.taskservice.dto.response.TaskOutboxMessage;
+import ru.tcai.taskservice.outbox.OutboxSink;
+import ru.tcai.taskservice.repository.TaskOutboxRepository;
+
+import java.util.List;
+import java.util.concurrent.atomic.AtomicReference;
+
+/**
+ * Drains the task outbox to the {@link OutboxSink} in id order. Each batch
+ * is read, sent and deleted in one transaction holding an advisory lock, so
+ * only one instance relays at a time and a batch is deleted only after the
+ * sink took it. After a failed batch the relay backs off, doubling the pause
+ * up to {@code max-backoff}.
+ */
+@Slf4j
+@Component
+@ConditionalOnProperty(prefix = "task-service.outbox", name = "enabled", havingValue = "true")
+public class OutboxRelay {
+
+    private final TaskOutboxRepository taskOutboxRepository;
+    private final OutboxSink sink;
+    private final TransactionTemplate transactionTemplate;
+    private final OutboxProperties properties;
+    private final Counter relayed;
+    private final Counter failures;
+    private final Timer sendTimer;
+    private final AtomicReference<Double> lagSeconds = new AtomicReference<>(0.0);
+    // Only touched by the scheduled method, which never overlaps itself
+    private long retryAt;
+    private long backoffMs;
+
+    public OutboxRelay(TaskOutboxRepository taskOutboxRepository,
+                       OutboxSink sink,
+                       PlatformTransactionManager transactionManager,
+                       OutboxProperties properties,
+                       MeterRegistry meterRegistry) {
+        this.taskOutboxRepository = taskOutboxRepository;
+        this.sink = sink;
+        this.transactionTemplate = new TransactionTemplate(transactionManager);
+        this.properties = properties;
+        this.relayed = meterRegistry.counter("outbox.relay.messages");
+        this.failures = meterRegistry.counter("outbox.relay.failures");
+        this.sendTimer = meterRegistry.timer("outbox.relay.send");
+        Gauge.builder("outbox.relay.lag", lagSeconds, AtomicReference::get)
+                .baseUnit("seconds")
+                .register(meterRegistry);
+    }
+
+    @Scheduled(fixedDelayString = "${task-service.outbox.poll-interval-ms:200}")
+    public void relay() {
+        if (System.currentTimeMillis() < retryAt) {
+            return;
+        }
+
+        for (int batches = 0; batches < properties.getMaxBatchesPerRun(); batches++) {
+            int sent;
+            try {
+                sent = transactionTemplate.execute(status -> relayBatch());
+            } catch (RuntimeException e) {
+                failures.increment();
+                backoffMs = Math.min(Math.max(backoffMs * 2, properties.getPollIntervalMs()),
+                        properties.getMaxBackoff().toMillis());
+                retryAt = System.currentTimeMillis() + backoffMs;
+                log.warn("Outbox batch failed, retrying in {} ms", backoffMs, e);
+                break;
+            }
+            backoffMs = 0;
+            if (sent < properties.getBatchSize()) {
+                break;
+            }
+        }
+
+        try {
+            lagSeconds.set(taskOutboxRepository.lagSeconds());
+        } catch (RuntimeException e) {
+            log.debug("Could not read outbox lag", e);
+        }
+    }
+
+    private int relayBatch() {
+        if (!taskOutboxRepository.tryRelayLock()) {
+            return 0;
+        }
+
+        List<TaskOutboxMessage> batch = taskOutboxRepository.findBatch(properties.getBatchSize());
+        if (batch.isEmpty()) {
+            return 0;
+        }
+
+        Timer.Sample sample = Timer.start();
+        try {
+            sink.send(batch);
+        } catch (Exception e) {
+            throw new IllegalStateException("Outbox sink rejected a batch of " + batch.size() + " messages", e);
+        } finally {
+            sample.stop(sendTimer);
+        }
+
+        taskOutboxRepository.delete(batch.stream().map(TaskOutboxMessage::getId).toList());
+        relayed.increment(batch.size());
+        return batch.size();
+    }
+}
@@ -0,0 +1,59 @@
+package ru.tcai.taskservice.job;
+
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.boot.context.event.ApplicationReadyEvent;
+import org.springframework.context.event.EventListener;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import ru.tcai.taskservice.config.PartitionProperties;
+import ru.tcai.taskservice.service.TaskStatsService;
+
+/**
+ * Keeps monthly partitions of the time-partitioned tables created ahead of
+ * time and, when a retention is configured, expires task partitions that fell
+ * out of it together with their comments and subtasks. A partition that still
+ * holds an open task is kept, and so is everything newer than it.
+ */
+@Slf4j
+@Component
+@RequiredArgsConstructor
+public class PartitionMaintenanceJob {
+
+    private final JdbcTemplate jdbcTemplate;
+    private final PartitionProperties properties;
+    private final TaskStatsService taskStatsService;
+
+    @EventListener(ApplicationReadyEvent.class)
+    public void onStartup() {
+        maintain();
+    }
+
+    @Scheduled(cron = "${task-service.partitions.maintenance-cron:0 15 3 * * *}")
+    public void maintain() {
+        for (String table : properties.getTables()) {
+            try {
+                Integer created = jdbcTemplate.queryForObject("SELECT create_monthly_partitions(CAST(? AS regclass), ?)",
+                        Integer.class, table, properties.getMonthsAhead());
+                log.info("Created {} partitions of {}", created, table);
+            } catch (RuntimeException e) {
+                log.error("Partition maintenance failed for {}", table, e);
+            }
+        }
+
+        if (properties.getRetentionMonths() > 0) {
+            try {
+                Integer expired = jdbcTemplate.queryForObject(
+                        "SELECT expire_task_partitions(make_interval(months => ?), ?)",
+                        Integer.class, properties.getRetentionMonths(), properties.isDropExpired());
+                log.info("Expired {} task partitions", expired);
+                if (expired != null && expired > 0) {
+                    taskStatsService.rebuild();
+                }
+            } catch (RuntimeException e) {
+                log.error("Expiring task partitions failed", e);
+            }
+        }
+    }
+}
@@ -0,0 +1,126 @@
+package ru.tcai.taskservice.job;
+
+import com.zaxxer.hikari.HikariDataSource;
+import com.zaxxer.hikari.HikariPoolMXBean;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.support.TransactionTemplate;
+import ru.tcai.taskservice.config.ArchiveProperties;
+import ru.tcai.taskservice.repository.TaskArchiveRepository;
+
+import javax.sql.DataSource;
+import java.sql.SQLException;
+import java.time.LocalDateTime;
+import java.util.List;
+
+/**
+ * Moves DONE tasks that have not been updated for {@code min-age} into the
+ * archive tables, one batch per transaction. Between batches it sleeps, and
+ * it holds off entirely while the connection pool is busy with foreground
+ * requests, so a run may end with work left for the next one.
+ */
+@Slf4j
+@Component
+@ConditionalOnProperty(prefix = "task-service.archive", name = "enabled", havingValue = "true")
+public class TaskArchiver {
+
+    private final TaskArchiveRepository taskArchiveRepository;
+    private final JdbcTemplate jdbcTemplate;
+    private final TransactionTemplate transactionTemplate;
+    private final DataSource dataSource;
+    private final ArchiveProperties properties;
+
+    public TaskArchiver(TaskArchiveRepository taskArchiveRepository,
+                        JdbcTemplate jdbcTemplate,
+                        PlatformTransactionManager transactionManager,
+                        DataSource dataSource,
+                        ArchiveProperties properties) {
+        this.taskArchiveRepository = taskArchiveRepository;
+        this.jdbcTemplate = jdbcTemplate;
+        this.transactionTemplate = new TransactionTemplate(transactionManager);
+        this.dataSource = dataSource;
+        this.properties = properties;
+    }
+
+    @Scheduled(cron = "${task-service.archive.cron:0 45 3 * * *}")
+    public void archive() {
+        LocalDateTime cutoff = LocalDateTime.now().minus(properties.getMinAge());
+        long deadline = System.nanoTime() + properties.getMaxRunDuration().toNanos();
+
+        log.info("Archiving DONE tasks last updated before {}", cutoff);
+
+        int archived = 0;
+        int batches = 0;
+        while (System.nanoTime() < deadline) {
+            if (poolBusy()) {
+                if (!pause()) {
+                    break;
+                }
+                continue;
+            }
+
+            int moved;
+            try {
+                moved = transactionTemplate.execute(status -> archiveBatch(cutoff));
+            } catch (RuntimeException e) {
+                // Most likely the lock timeout; whatever is left is picked up by the next run
+                log.warn("Archive batch failed after {} tasks, stopping this run", archived, e);
+                break;
+            }
+            archived += moved;
+            batches++;
+
+            if (moved < properties.getBatchSize() || !pause()) {
+                break;
+            }
+        }
+
+        log.info("Archived {} tasks in {} batches", archived, batches);
+    }
+
+    private int archiveBatch(LocalDateTime cutoff) {
+        // Give up on rows foreground requests hold instead of queueing behind them
+        jdbcTemplate.execute("SET LOCAL lock_timeout = " + properties.getLockTimeout().toMillis());
+
+        List<Long> taskIds = taskArchiveRepository.lockArchivable(cutoff, properties.getBatchSize());
+        if (taskIds.isEmpty()) {
+            return 0;
+        }
+        return taskArchiveRepository.archive(taskIds, LocalDateTime.now());
+    }
+
+    private boolean poolBusy() {
+        HikariDataSource hikari = hikariDataSource();
+        HikariPoolMXBean pool = hikari != null ? hikari.getHikariPoolMXBean() : null;
+        if (pool == null) {
+            return false;
+        }
+        return pool.getThreadsAwaitingConnection() > 0
+                || pool.getActiveConnections() >= Math.max(1, hikari.getMaximumPoolSize() * properties.getMaxPoolUsage());
+    }
+
+    private HikariDataSource hikariDataSource() {
+        try {
+            if (dataSource.isWrapperFor(HikariDataSource.class)) {
+                return dataSource.unwrap(HikariDataSource.class);
+            }
+        } catch (SQLException e) {
+            log.debug("Could not inspect the connection pool", e);
+        }
+        return null;
+    }
+
+    private boolean pause() {
+        try {
+            Thread.sleep(properties.getBatchPause().toMillis());
+            return true;
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            return false;
+        }
+    }
+}
@@ -0,0 +1,116 @@
+package ru.tcai.taskservice.job;
+
+import com.fasterxml.jackson.core.JsonProcessingException;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.boot.ApplicationArguments;
+import org.springframework.boot.ApplicationRunner;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.http.converter.cbor.MappingJackson2CborHttpMessageConverter;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.support.TransactionTemplate;
+import ru.tcai.taskservice.config.WarmupProperties;
+import ru.tcai.taskservice.dto.request.*;
+import ru.tcai.taskservice.dto.response.TaskResponse;
+import ru.tcai.taskservice.service.TaskService;
+
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Runs the hot service paths and their serialization against a scratch group
+ * before the instance reports ready. Spring Boot only flips readiness to
+ * ACCEPTING_TRAFFIC once all application runners have returned, so traffic
+ * routed by the readiness probe never hits cold code. Everything runs in one
+ * transaction that is rolled back.
+ */
+@Slf4j
+@Component
+@ConditionalOnProperty(prefix = "task-service.warmup", name = "enabled", havingValue = "true", matchIfMissing = true)
+public class WarmupRunner implements ApplicationRunner {
+
+    private final TaskService taskService;
+    private final ObjectMapper objectMapper;
+    private final ObjectMapper cborMapper;
+    private final TransactionTemplate transactionTemplate;
+    private final WarmupProperties properties;
+
+    public WarmupRunner(TaskService taskService,
+                        ObjectMapper objectMapper,
+                        MappingJackson2CborHttpMessageConverter cborConverter,
+                        PlatformTransactionManager transactionManager,
+                        WarmupProperties properties) {
+        this.taskService = taskService;
+        this.objectMapper = objectMapper;
+        this.cborMapper = cborConverter.getObjectMapper();
+        this.transactionTemplate = new TransactionTemplate(transactionManager);
+        this.properties = properties;
+    }
+
+    @Override
+    public void run(ApplicationArguments args) {
+        long started = System.nanoTime();
+        long deadline = started + properties.getMaxDuration().toNanos();
+
+        int iterations = 0;
+        try {
+            iterations = transactionTemplate.execute(status -> {
+                status.setRollbackOnly();
+                int completed = 0;
+                while (completed < properties.getIterations() && System.nanoTime() < deadline) {
+                    exercise(completed);
+                    completed++;
+                }
+                return completed;
+            });
+        } catch (RuntimeException e) {
+            // A failed warmup only costs latency, it must not keep the instance from starting
+            log.warn("Warmup failed, starting with cold code paths", e);
+        }
+
+        log.info("Warmup ran {} iterations in {} ms", iterations, (System.nanoTime() - started) / 1_000_000);
+    }
+
+    private void exercise(int iteration) {
+        Long authorId = properties.getGroupId();
+        List<Object> responses = new ArrayList<>();
+
+        TaskResponse task = taskService.createTask(TaskRequest.builder()
+                .title("Warmup " + iteration)
+                .description("Warmup task")
+                .authorId(authorId)
+                .groupId(properties.getGroupId())
+                .priority("MIDDLE")
+                .location(LocationRequest.builder().latitude(0.0).longitude(0.0).name("Warmup").remindByLocation(false).build())
+                .deadline(DeadlineRequest.builder().time("2030-01-01T00:00:00Z").remindByTime(false).build())
+                .build());
+        responses.add(task);
+        responses.add(taskService.getTaskById(task.getId()));
+        responses.add(taskService.addCommentToTask(task.getId(),
+                CommentRequest.builder().authorId(authorId).text("Warmup comment").build()));
+        responses.add(taskService.addSubtask(task.getId(), SubtaskRequest.builder().text("Warmup subtask").build()));
+        responses.add(taskService.updateTask(task.getId(), UpdateTaskRequest.builder().status("DONE").build()));
+        responses.add(taskService.getTaskDetailsById(task.getId()));
+        responses.add(taskService.getTasksByGroupId(properties.getGroupId()));
+        responses.add(taskService.getTasksByAuthorId(authorId));
+        responses.add(taskService.getInbox(authorId, List.of(properties.getGroupId()), InboxSort.DEADLINE, 0, 50));
+
+        responses.add(taskService.createNote(NoteRequest.builder()
+                .title("Warmup " + iteration)
+                .description("Warmup note")
+                .authorId(authorId)
+                .groupId(properties.getGroupId())
+                .build()));
+        responses.add(taskService.getNotesByGroupId(properties.getGroupId()));
+
+        try {
+            for (Object response : responses) {
+                objectMapper.writeValueAsBytes(response);
+                cborMapper.writeValueAsBytes(response);
+            }
+        } catch (JsonProcessingException e) {
+            throw new IllegalStateException("Could not serialize warmup response", e);
+        }
+    }
+}
@@ -0,0 +1,66 @@
+package ru.tcai.taskservice.logging;
+
+import ch.qos.logback.classic.Level;
+import ch.qos.logback.classic.Logger;
+import ch.qos.logback.classic.turbo.TurboFilter;
+import ch.qos.logback.core.spi.FilterReply;
+import org.slf4j.Marker;
+
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicLong;
+
+/**
+ * Lets through one in {@code rate} occurrences of each message template at
+ * DEBUG and INFO for loggers under {@code loggerPrefix}. The first occurrence
+ * of a template is always logged, as are WARN, ERROR and anything carrying an
+ * exception. Configured from logback-spring.xml.
+ */
+public class SamplingTurboFilter extends TurboFilter {
+
+    private static final int MAX_TRACKED_TEMPLATES = 1024;
+
+    private final ConcurrentHashMap<String, AtomicLong> occurrences = new ConcurrentHashMap<>();
+
+    private String loggerPrefix = "";
+    private int debugRate = 1;
+    private int infoRate = 1;
+
+    @Override
+    public FilterReply decide(Marker marker, Logger logger, Level level, String format, Object[] params, Throwable t) {
+        // format is null for isXxxEnabled() checks, which must not be counted
+        if (format == null || t != null || !logger.getName().startsWith(loggerPrefix)) {
+            return FilterReply.NEUTRAL;
+        }
+
+        int rate = rateFor(level);
+        if (rate <= 1 || !level.isGreaterOrEqual(logger.getEffectiveLevel())) {
+            return FilterReply.NEUTRAL;
+        }
+
+        // Templates built by concatenation would otherwise grow the map without bound
+        if (occurrences.size() > MAX_TRACKED_TEMPLATES) {
+            occurrences.clear();
+        }
+        long seen = occurrences.computeIfAbsent(format, key -> new AtomicLong()).getAndIncrement();
+        return seen % rate == 0 ? FilterReply.NEUTRAL : FilterReply.DENY;
+    }
+
+    private int rateFor(Level level) {
+        if (level.toInt() <= Level.DEBUG_INT) {
+            return debugRate;
+        }
+        return level.toInt() == Level.INFO_INT ? infoRate : 1;
+    }
+
+    public void setLoggerPrefix(String loggerPrefix) {
+        this.loggerPrefix = loggerPrefix;
+    }
+
+    public void setDebugRate(int debugRate) {
+        this.debugRate = debugRate;
+    }
+
+    public void setInfoRate(int infoRate) {
+        this.infoRate = infoRate;
+    }
+}
@@ -0,0 +1,43 @@
+package ru.tcai.taskservice.outbox;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.fasterxml.jackson.databind.ObjectWriter;
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.stereotype.Component;
+import ru.tcai.taskservice.config.OutboxProperties;
+import ru.tcai.taskservice.dto.response.TaskOutboxMessage;
+
+import java.io.IOException;
+import java.io.OutputStream;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardOpenOption;
+import java.util.List;
+
+/**
+ * Appends messages to a local NDJSON file, one per line. Meant for
+ * development and tests, where no downstream system is running.
+ */
+@Component
+@ConditionalOnProperty(prefix = "task-service.outbox", name = "sink", havingValue = "file", matchIfMissing = true)
+public class FileOutboxSink implements OutboxSink {
+
+    private final ObjectWriter objectWriter;
+    private final Path path;
+
+    public FileOutboxSink(ObjectMapper objectMapper, OutboxProperties properties) {
+        this.objectWriter = objectMapper.writer();
+        this.path = Path.of(properties.getFile().getPath()).toAbsolutePath();
+    }
+
+    @Override
+    public synchronized void send(List<TaskOutboxMessage> batch) throws IOException {
+        Files.createDirectories(path.getParent());
+        try (OutputStream outputStream = Files.newOutputStream(path, StandardOpenOption.CREATE, StandardOpenOption.APPEND)) {
+            for (TaskOutboxMessage message : batch) {
+                outputStream.write(objectWriter.writeValueAsBytes(message));
+                outputStream.write('\n');
+            }
+        }
+    }
+}
@@ -0,0 +1,44 @@
+package ru.tcai.taskservice.outbox;
+
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty;
+import org.springframework.http.MediaType;
+import org.springframework.http.client.SimpleClientHttpRequestFactory;
+import org.springframework.stereotype.Component;
+import org.springframework.web.client.RestClient;
+import ru.tcai.taskservice.config.OutboxProperties;
+import ru.tcai.taskservice.dto.response.TaskOutboxMessage;
+
+import java.util.List;
+
+/**
+ * POSTs each batch as a JSON array to {@code task-service.outbox.http.url}.
+ * Any non-2xx response fails the batch, which is then retried.
+ */
+@Component
+@ConditionalOnProperty(prefix = "task-service.outbox", name = "sink", havingValue = "http")
+public class HttpOutboxSink implements OutboxSink {
+
+    private final RestClient restClient;
+    private final String url;
+
+    public HttpOutboxSink(RestClient.Builder restClientBuilder, OutboxProperties properties) {
+        if (properties.getHttp().getUrl() == null) {
+            throw new IllegalArgumentException("task-service.outbox.http.url is required for the http sink");
+        }
+        SimpleClientHttpRequestFactory requestFactory = new SimpleClientHttpRequestFactory();
+        requestFactory.setConnectTimeout((int) properties.getHttp().getConnectTimeout().toMillis());
+        requestFactory.setReadTimeout((int) properties.getHttp().getReadTimeout().toMillis());
+        this.restClient = restClientBuilder.requestFactory(requestFactory).build();
+        this.url = properties.getHttp().getUrl();
+    }
+
+    @Override
+    public void send(List<TaskOutboxMessage> batch) {
+        restClient.post()
+                .uri(url)
+                .contentType(MediaType.APPLICATION_JSON)
+                .body(batch)
+                .retrieve()
+                .toBodilessEntity();
+    }
+}
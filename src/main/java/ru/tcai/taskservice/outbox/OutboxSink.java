@@ -0,0 +1,14 @@
+package ru.tcai.taskservice.outbox;
+
+import ru.tcai.taskservice.dto.response.TaskOutboxMessage;
+
+import java.util.List;
+
+/**
+ * Destination of the outbox relay. A batch counts as delivered once
+ * {@link #send} returns; if it throws, the same batch is sent again later,
+ * so consumers must tolerate duplicates (the message id identifies them).
+ */
+public interface OutboxSink {
+    void send(List<TaskOutboxMessage> batch) throws Exception;
+}
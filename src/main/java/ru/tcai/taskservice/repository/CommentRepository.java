@@ -1,12 +1,17 @@
 package ru.tcai.taskservice.repository;
 
 import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 import ru.tcai.taskservice.entity.Comment;
 
+import java.time.LocalDateTime;
 import java.util.List;
 
 @Repository
 public interface CommentRepository extends JpaRepository<Comment, Long>  {
-    List<Comment> findByTaskId(Long taskId);
+    // A comment is never older than its task, so the bound prunes comment partitions
+    @Query("select c from Comment c where c.taskId = :taskId and c.createdAt >= :taskCreatedAt order by c.id")
+    List<Comment> findByTask(@Param("taskId") Long taskId, @Param("taskCreatedAt") LocalDateTime taskCreatedAt);
 }
@@ -0,0 +1,85 @@
+package ru.tcai.taskservice.repository;
+
+import lombok.RequiredArgsConstructor;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.RowMapper;
+import org.springframework.stereotype.Repository;
+import ru.tcai.taskservice.dto.projection.StoredResponse;
+
+import java.time.Duration;
+import java.util.List;
+
+@Repository
+@RequiredArgsConstructor
+public class IdempotencyKeyRepository {
+
+    // Takes over a key whose response expired or whose request was abandoned, in the same statement
+    private static final String CLAIM = "INSERT INTO idempotency_key (idempotency_key, fingerprint, expires_at) " +
+            "VALUES (?, ?, now() + make_interval(secs => ?)) " +
+            "ON CONFLICT (idempotency_key) DO UPDATE SET fingerprint = EXCLUDED.fingerprint, status_code = NULL, " +
+            "content_type = NULL, body = NULL, compressed = FALSE, created_at = now(), expires_at = EXCLUDED.expires_at " +
+            "WHERE idempotency_key.expires_at < now() " +
+            "OR (idempotency_key.status_code IS NULL AND idempotency_key.created_at < now() - make_interval(secs => ?)) " +
+            "RETURNING idempotency_key";
+
+    private static final String COMPLETE = "UPDATE idempotency_key SET fingerprint = ?, status_code = ?, " +
+            "content_type = ?, body = ?, compressed = ? WHERE idempotency_key = ? AND status_code IS NULL";
+
+    // created_at is where the in-flight lease runs from
+    private static final String RENEW = "UPDATE idempotency_key SET created_at = now() " +
+            "WHERE idempotency_key = ? AND status_code IS NULL";
+
+    private static final String RELEASE = "DELETE FROM idempotency_key WHERE idempotency_key = ? AND status_code IS NULL";
+
+    private static final String SELECT_RESPONSE = "SELECT fingerprint, status_code, content_type, body, compressed " +
+            "FROM idempotency_key WHERE idempotency_key = ? AND expires_at >= now()";
+
+    private static final String DELETE_EXPIRED = "DELETE FROM idempotency_key WHERE idempotency_key IN " +
+            "(SELECT idempotency_key FROM idempotency_key WHERE expires_at < now() LIMIT ?)";
+
+    private static final RowMapper<StoredResponse> RESPONSE_MAPPER = (rs, rowNum) -> new StoredResponse(
+            rs.getBytes("fingerprint"),
+            rs.getObject("status_code", Integer.class),
+            rs.getString("content_type"),
+            rs.getBytes("body"),
+            rs.getBoolean("compressed"));
+
+    private final JdbcTemplate jdbcTemplate;
+
+    /**
+     * Registers the key as in flight; false when it is already taken.
+     */
+    public boolean claim(String key, byte[] fingerprint, Duration ttl, Duration inFlightTimeout) {
+        return !jdbcTemplate.queryForList(CLAIM, String.class, key, fingerprint, seconds(ttl),
+                seconds(inFlightTimeout)).isEmpty();
+    }
+
+    public void complete(String key, byte[] fingerprint, int statusCode, String contentType, byte[] body,
+                         boolean compressed) {
+        jdbcTemplate.update(COMPLETE, fingerprint, statusCode, contentType, body, compressed, key);
+    }
+
+    /**
+     * Keeps a request that is still running from being taken over as abandoned.
+     */
+    public void renew(String key) {
+        jdbcTemplate.update(RENEW, key);
+    }
+
+    public void release(String key) {
+        jdbcTemplate.update(RELEASE, key);
+    }
+
+    public StoredResponse find(String key) {
+        List<StoredResponse> responses = jdbcTemplate.query(SELECT_RESPONSE, RESPONSE_MAPPER, key);
+        return responses.isEmpty() ? null : responses.get(0);
+    }
+
+    public int deleteExpired(int limit) {
+        return jdbcTemplate.update(DELETE_EXPIRED, limit);
+    }
+
+    private static double seconds(Duration duration) {
+        return duration.toMillis() / 1000.0;
+    }
+}
@@ -0,0 +1,119 @@
+package ru.tcai.taskservice.repository;
+
+import lombok.RequiredArgsConstructor;
+import lombok.Value;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.stereotype.Repository;
+import ru.tcai.taskservice.dto.request.LocationRequest;
+
+import java.util.ArrayList;
+import java.util.Comparator;
+import java.util.List;
+import java.util.Map;
+import java.util.TreeMap;
+
+/**
+ * Finds or creates the shared location point for a position and name. A
+ * point handed out is locked {@code FOR KEY SHARE} until the caller's
+ * transaction ends, so {@link #deleteUnused} cannot remove it before the
+ * caller's location references it.
+ */
+@Repository
+@RequiredArgsConstructor
+public class SharedLocationPointRepository {
+
+    private static final String INSERT_POINTS = "INSERT INTO location_point (latitude, longitude, name) " +
+            "SELECT * FROM unnest(?::float8[], ?::float8[], ?::text[]) " +
+            "ON CONFLICT (lat_key, lon_key, (coalesce(name, ''))) DO NOTHING";
+
+    // A separate statement, so that points committed by concurrent writers since the insert are seen
+    private static final String SELECT_POINTS = "SELECT k.ord, p.id " +
+            "FROM unnest(?::float8[], ?::float8[], ?::text[]) WITH ORDINALITY AS k(latitude, longitude, name, ord) " +
+            "JOIN location_point p ON p.lat_key = round(k.latitude * 1000000)::integer " +
+            "AND p.lon_key = round(k.longitude * 1000000)::integer " +
+            "AND coalesce(p.name, '') = coalesce(k.name, '') " +
+            "FOR KEY SHARE OF p";
+
+    // Points being handed out are locked and skipped, they are collected on a later run if still unused.
+    // The reference check is served by idx_location_point_id from V4.
+    private static final String DELETE_UNUSED = "DELETE FROM location_point WHERE id IN (" +
+            "SELECT p.id FROM location_point p " +
+            "WHERE NOT EXISTS (SELECT 1 FROM location l WHERE l.point_id = p.id) " +
+            "LIMIT ? FOR UPDATE SKIP LOCKED)";
+
+    // A point can only vanish between the two statements if the collector removed it at that moment
+    private static final int MAX_ATTEMPTS = 3;
+
+    private static final long QUANTUM = 1_000_000;
+
+    // Inserted in key order so that concurrent imports wait on each other instead of deadlocking
+    private static final Comparator<PointKey> KEY_ORDER = Comparator.comparingLong(PointKey::getLatitude)
+            .thenComparingLong(PointKey::getLongitude)
+            .thenComparing(PointKey::getName);
+
+    private final JdbcTemplate jdbcTemplate;
+
+    public Long upsert(LocationRequest location) {
+        return upsert(List.of(location)).get(0);
+    }
+
+    /**
+     * Ids of the points for the given locations, in the same order.
+     */
+    public List<Long> upsert(List<LocationRequest> locations) {
+        Map<PointKey, Long> ids = new TreeMap<>(KEY_ORDER);
+        Map<PointKey, LocationRequest> pending = new TreeMap<>(KEY_ORDER);
+        for (LocationRequest location : locations) {
+            pending.putIfAbsent(key(location), location);
+        }
+
+        for (int attempt = 0; attempt < MAX_ATTEMPTS && !pending.isEmpty(); attempt++) {
+            List<PointKey> keys = new ArrayList<>(pending.keySet());
+            Object[] arrays = arrays(pending.values());
+            jdbcTemplate.update(INSERT_POINTS, arrays);
+            jdbcTemplate.query(SELECT_POINTS, rs -> {
+                PointKey key = keys.get(rs.getInt("ord") - 1);
+                ids.put(key, rs.getLong("id"));
+                pending.remove(key);
+            }, arrays);
+        }
+        if (!pending.isEmpty()) {
+            throw new IllegalStateException("Could not resolve " + pending.size() + " location points");
+        }
+
+        List<Long> result = new ArrayList<>(locations.size());
+        for (LocationRequest location : locations) {
+            result.add(ids.get(key(location)));
+        }
+        return result;
+    }
+
+    public int deleteUnused(int limit) {
+        return jdbcTemplate.update(DELETE_UNUSED, limit);
+    }
+
+    private static Object[] arrays(Iterable<LocationRequest> locations) {
+        List<Double> latitudes = new ArrayList<>();
+        List<Double> longitudes = new ArrayList<>();
+        List<String> names = new ArrayList<>();
+        for (LocationRequest location : locations) {
+            latitudes.add(location.getLatitude());
+            longitudes.add(location.getLongitude());
+            names.add(location.getName());
+        }
+        return new Object[]{latitudes.toArray(new Double[0]), longitudes.toArray(new Double[0]),
+                names.toArray(new String[0])};
+    }
+
+    private static PointKey key(LocationRequest location) {
+        return new PointKey(Math.round(location.getLatitude() * QUANTUM), Math.round(location.getLongitude() * QUANTUM),
+                location.getName() != null ? location.getName() : "");
+    }
+
+    @Value
+    private static class PointKey {
+        long latitude;
+        long longitude;
+        String name;
+    }
+}
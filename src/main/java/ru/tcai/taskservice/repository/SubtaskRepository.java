@@ -0,0 +1,27 @@
+package ru.tcai.taskservice.repository;
+
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Modifying;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
+import org.springframework.stereotype.Repository;
+import ru.tcai.taskservice.entity.Subtask;
+
+import java.time.LocalDateTime;
+import java.util.List;
+
+@Repository
+public interface SubtaskRepository extends JpaRepository<Subtask, Long> {
+    List<Subtask> findByTaskIdOrderById(Long taskId);
+
+    @Modifying(flushAutomatically = true, clearAutomatically = true)
+    @Query("update Subtask s set s.status = :status, s.updatedAt = :updatedAt " +
+            "where s.id = :subtaskId and s.status <> :status")
+    int updateStatusIfChanged(@Param("subtaskId") Long subtaskId,
+                              @Param("status") String status,
+                              @Param("updatedAt") LocalDateTime updatedAt);
+
+    @Modifying
+    @Query("delete from Subtask s where s.taskId = :taskId")
+    void deleteByTaskId(@Param("taskId") Long taskId);
+}
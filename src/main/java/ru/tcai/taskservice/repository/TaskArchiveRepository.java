@@ -0,0 +1,143 @@
+package ru.tcai.taskservice.repository;
+
+import lombok.RequiredArgsConstructor;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.RowMapper;
+import org.springframework.stereotype.Repository;
+import ru.tcai.taskservice.dto.projection.TaskView;
+import ru.tcai.taskservice.entity.Comment;
+import ru.tcai.taskservice.entity.Subtask;
+
+import java.time.LocalDateTime;
+import java.util.Collection;
+import java.util.List;
+import java.util.Optional;
+
+/**
+ * Reads and writes the archive tables populated by
+ * {@link ru.tcai.taskservice.job.TaskArchiver}. The moves are plain SQL
+ * since each one is a single set-based DELETE ... RETURNING feeding an INSERT.
+ */
+@Repository
+@RequiredArgsConstructor
+public class TaskArchiveRepository {
+
+    private static final String SELECT_ARCHIVABLE = "SELECT id FROM task " +
+            "WHERE task_type = 0 AND status = 'DONE' AND updated_at < ? " +
+            "ORDER BY updated_at, id LIMIT ? FOR UPDATE SKIP LOCKED";
+
+    // Bounded by the task's created_at so that only partitions that can hold its comments are scanned
+    private static final String MOVE_COMMENTS = "WITH moved AS (" +
+            "DELETE FROM comment c USING task t " +
+            "WHERE t.id = ANY (?) AND c.task_id = t.id AND c.created_at >= t.created_at " +
+            "RETURNING c.id, c.task_id, c.author_id, c.text, c.created_at) " +
+            "INSERT INTO comment_archive (id, task_id, author_id, text, created_at, archived_at) " +
+            "SELECT id, task_id, author_id, text, created_at, ? FROM moved";
+
+    private static final String MOVE_SUBTASKS = "WITH moved AS (" +
+            "DELETE FROM subtask WHERE task_id = ANY (?) " +
+            "RETURNING id, task_id, text, status, created_at, updated_at) " +
+            "INSERT INTO subtask_archive (id, task_id, text, status, created_at, updated_at, archived_at) " +
+            "SELECT id, task_id, text, status, created_at, updated_at, ? FROM moved";
+
+    private static final String TASK_COLUMNS = "id, author, title, task_type, description, location_id, deadline_id, " +
+            "group_id, doer, created_at, updated_at, status, priority, comment_count, last_comment_at, " +
+            "subtasks_total, subtasks_done";
+
+    private static final String MOVE_TASKS = "WITH moved AS (" +
+            "DELETE FROM task WHERE id = ANY (?) RETURNING " + TASK_COLUMNS + ") " +
+            "INSERT INTO task_archive (" + TASK_COLUMNS + ", archived_at) " +
+            "SELECT " + TASK_COLUMNS + ", ? FROM moved";
+
+    private static final String MOVE_REMINDERS = "WITH moved AS (" +
+            "DELETE FROM reminder r USING task_archive t " +
+            "WHERE t.id = ANY (?) AND r.id = t.deadline_id " +
+            "RETURNING r.id, r.time, r.remind_by_time) " +
+            "INSERT INTO reminder_archive (id, time, remind_by_time, archived_at) " +
+            "SELECT id, time, remind_by_time, ? FROM moved";
+
+    private static final String MOVE_LOCATIONS = "WITH moved AS (" +
+            "DELETE FROM location l USING task_archive t " +
+            "WHERE t.id = ANY (?) AND l.id = t.location_id " +
+            "RETURNING l.id, l.point_id, l.remind_by_location) " +
+            "INSERT INTO location_archive (id, point_id, latitude, longitude, name, remind_by_location, archived_at) " +
+            "SELECT m.id, m.point_id, p.latitude, p.longitude, p.name, m.remind_by_location, ? " +
+            "FROM moved m LEFT JOIN location_point p ON p.id = m.point_id";
+
+    private static final String VIEW_SELECT = "SELECT t.id, t.title, t.description, t.task_type, t.author, " +
+            "t.group_id, t.doer, t.status, t.priority, t.created_at, t.comment_count, t.last_comment_at, " +
+            "t.subtasks_total, t.subtasks_done, l.point_id, l.latitude, l.longitude, l.name, " +
+            "l.remind_by_location, r.id AS reminder_id, r.time, r.remind_by_time " +
+            "FROM task_archive t " +
+            "LEFT JOIN location_archive l ON l.id = t.location_id " +
+            "LEFT JOIN reminder_archive r ON r.id = t.deadline_id ";
+
+    private static final String SELECT_VIEW = VIEW_SELECT + "WHERE t.id = ?";
+
+    private static final String SELECT_VIEWS = VIEW_SELECT + "WHERE t.id = ANY (?)";
+
+    private static final String SELECT_COMMENTS = "SELECT id, task_id, author_id, text, created_at " +
+            "FROM comment_archive WHERE task_id = ? ORDER BY id";
+
+    private static final String SELECT_SUBTASKS = "SELECT id, task_id, text, status, created_at, updated_at " +
+            "FROM subtask_archive WHERE task_id = ? ORDER BY id";
+
+    private static final RowMapper<TaskView> VIEW_MAPPER = new TaskViewRowMapper();
+
+    private static final RowMapper<Comment> COMMENT_MAPPER = (rs, rowNum) -> Comment.builder()
+            .id(rs.getLong("id"))
+            .taskId(rs.getObject("task_id", Long.class))
+            .authorId(rs.getObject("author_id", Long.class))
+            .text(rs.getString("text"))
+            .createdAt(rs.getObject("created_at", LocalDateTime.class))
+            .build();
+
+    private static final RowMapper<Subtask> SUBTASK_MAPPER = (rs, rowNum) -> Subtask.builder()
+            .id(rs.getLong("id"))
+            .taskId(rs.getLong("task_id"))
+            .text(rs.getString("text"))
+            .status(rs.getString("status"))
+            .createdAt(rs.getObject("created_at", LocalDateTime.class))
+            .updatedAt(rs.getObject("updated_at", LocalDateTime.class))
+            .build();
+
+    private final JdbcTemplate jdbcTemplate;
+
+    public Optional<TaskView> findViewById(Long id) {
+        return jdbcTemplate.query(SELECT_VIEW, VIEW_MAPPER, id).stream().findFirst();
+    }
+
+    public List<TaskView> findViewsByIds(Collection<Long> ids) {
+        return jdbcTemplate.query(SELECT_VIEWS, VIEW_MAPPER, (Object) ids.toArray(new Long[0]));
+    }
+
+    public List<Comment> findComments(Long taskId) {
+        return jdbcTemplate.query(SELECT_COMMENTS, COMMENT_MAPPER, taskId);
+    }
+
+    public List<Subtask> findSubtasks(Long taskId) {
+        return jdbcTemplate.query(SELECT_SUBTASKS, SUBTASK_MAPPER, taskId);
+    }
+
+    /**
+     * Locks up to {@code limit} DONE tasks last updated before {@code cutoff}.
+     * Rows locked by foreground transactions are skipped rather than waited on.
+     */
+    public List<Long> lockArchivable(LocalDateTime cutoff, int limit) {
+        return jdbcTemplate.queryForList(SELECT_ARCHIVABLE, Long.class, cutoff, limit);
+    }
+
+    /**
+     * Moves the given (locked) tasks and everything hanging off them into the
+     * archive tables. Must run inside a transaction.
+     */
+    public int archive(List<Long> taskIds, LocalDateTime archivedAt) {
+        Long[] ids = taskIds.toArray(new Long[0]);
+        jdbcTemplate.update(MOVE_COMMENTS, ids, archivedAt);
+        jdbcTemplate.update(MOVE_SUBTASKS, ids, archivedAt);
+        int moved = jdbcTemplate.update(MOVE_TASKS, ids, archivedAt);
+        jdbcTemplate.update(MOVE_REMINDERS, ids, archivedAt);
+        jdbcTemplate.update(MOVE_LOCATIONS, ids, archivedAt);
+        return moved;
+    }
+}
@@ -0,0 +1,59 @@
+package ru.tcai.taskservice.repository;
+
+import lombok.RequiredArgsConstructor;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.RowMapper;
+import org.springframework.stereotype.Repository;
+import ru.tcai.taskservice.dto.projection.TaskView;
+import ru.tcai.taskservice.dto.request.InboxSort;
+
+import java.util.List;
+
+/**
+ * A user's inbox: the tasks they authored, the tasks assigned to them and
+ * the tasks of their groups, deduplicated and sorted in one query. Each arm
+ * of the union is a scan of one of the per-type partial indexes; only the
+ * matching rows are joined and sorted.
+ */
+@Repository
+@RequiredArgsConstructor
+public class TaskInboxRepository {
+
+    // Arms carry created_at so that the join below is a primary key lookup in one partition
+    private static final String SELECT_INBOX = "WITH inbox AS (" +
+            "SELECT id, created_at FROM task WHERE task_type = 0 AND author = ? " +
+            "UNION " +
+            "SELECT id, created_at FROM task WHERE task_type = 0 AND doer = ? " +
+            "UNION " +
+            "SELECT id, created_at FROM task WHERE task_type = 0 AND group_id = ANY (?)) " +
+            "SELECT t.id, t.title, t.description, t.task_type, t.author, t.group_id, t.doer, t.status, " +
+            "t.priority, t.created_at, t.comment_count, t.last_comment_at, t.subtasks_total, t.subtasks_done, " +
+            "p.id AS point_id, p.latitude, p.longitude, p.name, l.remind_by_location, " +
+            "r.id AS reminder_id, r.time, r.remind_by_time " +
+            "FROM inbox i " +
+            "JOIN task t ON t.id = i.id AND t.created_at = i.created_at " +
+            "LEFT JOIN location l ON l.id = t.location_id " +
+            "LEFT JOIN location_point p ON p.id = l.point_id " +
+            "LEFT JOIN reminder r ON r.id = t.deadline_id ";
+
+    // Same normalisation as the service applies on write: anything unknown ranks as MIDDLE
+    private static final String PRIORITY_RANK =
+            "CASE t.priority WHEN 'HIGH' THEN 0 WHEN 'LOW' THEN 2 ELSE 1 END";
+
+    private static final String BY_DEADLINE = "ORDER BY r.deadline_at NULLS LAST, t.id ";
+
+    private static final String BY_PRIORITY = "ORDER BY " + PRIORITY_RANK + ", r.deadline_at NULLS LAST, t.id ";
+
+    private static final String PAGE = "LIMIT ? OFFSET ?";
+
+    private static final RowMapper<TaskView> VIEW_MAPPER = new TaskViewRowMapper();
+
+    private final JdbcTemplate jdbcTemplate;
+
+    public List<TaskView> findInbox(Long userId, List<Long> groupIds, InboxSort sort, long offset, int limit) {
+        String order = sort == InboxSort.PRIORITY ? BY_PRIORITY : BY_DEADLINE;
+        Long[] groups = groupIds.toArray(new Long[0]);
+        return jdbcTemplate.query(SELECT_INBOX + order + PAGE, VIEW_MAPPER,
+                userId, userId, groups, limit, offset);
+    }
+}
@@ -0,0 +1,92 @@
+package ru.tcai.taskservice.repository;
+
+import lombok.RequiredArgsConstructor;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.RowMapper;
+import org.springframework.stereotype.Repository;
+import ru.tcai.taskservice.dto.response.TaskEventResponse;
+import ru.tcai.taskservice.dto.response.TaskOutboxMessage;
+
+import java.time.LocalDateTime;
+import java.util.List;
+
+@Repository
+@RequiredArgsConstructor
+public class TaskOutboxRepository {
+
+    private static final String INSERT_EVENT = "INSERT INTO task_outbox " +
+            "(event_type, task_id, task_type, group_id, previous_group_id, author_id, doer_id) " +
+            "VALUES (?, ?, ?, ?, ?, ?, ?)";
+
+    // Comment events only copy the routing columns; reading them without a row lock keeps comments write-behind
+    private static final String INSERT_EVENT_FROM_ROW = "INSERT INTO task_outbox " +
+            "(event_type, task_id, task_type, group_id, author_id, doer_id) " +
+            "SELECT ?, id, task_type, group_id, author, doer FROM task WHERE id = ?";
+
+    // Relays on other instances skip the run instead of waiting for the lock
+    private static final String TRY_RELAY_LOCK = "SELECT pg_try_advisory_xact_lock(hashtext('task_outbox_relay'))";
+
+    private static final String SELECT_BATCH = "SELECT id, event_type, task_id, task_type, group_id, " +
+            "previous_group_id, author_id, doer_id, created_at FROM task_outbox ORDER BY id LIMIT ?";
+
+    private static final String DELETE_DELIVERED = "DELETE FROM task_outbox WHERE id = ANY (?)";
+
+    private static final String SELECT_LAG = "SELECT extract(epoch FROM clock_timestamp()::timestamp - created_at) " +
+            "FROM task_outbox ORDER BY id LIMIT 1";
+
+    private static final RowMapper<TaskOutboxMessage> MESSAGE_MAPPER = (rs, rowNum) -> TaskOutboxMessage.builder()
+            .id(rs.getLong("id"))
+            .occurredAt(rs.getObject("created_at", LocalDateTime.class))
+            .event(TaskEventResponse.builder()
+                    .type(rs.getString("event_type"))
+                    .taskId(rs.getLong("task_id"))
+                    .taskType(rs.getObject("task_type", Long.class))
+                    .groupId(rs.getObject("group_id", Long.class))
+                    .previousGroupId(rs.getObject("previous_group_id", Long.class))
+                    .authorId(rs.getObject("author_id", Long.class))
+                    .doerId(rs.getObject("doer_id", Long.class))
+                    .build())
+            .build();
+
+    private final JdbcTemplate jdbcTemplate;
+
+    public void append(TaskEventResponse event) {
+        jdbcTemplate.update(INSERT_EVENT, event.getType(), event.getTaskId(), event.getTaskType(), event.getGroupId(),
+                event.getPreviousGroupId(), event.getAuthorId(), event.getDoerId());
+    }
+
+    public void appendAll(List<TaskEventResponse> events) {
+        jdbcTemplate.batchUpdate(INSERT_EVENT, events.stream()
+                .map(event -> new Object[]{event.getType(), event.getTaskId(), event.getTaskType(), event.getGroupId(),
+                        event.getPreviousGroupId(), event.getAuthorId(), event.getDoerId()})
+                .toList());
+    }
+
+    public void appendFromRow(String type, Long taskId) {
+        jdbcTemplate.update(INSERT_EVENT_FROM_ROW, type, taskId);
+    }
+
+    /**
+     * Takes the relay lock for the current transaction; false when another
+     * instance is relaying.
+     */
+    public boolean tryRelayLock() {
+        return Boolean.TRUE.equals(jdbcTemplate.queryForObject(TRY_RELAY_LOCK, Boolean.class));
+    }
+
+    public List<TaskOutboxMessage> findBatch(int limit) {
+        return jdbcTemplate.query(SELECT_BATCH, MESSAGE_MAPPER, limit);
+    }
+
+    public int delete(List<Long> ids) {
+        return jdbcTemplate.update(DELETE_DELIVERED, (Object) ids.toArray(new Long[0]));
+    }
+
+    /**
+     * Age in seconds of the oldest undelivered event, 0 when the outbox is empty.
+     */
+    public double lagSeconds() {
+        List<Double> lag = jdbcTemplate.queryForList(SELECT_LAG, Double.class);
+        return lag.isEmpty() || lag.get(0) == null ? 0 : lag.get(0);
+    }
+}
@@ -1,20 +1,150 @@
 package ru.tcai.taskservice.repository;
 
+import jakarta.persistence.LockModeType;
+import jakarta.persistence.QueryHint;
+import org.hibernate.jpa.HibernateHints;
+import ru.tcai.taskservice.dto.projection.TaskView;
 import ru.tcai.taskservice.entity.Task;
 import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Lock;
+import org.springframework.data.jpa.repository.Modifying;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.jpa.repository.QueryHints;
+import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
+import org.springframework.transaction.annotation.Transactional;
 
+import java.time.LocalDateTime;
+import java.util.Collection;
 import java.util.List;
+import java.util.Optional;
+import java.util.stream.Stream;
 
 @Repository
 public interface TaskRepository extends JpaRepository<Task, Long> {
-    List<Task> findByGroupIdIsNullAndAuthorId(Long authorId);
+    String STREAM_FETCH_SIZE = "256";
 
-    List<Task> findByGroupIdIsNullAndAuthorIdAndTaskType(Long authorId, Integer taskType);
+    String TASK_VIEW_SELECT = "select new ru.tcai.taskservice.dto.projection.TaskView(" +
+            "t.id, t.title, t.description, t.taskType, t.authorId, t.groupId, t.doerId, " +
+            "t.status, t.priority, t.createdAt, t.commentCount, t.lastCommentAt, " +
+            "t.subtasksTotal, t.subtasksDone, " +
+            "p.id, p.latitude, p.longitude, p.name, l.remindByLocation, " +
+            "r.id, r.time, r.remindByTime) " +
+            "from Task t " +
+            "left join Location l on l.id = t.location_id " +
+            "left join LocationPoint p on p.id = l.point_id " +
+            "left join Reminder r on r.id = t.deadline_id ";
 
-    List<Task> findByAuthorIdAndTaskType(Long authorId, Integer taskType);
+    // Type is inlined rather than bound so that generic plans can still use the per-type partial indexes
+    String TASKS = "t.taskType = 0 ";
 
-    List<Task> findByGroupIdAndTaskType(Long groupId, Integer taskType);
+    String NOTES = "t.taskType = 1 ";
 
-    List<Task> findByDoerIdAndTaskType(Long doerId, Integer taskType);
+    @Query(TASK_VIEW_SELECT + "where t.id = :id")
+    Optional<TaskView> findViewById(@Param("id") Long id);
+
+    // Writers that derive stats or events from the row they change read it with this, so the snapshot stays current
+    @Lock(LockModeType.PESSIMISTIC_WRITE)
+    @Query("select t from Task t where t.id = :id")
+    Optional<Task> findByIdForUpdate(@Param("id") Long id);
+
+    @Query(TASK_VIEW_SELECT + "where t.id in :ids")
+    List<TaskView> findViewsByIdIn(@Param("ids") Collection<Long> ids);
+
+    @Query(TASK_VIEW_SELECT + "where " + TASKS + "and t.groupId is null and t.authorId = :authorId order by t.id")
+    List<TaskView> findPersonalTaskViewsByAuthorId(@Param("authorId") Long authorId);
+
+    @Query(TASK_VIEW_SELECT + "where " + TASKS + "and t.authorId = :authorId order by t.id")
+    List<TaskView> findTaskViewsByAuthorId(@Param("authorId") Long authorId);
+
+    @Query(TASK_VIEW_SELECT + "where " + TASKS + "and t.groupId = :groupId order by t.id")
+    List<TaskView> findTaskViewsByGroupId(@Param("groupId") Long groupId);
+
+    @Query(TASK_VIEW_SELECT + "where " + TASKS + "and t.doerId = :doerId order by t.id")
+    List<TaskView> findTaskViewsByDoerId(@Param("doerId") Long doerId);
+
+    @QueryHints(@QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = STREAM_FETCH_SIZE))
+    @Query(TASK_VIEW_SELECT + "where " + TASKS + "and t.groupId is null and t.authorId = :authorId order by t.id")
+    Stream<TaskView> streamPersonalTaskViewsByAuthorId(@Param("authorId") Long authorId);
+
+    @QueryHints(@QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = STREAM_FETCH_SIZE))
+    @Query(TASK_VIEW_SELECT + "where " + TASKS + "and t.authorId = :authorId order by t.id")
+    Stream<TaskView> streamTaskViewsByAuthorId(@Param("authorId") Long authorId);
+
+    @QueryHints(@QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = STREAM_FETCH_SIZE))
+    @Query(TASK_VIEW_SELECT + "where " + TASKS + "and t.groupId = :groupId order by t.id")
+    Stream<TaskView> streamTaskViewsByGroupId(@Param("groupId") Long groupId);
+
+    @QueryHints(@QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = STREAM_FETCH_SIZE))
+    @Query(TASK_VIEW_SELECT + "where " + TASKS + "and t.doerId = :doerId order by t.id")
+    Stream<TaskView> streamTaskViewsByDoerId(@Param("doerId") Long doerId);
+
+    @Query(TASK_VIEW_SELECT + "where " + NOTES + "and t.groupId is null and t.authorId = :authorId order by t.id")
+    List<TaskView> findPersonalNoteViewsByAuthorId(@Param("authorId") Long authorId);
+
+    @Query(TASK_VIEW_SELECT + "where " + NOTES + "and t.authorId = :authorId order by t.id")
+    List<TaskView> findNoteViewsByAuthorId(@Param("authorId") Long authorId);
+
+    @Query(TASK_VIEW_SELECT + "where " + NOTES + "and t.groupId = :groupId order by t.id")
+    List<TaskView> findNoteViewsByGroupId(@Param("groupId") Long groupId);
+
+    @QueryHints(@QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = STREAM_FETCH_SIZE))
+    @Query(TASK_VIEW_SELECT + "where " + NOTES + "and t.groupId is null and t.authorId = :authorId order by t.id")
+    Stream<TaskView> streamPersonalNoteViewsByAuthorId(@Param("authorId") Long authorId);
+
+    @QueryHints(@QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = STREAM_FETCH_SIZE))
+    @Query(TASK_VIEW_SELECT + "where " + NOTES + "and t.authorId = :authorId order by t.id")
+    Stream<TaskView> streamNoteViewsByAuthorId(@Param("authorId") Long authorId);
+
+    @QueryHints(@QueryHint(name = HibernateHints.HINT_FETCH_SIZE, value = STREAM_FETCH_SIZE))
+    @Query(TASK_VIEW_SELECT + "where " + NOTES + "and t.groupId = :groupId order by t.id")
+    Stream<TaskView> streamNoteViewsByGroupId(@Param("groupId") Long groupId);
+
+    @Query("select t, s from Task t left join Subtask s on s.taskId = t.id " +
+            "where t.id = :taskId order by s.id")
+    List<Object[]> findTaskWithSubtasks(@Param("taskId") Long taskId);
+
+    @Query("select max(t.id) from Task t")
+    Long findMaxId();
+
+    @Modifying(flushAutomatically = true, clearAutomatically = true)
+    @Query("update Task t set t.commentCount = coalesce(t.commentCount, 0) + :comments, " +
+            "t.lastCommentAt = case when t.lastCommentAt is null or t.lastCommentAt < :commentedAt " +
+            "then :commentedAt else t.lastCommentAt end, " +
+            "t.updatedAt = case when t.updatedAt is null or t.updatedAt < :commentedAt " +
+            "then :commentedAt else t.updatedAt end " +
+            "where t.id = :taskId")
+    int addCommentActivity(@Param("taskId") Long taskId,
+                           @Param("comments") int comments,
+                           @Param("commentedAt") LocalDateTime commentedAt);
+
+    @Modifying(flushAutomatically = true, clearAutomatically = true)
+    @Query("update Task t set t.subtasksTotal = coalesce(t.subtasksTotal, 0) + :totalDelta, " +
+            "t.subtasksDone = coalesce(t.subtasksDone, 0) + :doneDelta, t.updatedAt = :updatedAt " +
+            "where t.id = :taskId")
+    int adjustSubtaskProgress(@Param("taskId") Long taskId,
+                              @Param("totalDelta") int totalDelta,
+                              @Param("doneDelta") int doneDelta,
+                              @Param("updatedAt") LocalDateTime updatedAt);
+
+    @Modifying(flushAutomatically = true, clearAutomatically = true)
+    @Query(value = "UPDATE task SET comment_count = GREATEST(COALESCE(comment_count, 0) - 1, 0), " +
+            "last_comment_at = (SELECT MAX(c.created_at) FROM comment c WHERE c.task_id = :taskId " +
+            "AND c.created_at >= (SELECT t.created_at FROM task t WHERE t.id = :taskId)) " +
+            "WHERE id = :taskId", nativeQuery = true)
+    int decrementCommentCount(@Param("taskId") Long taskId);
+
+    @Transactional
+    @Modifying
+    @Query(value = "UPDATE task t SET comment_count = s.comment_count, last_comment_at = s.last_comment_at " +
+            "FROM (SELECT tt.id, COUNT(c.id) AS comment_count, MAX(c.created_at) AS last_comment_at " +
+            "      FROM task tt LEFT JOIN comment c ON c.task_id = tt.id AND c.created_at >= tt.created_at " +
+            "      WHERE tt.id BETWEEN :fromId AND :toId GROUP BY tt.id) s " +
+            // Comments this recent may still be buffered on another instance and counted again by its flush
+            "WHERE t.id = s.id AND (s.last_comment_at IS NULL OR s.last_comment_at < :settledBefore) " +
+            "AND (t.comment_count IS DISTINCT FROM s.comment_count " +
+            "OR t.last_comment_at IS DISTINCT FROM s.last_comment_at)", nativeQuery = true)
+    int reconcileCommentCounts(@Param("fromId") Long fromId,
+                               @Param("toId") Long toId,
+                               @Param("settledBefore") LocalDateTime settledBefore);
 }
@@ -0,0 +1,42 @@
+package ru.tcai.taskservice.repository;
+
+import org.springframework.jdbc.core.RowMapper;
+import ru.tcai.taskservice.dto.projection.TaskView;
+
+import java.sql.ResultSet;
+import java.sql.SQLException;
+import java.time.LocalDateTime;
+
+/**
+ * Maps a task row joined with its location point and reminder, as selected
+ * by the archive and inbox queries, to a {@link TaskView}.
+ */
+public class TaskViewRowMapper implements RowMapper<TaskView> {
+
+    @Override
+    public TaskView mapRow(ResultSet rs, int rowNum) throws SQLException {
+        return new TaskView(
+                rs.getLong("id"),
+                rs.getString("title"),
+                rs.getString("description"),
+                rs.getObject("task_type", Long.class),
+                rs.getObject("author", Long.class),
+                rs.getObject("group_id", Long.class),
+                rs.getObject("doer", Long.class),
+                rs.getString("status"),
+                rs.getString("priority"),
+                rs.getObject("created_at", LocalDateTime.class),
+                rs.getObject("comment_count", Integer.class),
+                rs.getObject("last_comment_at", LocalDateTime.class),
+                rs.getObject("subtasks_total", Integer.class),
+                rs.getObject("subtasks_done", Integer.class),
+                rs.getObject("point_id", Long.class),
+                rs.getObject("latitude", Double.class),
+                rs.getObject("longitude", Double.class),
+                rs.getString("name"),
+                rs.getObject("remind_by_location", Boolean.class),
+                rs.getObject("reminder_id", Long.class),
+                rs.getString("time"),
+                rs.getObject("remind_by_time", Boolean.class));
+    }
+}
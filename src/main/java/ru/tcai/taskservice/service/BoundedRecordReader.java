@@ -0,0 +1,78 @@
+package ru.tcai.taskservice.service;
+
+import java.io.IOException;
+import java.io.Reader;
+
+/**
+ * Splits input into newline-terminated records without holding more than
+ * {@code maxLength} characters of one. A longer record is skipped up to its
+ * end and reported through {@link #isTooLong()} instead of being returned.
+ * In CSV mode a newline inside a quoted value does not end the record.
+ */
+class BoundedRecordReader {
+
+    private final Reader reader;
+    private final int maxLength;
+    private final boolean csv;
+    private final char[] buffer = new char[8192];
+    private final StringBuilder record = new StringBuilder();
+    private int position;
+    private int limit;
+    private boolean tooLong;
+
+    BoundedRecordReader(Reader reader, int maxLength, boolean csv) {
+        this.reader = reader;
+        this.maxLength = maxLength;
+        this.csv = csv;
+    }
+
+    /**
+     * The next record without its line terminator, null at the end of input.
+     * Returns an empty string for a record that was too long.
+     */
+    String next() throws IOException {
+        record.setLength(0);
+        tooLong = false;
+        boolean quoted = false;
+        boolean read = false;
+        while (true) {
+            if (position == limit) {
+                limit = reader.read(buffer);
+                position = 0;
+                if (limit <= 0) {
+                    limit = 0;
+                    break;
+                }
+            }
+            read = true;
+            char c = buffer[position++];
+            if (c == '\n' && !quoted) {
+                break;
+            }
+            if (csv && c == '"') {
+                quoted = !quoted;
+            }
+            if (tooLong) {
+                continue;
+            }
+            if (record.length() >= maxLength) {
+                tooLong = true;
+                record.setLength(0);
+                continue;
+            }
+            record.append(c);
+        }
+        if (!read) {
+            return null;
+        }
+        int length = record.length();
+        if (length > 0 && record.charAt(length - 1) == '\r') {
+            record.setLength(length - 1);
+        }
+        return record.toString();
+    }
+
+    boolean isTooLong() {
+        return tooLong;
+    }
+}
@@ -0,0 +1,137 @@
+package ru.tcai.taskservice.service;
+
+import jakarta.annotation.PreDestroy;
+import lombok.AllArgsConstructor;
+import lombok.Getter;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+import org.springframework.transaction.support.TransactionTemplate;
+import ru.tcai.taskservice.config.CommentActivityProperties;
+import ru.tcai.taskservice.repository.TaskRepository;
+
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
+import java.util.concurrent.ConcurrentHashMap;
+
+@Slf4j
+@Component
+public class CommentActivityBuffer {
+
+    private final TaskRepository taskRepository;
+    private final TransactionTemplate transactionTemplate;
+    private final CommentActivityProperties properties;
+    private final ConcurrentHashMap<Long, PendingActivity> pending = new ConcurrentHashMap<>();
+
+    public CommentActivityBuffer(TaskRepository taskRepository,
+                                 PlatformTransactionManager transactionManager,
+                                 CommentActivityProperties properties) {
+        this.taskRepository = taskRepository;
+        this.transactionTemplate = new TransactionTemplate(transactionManager);
+        this.properties = properties;
+    }
+
+    public boolean isEnabled() {
+        return properties.isWriteBehind();
+    }
+
+    public void recordComment(Long taskId, LocalDateTime commentedAt) {
+        if (!TransactionSynchronizationManager.isSynchronizationActive()) {
+            merge(taskId, new PendingActivity(1, commentedAt));
+            return;
+        }
+
+        // Only count comments whose insert actually committed
+        TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+            @Override
+            public void afterCommit() {
+                merge(taskId, new PendingActivity(1, commentedAt));
+            }
+        });
+    }
+
+    @Scheduled(fixedDelayString = "${task-service.comments.activity.flush-interval-ms:200}")
+    public void flush() {
+        if (pending.isEmpty()) {
+            return;
+        }
+
+        // Sorted so that concurrent flushers on other instances lock rows in the same order
+        List<Long> taskIds = new ArrayList<>(pending.keySet());
+        Collections.sort(taskIds);
+
+        for (Long taskId : taskIds) {
+            PendingActivity activity = pending.remove(taskId);
+            if (activity == null) {
+                continue;
+            }
+            try {
+                transactionTemplate.executeWithoutResult(status ->
+                        taskRepository.addCommentActivity(taskId, activity.getComments(), activity.getLastCommentAt()));
+            } catch (RuntimeException e) {
+                log.warn("Failed to flush comment activity for task with ID: {}, will retry", taskId, e);
+                merge(taskId, activity);
+            }
+        }
+    }
+
+    /**
+     * Applies the comments still buffered for one task, in the caller's
+     * transaction when there is one. Called before the count is decremented,
+     * which would otherwise be clamped at zero underneath pending increments.
+     */
+    public void flush(Long taskId) {
+        PendingActivity activity = pending.remove(taskId);
+        if (activity == null) {
+            return;
+        }
+
+        if (!TransactionSynchronizationManager.isSynchronizationActive()) {
+            try {
+                transactionTemplate.executeWithoutResult(status ->
+                        taskRepository.addCommentActivity(taskId, activity.getComments(), activity.getLastCommentAt()));
+            } catch (RuntimeException e) {
+                merge(taskId, activity);
+                throw e;
+            }
+            return;
+        }
+
+        // Put back if the caller's transaction does not commit
+        TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+            @Override
+            public void afterCompletion(int status) {
+                if (status != STATUS_COMMITTED) {
+                    merge(taskId, activity);
+                }
+            }
+        });
+        taskRepository.addCommentActivity(taskId, activity.getComments(), activity.getLastCommentAt());
+    }
+
+    @PreDestroy
+    public void flushOnShutdown() {
+        flush();
+    }
+
+    private void merge(Long taskId, PendingActivity activity) {
+        pending.merge(taskId, activity, PendingActivity::combine);
+    }
+
+    @Getter
+    @AllArgsConstructor
+    private static class PendingActivity {
+        private final int comments;
+        private final LocalDateTime lastCommentAt;
+
+        private PendingActivity combine(PendingActivity other) {
+            LocalDateTime latest = lastCommentAt.isAfter(other.lastCommentAt) ? lastCommentAt : other.lastCommentAt;
+            return new PendingActivity(comments + other.comments, latest);
+        }
+    }
+}
@@ -0,0 +1,11 @@
+package ru.tcai.taskservice.service;
+
+import ru.tcai.taskservice.dto.request.ExportFormat;
+
+import java.io.OutputStream;
+
+public interface TaskExportService {
+    void exportGroup(Long groupId, ExportFormat format, boolean includeComments, OutputStream outputStream);
+
+    void exportUser(Long userId, ExportFormat format, boolean includeComments, OutputStream outputStream);
+}
@@ -0,0 +1,77 @@
+package ru.tcai.taskservice.service;
+
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.postgresql.PGConnection;
+import org.postgresql.copy.CopyManager;
+import org.springframework.stereotype.Service;
+import ru.tcai.taskservice.dto.request.ExportFormat;
+import ru.tcai.taskservice.exception.ExportFailedException;
+
+import javax.sql.DataSource;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.sql.Connection;
+import java.sql.SQLException;
+
+@Service
+@RequiredArgsConstructor
+@Slf4j
+public class TaskExportServiceImpl implements TaskExportService {
+
+    private static final String EXPORT_COLUMNS = "SELECT t.id AS \"id\", t.task_type AS \"taskType\", " +
+            "t.title AS \"title\", t.description AS \"description\", t.author AS \"authorId\", " +
+            "t.group_id AS \"groupId\", t.doer AS \"doerId\", t.status AS \"status\", t.priority AS \"priority\", " +
+            "t.created_at AS \"createdAt\", t.updated_at AS \"updatedAt\", t.comment_count AS \"commentCount\", " +
+            "t.subtasks_total AS \"subtasksTotal\", t.subtasks_done AS \"subtasksDone\", " +
+            "p.latitude AS \"latitude\", p.longitude AS \"longitude\", p.name AS \"locationName\", " +
+            "l.remind_by_location AS \"remindByLocation\", " +
+            "r.time AS \"deadlineTime\", r.remind_by_time AS \"remindByTime\"";
+
+    private static final String EXPORT_COMMENTS = ", (SELECT json_agg(json_build_object(" +
+            "'id', c.id, 'authorId', c.author_id, 'text', c.text, 'createdAt', c.created_at) ORDER BY c.id) " +
+            "FROM comment c WHERE c.task_id = t.id AND c.created_at >= t.created_at) AS \"comments\"";
+
+    private static final String EXPORT_FROM = " FROM task t " +
+            "LEFT JOIN location l ON l.id = t.location_id " +
+            "LEFT JOIN location_point p ON p.id = l.point_id " +
+            "LEFT JOIN reminder r ON r.id = t.deadline_id ";
+
+    private final DataSource dataSource;
+
+    @Override
+    public void exportGroup(Long groupId, ExportFormat format, boolean includeComments, OutputStream outputStream) {
+        log.info("Exporting group with ID: {} as {}", groupId, format);
+        export("t.group_id = " + groupId, format, includeComments, outputStream);
+    }
+
+    @Override
+    public void exportUser(Long userId, ExportFormat format, boolean includeComments, OutputStream outputStream) {
+        log.info("Exporting user with ID: {} as {}", userId, format);
+        export("t.author = " + userId, format, includeComments, outputStream);
+    }
+
+    private void export(String condition, ExportFormat format, boolean includeComments, OutputStream outputStream) {
+        // COPY does not accept bind parameters; the condition is built from Long ids only
+        String select = EXPORT_COLUMNS + (includeComments ? EXPORT_COMMENTS : "") + EXPORT_FROM +
+                "WHERE " + condition + " ORDER BY t.id";
+
+        String copy;
+        if (format == ExportFormat.CSV) {
+            copy = "COPY (" + select + ") TO STDOUT WITH (FORMAT csv, HEADER)";
+        } else {
+            // CSV mode with quote/delimiter bytes that never occur in JSON passes each document
+            // through verbatim, whereas text mode would escape its backslashes
+            copy = "COPY (SELECT row_to_json(x) FROM (" + select + ") x) TO STDOUT " +
+                    "WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')";
+        }
+
+        try (Connection connection = dataSource.getConnection()) {
+            CopyManager copyManager = connection.unwrap(PGConnection.class).getCopyAPI();
+            long rows = copyManager.copyOut(copy, outputStream);
+            log.info("Exported {} rows", rows);
+        } catch (SQLException | IOException e) {
+            throw new ExportFailedException("Export failed: " + e.getMessage(), e);
+        }
+    }
+}
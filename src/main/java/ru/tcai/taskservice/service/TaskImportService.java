@@ -0,0 +1,13 @@
+package ru.tcai.taskservice.service;
+
+import ru.tcai.taskservice.dto.request.ImportFormat;
+import ru.tcai.taskservice.dto.request.ImportType;
+import ru.tcai.taskservice.dto.response.ImportEventResponse;
+
+import java.io.InputStream;
+import java.util.function.Consumer;
+
+public interface TaskImportService {
+    ImportEventResponse importRecords(InputStream inputStream, ImportType type, ImportFormat format,
+                                      Consumer<ImportEventResponse> listener);
+}
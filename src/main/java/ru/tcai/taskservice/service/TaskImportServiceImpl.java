@@ -0,0 +1,451 @@
+package ru.tcai.taskservice.service;
+
+import com.fasterxml.jackson.core.JsonProcessingException;
+import com.fasterxml.jackson.core.type.TypeReference;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.fasterxml.jackson.databind.ObjectReader;
+import com.fasterxml.jackson.dataformat.csv.CsvMapper;
+import com.fasterxml.jackson.dataformat.csv.CsvSchema;
+import jakarta.validation.ConstraintViolation;
+import jakarta.validation.Validator;
+import lombok.Builder;
+import lombok.Data;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.support.TransactionTemplate;
+import ru.tcai.taskservice.config.ImportProperties;
+import ru.tcai.taskservice.dto.projection.TaskStatsSnapshot;
+import ru.tcai.taskservice.dto.request.DeadlineRequest;
+import ru.tcai.taskservice.dto.request.ImportFormat;
+import ru.tcai.taskservice.dto.request.ImportType;
+import ru.tcai.taskservice.dto.request.LocationRequest;
+import ru.tcai.taskservice.dto.request.NoteRequest;
+import ru.tcai.taskservice.dto.request.TaskRequest;
+import ru.tcai.taskservice.dto.response.ImportEventResponse;
+import ru.tcai.taskservice.dto.response.TaskEventResponse;
+import ru.tcai.taskservice.events.TaskEventPublisher;
+import ru.tcai.taskservice.events.TaskEventType;
+import ru.tcai.taskservice.repository.SharedLocationPointRepository;
+
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.InputStreamReader;
+import java.io.Reader;
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.function.Consumer;
+import java.util.stream.Collectors;
+
+@Slf4j
+@Service
+public class TaskImportServiceImpl implements TaskImportService {
+
+    private static final String NEXT_IDS =
+            "SELECT nextval(pg_get_serial_sequence(?, 'id')) FROM generate_series(1, ?)";
+
+    private static final String INSERT_LOCATION =
+            "INSERT INTO location (id, point_id, remind_by_location) VALUES (?, ?, ?)";
+
+    private static final String INSERT_REMINDER =
+            "INSERT INTO reminder (id, time, remind_by_time, deadline_at) VALUES (?, ?, ?, ?)";
+
+    private static final String INSERT_TASK = "INSERT INTO task (id, title, description, task_type, location_id, " +
+            "deadline_id, author, group_id, doer, status, priority, comment_count, subtasks_total, subtasks_done, " +
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)";
+
+    // Flat columns as written by the export endpoint, folded back into the request shape
+    private static final Map<String, String[]> NESTED_COLUMNS = Map.of(
+            "latitude", new String[]{"location", "latitude"},
+            "longitude", new String[]{"location", "longitude"},
+            "locationName", new String[]{"location", "name"},
+            "remindByLocation", new String[]{"location", "remindByLocation"},
+            "deadlineTime", new String[]{"deadline", "time"},
+            "remindByTime", new String[]{"deadline", "remindByTime"}
+    );
+
+    private static final Set<String> BOOLEAN_COLUMNS = Set.of("remindByLocation", "remindByTime");
+
+    private static final TypeReference<LinkedHashMap<String, Object>> RECORD_TYPE = new TypeReference<>() {};
+
+    private final ObjectMapper objectMapper;
+    private final CsvMapper csvMapper = new CsvMapper();
+    private final Validator validator;
+    private final JdbcTemplate jdbcTemplate;
+    private final TransactionTemplate transactionTemplate;
+    private final ImportProperties properties;
+    private final TaskStatsService taskStatsService;
+    private final TaskEventPublisher taskEventPublisher;
+    private final SharedLocationPointRepository sharedLocationPointRepository;
+
+    public TaskImportServiceImpl(ObjectMapper objectMapper,
+                                 Validator validator,
+                                 JdbcTemplate jdbcTemplate,
+                                 PlatformTransactionManager transactionManager,
+                                 ImportProperties properties,
+                                 TaskStatsService taskStatsService,
+                                 TaskEventPublisher taskEventPublisher,
+                                 SharedLocationPointRepository sharedLocationPointRepository) {
+        this.objectMapper = objectMapper;
+        this.validator = validator;
+        this.jdbcTemplate = jdbcTemplate;
+        this.transactionTemplate = new TransactionTemplate(transactionManager);
+        this.properties = properties;
+        this.taskStatsService = taskStatsService;
+        this.taskEventPublisher = taskEventPublisher;
+        this.sharedLocationPointRepository = sharedLocationPointRepository;
+    }
+
+    @Override
+    public ImportEventResponse importRecords(InputStream inputStream, ImportType type, ImportFormat format,
+                                             Consumer<ImportEventResponse> listener) {
+        log.info("Importing {} records as {}", type, format);
+
+        ImportRun run = new ImportRun(type, listener);
+        try (Reader input = new InputStreamReader(inputStream, StandardCharsets.UTF_8)) {
+            BoundedRecordReader reader = new BoundedRecordReader(input, properties.getMaxRecordLength(),
+                    format == ImportFormat.CSV);
+            if (format == ImportFormat.CSV) {
+                readCsv(reader, run);
+            } else {
+                readNdjson(reader, run);
+            }
+        } catch (IOException e) {
+            // Rows accepted before the failure are still written below
+            log.warn("Import input failed at line {}", run.line, e);
+            listener.accept(ImportEventResponse.builder()
+                    .event("error")
+                    .line(run.line)
+                    .message("Failed to read input: " + e.getMessage())
+                    .build());
+        }
+        writeChunk(run);
+
+        log.info("Import finished: {} processed, {} imported, {} failed", run.processed, run.imported, run.failed);
+        ImportEventResponse summary = run.event("summary");
+        listener.accept(summary);
+        return summary;
+    }
+
+    private void readNdjson(BoundedRecordReader reader, ImportRun run) throws IOException {
+        String line;
+        while ((line = reader.next()) != null) {
+            run.line++;
+            if (reader.isTooLong()) {
+                rejectTooLong(run);
+                continue;
+            }
+            if (line.isBlank()) {
+                continue;
+            }
+
+            Map<String, Object> record;
+            try {
+                record = objectMapper.readValue(line, RECORD_TYPE);
+            } catch (JsonProcessingException e) {
+                reject(run, run.line, "Malformed record: " + e.getOriginalMessage());
+                continue;
+            }
+            accept(run, record);
+        }
+    }
+
+    private void readCsv(BoundedRecordReader reader, ImportRun run) throws IOException {
+        String header = reader.next();
+        run.line = 1;
+        if (header == null) {
+            return;
+        }
+        if (reader.isTooLong()) {
+            rejectTooLong(run);
+            return;
+        }
+        // Without a schema a CSV row reads as an array of its cells
+        String[] columns = csvMapper.readerFor(String[].class).readValue(header);
+        CsvSchema.Builder schema = CsvSchema.builder();
+        for (String column : columns) {
+            schema.addColumn(column);
+        }
+        ObjectReader rowReader = csvMapper.readerForMapOf(String.class).with(schema.build());
+
+        String line;
+        while ((line = reader.next()) != null) {
+            // Counts records, so quoted values spanning several lines are not reflected
+            run.line++;
+            if (reader.isTooLong()) {
+                rejectTooLong(run);
+                continue;
+            }
+            if (line.isBlank()) {
+                continue;
+            }
+
+            Map<String, String> row;
+            try {
+                row = rowReader.readValue(line);
+            } catch (JsonProcessingException e) {
+                reject(run, run.line, "Malformed record: " + e.getOriginalMessage());
+                continue;
+            }
+            Map<String, Object> record = new LinkedHashMap<>();
+            for (Map.Entry<String, String> column : row.entrySet()) {
+                String value = column.getValue();
+                if (BOOLEAN_COLUMNS.contains(column.getKey())) {
+                    value = csvBoolean(value);
+                }
+                boolean text = column.getKey().equals("title") || column.getKey().equals("description");
+                // Postgres writes NULL as an empty cell; only text columns keep empty values
+                if (value != null && (text || !value.isEmpty())) {
+                    record.put(column.getKey(), value);
+                }
+            }
+            accept(run, record);
+        }
+    }
+
+    private void rejectTooLong(ImportRun run) {
+        reject(run, run.line, "Record is longer than " + properties.getMaxRecordLength() + " characters");
+    }
+
+    private static String csvBoolean(String value) {
+        if ("t".equals(value)) {
+            return "true";
+        } else if ("f".equals(value)) {
+            return "false";
+        }
+        return value;
+    }
+
+    private void accept(ImportRun run, Map<String, Object> record) {
+        Object request;
+        try {
+            request = objectMapper.convertValue(nestColumns(record),
+                    run.type == ImportType.NOTE ? NoteRequest.class : TaskRequest.class);
+        } catch (IllegalArgumentException e) {
+            reject(run, run.line, "Malformed record: " + e.getMessage());
+            return;
+        }
+
+        Set<ConstraintViolation<Object>> violations = validator.validate(request);
+        if (!violations.isEmpty()) {
+            String message = violations.stream()
+                    .map(violation -> violation.getPropertyPath() + " " + violation.getMessage())
+                    .sorted()
+                    .collect(Collectors.joining("; "));
+            reject(run, run.line, message);
+            return;
+        }
+
+        run.processed++;
+        if (run.type == ImportType.NOTE) {
+            run.chunk.add(noteRow(run.line, (NoteRequest) request));
+        } else {
+            run.chunk.add(taskRow(run.line, (TaskRequest) request));
+        }
+        if (run.chunk.size() >= properties.getChunkSize()) {
+            writeChunk(run);
+        }
+    }
+
+    private void reject(ImportRun run, long line, String message) {
+        run.processed++;
+        run.failed++;
+        run.listener.accept(ImportEventResponse.builder()
+                .event("error")
+                .line(line)
+                .message(message)
+                .build());
+    }
+
+    private void writeChunk(ImportRun run) {
+        if (run.chunk.isEmpty()) {
+            return;
+        }
+
+        List<ImportRow> rows = run.chunk;
+        try {
+            transactionTemplate.executeWithoutResult(status -> insertRows(rows));
+            run.imported += rows.size();
+        } catch (RuntimeException e) {
+            log.warn("Failed to import chunk of {} records ending at line {}", rows.size(), run.line, e);
+            String message = "Chunk rolled back: " + e.getMessage();
+            for (ImportRow row : rows) {
+                run.failed++;
+                run.listener.accept(ImportEventResponse.builder()
+                        .event("error")
+                        .line(row.getLine())
+                        .message(message)
+                        .build());
+            }
+        }
+        run.chunk = new ArrayList<>(properties.getChunkSize());
+        run.listener.accept(run.event("progress"));
+    }
+
+    private void insertRows(List<ImportRow> rows) {
+        List<ImportRow> located = rows.stream().filter(row -> row.getLocation() != null).toList();
+        List<ImportRow> scheduled = rows.stream().filter(row -> row.getDeadline() != null).toList();
+
+        // Ids are reserved up front so that dependent rows can be batched without reading keys back
+        List<Long> locationIds = nextIds("location", located.size());
+        List<Long> reminderIds = nextIds("reminder", scheduled.size());
+        List<Long> taskIds = nextIds("task", rows.size());
+
+        // Points are shared, so a chunk full of the same place resolves to a single row
+        List<Long> pointIds = sharedLocationPointRepository.upsert(
+                located.stream().map(ImportRow::getLocation).toList());
+        List<Object[]> locations = new ArrayList<>(located.size());
+        for (int i = 0; i < located.size(); i++) {
+            ImportRow row = located.get(i);
+            LocationRequest location = row.getLocation();
+            locations.add(new Object[]{locationIds.get(i), pointIds.get(i), location.getRemindByLocation()});
+            row.setLocationId(locationIds.get(i));
+        }
+
+        List<Object[]> reminders = new ArrayList<>(scheduled.size());
+        for (int i = 0; i < scheduled.size(); i++) {
+            ImportRow row = scheduled.get(i);
+            DeadlineRequest deadline = row.getDeadline();
+            reminders.add(new Object[]{reminderIds.get(i), deadline.getTime(), deadline.getRemindByTime(),
+                    TaskStatsServiceImpl.parseDeadline(deadline.getTime())});
+            row.setReminderId(reminderIds.get(i));
+        }
+
+        LocalDateTime now = LocalDateTime.now();
+        List<Object[]> tasks = new ArrayList<>(rows.size());
+        List<TaskEventResponse> events = new ArrayList<>(rows.size());
+        for (int i = 0; i < rows.size(); i++) {
+            ImportRow row = rows.get(i);
+            boolean note = row.getTaskType() == 1L;
+            tasks.add(new Object[]{taskIds.get(i), row.getTitle(), row.getDescription(), row.getTaskType(), row.getLocationId(),
+                    row.getReminderId(), row.getAuthorId(), row.getGroupId(), row.getDoerId(), row.getStatus(),
+                    row.getPriority(), 0, note ? null : 0, note ? null : 0, now, now});
+            events.add(TaskEventResponse.builder()
+                    .type(TaskEventType.CREATED.name())
+                    .taskId(taskIds.get(i))
+                    .taskType(row.getTaskType())
+                    .groupId(row.getGroupId())
+                    .authorId(row.getAuthorId())
+                    .doerId(row.getDoerId())
+                    .build());
+        }
+
+        if (!locations.isEmpty()) {
+            jdbcTemplate.batchUpdate(INSERT_LOCATION, locations);
+        }
+        if (!reminders.isEmpty()) {
+            jdbcTemplate.batchUpdate(INSERT_REMINDER, reminders);
+        }
+        jdbcTemplate.batchUpdate(INSERT_TASK, tasks);
+
+        List<TaskStatsSnapshot> counted = rows.stream()
+                .filter(row -> row.getTaskType() == 0L)
+                .map(row -> new TaskStatsSnapshot(row.getAuthorId(), row.getGroupId(), row.getStatus(),
+                        row.getPriority(), row.getDeadline() != null ? row.getDeadline().getTime() : null))
+                .toList();
+        if (!counted.isEmpty()) {
+            taskStatsService.recordCreated(counted);
+        }
+        taskEventPublisher.publishImported(events);
+    }
+
+    private List<Long> nextIds(String table, int count) {
+        if (count == 0) {
+            return Collections.emptyList();
+        }
+        return jdbcTemplate.queryForList(NEXT_IDS, Long.class, table, count);
+    }
+
+    @SuppressWarnings("unchecked")
+    private Map<String, Object> nestColumns(Map<String, Object> record) {
+        for (Map.Entry<String, String[]> column : NESTED_COLUMNS.entrySet()) {
+            Object value = record.remove(column.getKey());
+            if (value == null) {
+                continue;
+            }
+            String[] path = column.getValue();
+            Object nested = record.computeIfAbsent(path[0], key -> new LinkedHashMap<String, Object>());
+            if (nested instanceof Map) {
+                ((Map<String, Object>) nested).putIfAbsent(path[1], value);
+            }
+        }
+        return record;
+    }
+
+    private ImportRow taskRow(long line, TaskRequest taskRequest) {
+        return ImportRow.builder()
+                .line(line)
+                .title(taskRequest.getTitle())
+                .description(taskRequest.getDescription())
+                .taskType(0L)
+                .authorId(taskRequest.getAuthorId())
+                .groupId(taskRequest.getGroupId())
+                .doerId(taskRequest.getDoerId())
+                .status(TaskServiceImpl.normalizeStatus(taskRequest.getStatus()))
+                .priority(TaskServiceImpl.normalizePriority(taskRequest.getPriority()))
+                .location(taskRequest.getLocation())
+                .deadline(taskRequest.getDeadline())
+                .build();
+    }
+
+    private ImportRow noteRow(long line, NoteRequest noteRequest) {
+        return ImportRow.builder()
+                .line(line)
+                .title(noteRequest.getTitle())
+                .description(noteRequest.getDescription())
+                .taskType(1L)
+                .authorId(noteRequest.getAuthorId())
+                .groupId(noteRequest.getGroupId())
+                .location(noteRequest.getLocation())
+                .build();
+    }
+
+    private static class ImportRun {
+        private final ImportType type;
+        private final Consumer<ImportEventResponse> listener;
+        private List<ImportRow> chunk = new ArrayList<>();
+        private long line;
+        private long processed;
+        private long imported;
+        private long failed;
+
+        private ImportRun(ImportType type, Consumer<ImportEventResponse> listener) {
+            this.type = type;
+            this.listener = listener;
+        }
+
+        private ImportEventResponse event(String event) {
+            return ImportEventResponse.builder()
+                    .event(event)
+                    .processed(processed)
+                    .imported(imported)
+                    .failed(failed)
+                    .build();
+        }
+    }
+
+    @Data
+    @Builder
+    private static class ImportRow {
+        private long line;
+        private String title;
+        private String description;
+        private Long taskType;
+        private Long authorId;
+        private Long groupId;
+        private Long doerId;
+        private String status;
+        private String priority;
+        private LocationRequest location;
+        private DeadlineRequest deadline;
+        private Long locationId;
+        private Long reminderId;
+    }
+}
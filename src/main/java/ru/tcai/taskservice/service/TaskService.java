@@ -4,12 +4,15 @@ import ru.tcai.taskservice.dto.request.*;
 import ru.tcai.taskservice.dto.response.*;
 
 import java.util.List;
+import java.util.function.Consumer;
 
 public interface TaskService {
     TaskResponse createTask(TaskRequest taskRequest);
 
     TaskResponse getTaskById(Long id);
 
+    List<TaskLookupResponse> getTasksByIds(List<Long> ids);
+
     List<TaskResponse> getPersonalTasksByAuthorId(Long authorId);
 
     List<TaskResponse> getTasksByAuthorId(Long authorId);
@@ -18,6 +21,16 @@ public interface TaskService {
 
     List<TaskResponse> getTasksByDoerId(Long doerId);
 
+    TaskPageResponse getInbox(Long userId, List<Long> groupIds, InboxSort sort, int page, int size);
+
+    void streamPersonalTasksByAuthorId(Long authorId, Consumer<TaskResponse> consumer);
+
+    void streamTasksByAuthorId(Long authorId, Consumer<TaskResponse> consumer);
+
+    void streamTasksByGroupId(Long groupId, Consumer<TaskResponse> consumer);
+
+    void streamTasksByDoerId(Long doerId, Consumer<TaskResponse> consumer);
+
     TaskDetailsResponse getTaskDetailsById(Long taskId);
 
     TaskResponse updateTask(Long id, UpdateTaskRequest updateTaskRequest);
@@ -28,6 +41,14 @@ public interface TaskService {
 
     void deleteComment(Long id);
 
+    SubtaskResponse addSubtask(Long taskId, SubtaskRequest subtaskRequest);
+
+    List<SubtaskResponse> getSubtasksByTaskId(Long taskId);
+
+    SubtaskResponse updateSubtaskStatus(Long subtaskId, SubtaskStatusRequest subtaskStatusRequest);
+
+    void deleteSubtask(Long subtaskId);
+
     void deleteTask(Long id);
 
     NoteResponse createNote(NoteRequest noteRequest);
@@ -44,5 +65,11 @@ public interface TaskService {
 
     List<NoteResponse> getNotesByGroupId(Long groupId);
 
+    void streamPersonalNotesByAuthorId(Long authorId, Consumer<NoteResponse> consumer);
+
+    void streamNotesByAuthorId(Long authorId, Consumer<NoteResponse> consumer);
+
+    void streamNotesByGroupId(Long groupId, Consumer<NoteResponse> consumer);
+
     NoteDetailsResponse getNoteDetailsById(Long id);
 }
\ No newline at end of file
@@ -1,11 +1,20 @@
 package ru.tcai.taskservice.service;
 
+import ru.tcai.taskservice.aspect.Coalesced;
+import ru.tcai.taskservice.config.LoggingProperties;
+import ru.tcai.taskservice.config.MultiGetProperties;
+import ru.tcai.taskservice.dto.projection.TaskStatsSnapshot;
+import ru.tcai.taskservice.dto.projection.TaskView;
 import ru.tcai.taskservice.dto.request.*;
 import ru.tcai.taskservice.dto.response.*;
 import ru.tcai.taskservice.entity.*;
+import ru.tcai.taskservice.events.TaskEventPublisher;
+import ru.tcai.taskservice.events.TaskEventType;
 import ru.tcai.taskservice.exception.CommentNotFoundException;
 import ru.tcai.taskservice.exception.NoteNotFoundException;
+import ru.tcai.taskservice.exception.SubtaskNotFoundException;
 import ru.tcai.taskservice.exception.TaskNotFoundException;
+import ru.tcai.taskservice.exception.TooManyIdsException;
 import ru.tcai.taskservice.repository.*;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
@@ -13,8 +22,15 @@ import org.springframework.stereotype.Service;
 import org.springframework.transaction.annotation.Transactional;
 
 import java.time.LocalDateTime;
+import java.util.HashMap;
+import java.util.LinkedHashSet;
 import java.util.List;
+import java.util.Map;
+import java.util.Objects;
+import java.util.Set;
+import java.util.function.Consumer;
 import java.util.stream.Collectors;
+import java.util.stream.Stream;
 
 @Service
 @RequiredArgsConstructor
@@ -22,11 +38,22 @@ import java.util.stream.Collectors;
 @Transactional
 public class TaskServiceImpl implements TaskService {
 
+    static final int MAX_INBOX_PAGE_SIZE = 200;
+
     private final TaskRepository taskRepository;
     private final LocationRepository locationRepository;
     private final LocationPointRepository locationPointRepository;
+    private final SharedLocationPointRepository sharedLocationPointRepository;
     private final ReminderRepository reminderRepository;
     private final CommentRepository commentRepository;
+    private final SubtaskRepository subtaskRepository;
+    private final TaskArchiveRepository taskArchiveRepository;
+    private final TaskInboxRepository taskInboxRepository;
+    private final CommentActivityBuffer commentActivityBuffer;
+    private final TaskStatsService taskStatsService;
+    private final TaskEventPublisher taskEventPublisher;
+    private final LoggingProperties loggingProperties;
+    private final MultiGetProperties multiGetProperties;
 
     @Override
     public TaskResponse createTask(TaskRequest taskRequest) {
@@ -34,13 +61,7 @@ public class TaskServiceImpl implements TaskService {
 
         Long locationPointId = null;
         if (taskRequest.getLocation() != null) {
-            LocationPoint locationPoint = LocationPoint.builder()
-                    .latitude(taskRequest.getLocation().getLatitude())
-                    .longitude(taskRequest.getLocation().getLongitude())
-                    .name(taskRequest.getLocation().getName())
-                    .build();
-            LocationPoint savedLocationPoint = locationPointRepository.save(locationPoint);
-            locationPointId = savedLocationPoint.getId();
+            locationPointId = sharedLocationPointRepository.upsert(taskRequest.getLocation());
         }
 
         Long locationId = null;
@@ -57,28 +78,15 @@ public class TaskServiceImpl implements TaskService {
         if (taskRequest.getDeadline() != null) {
             Reminder reminder = Reminder.builder()
                     .time(taskRequest.getDeadline().getTime())
+                    .deadlineAt(TaskStatsServiceImpl.parseDeadline(taskRequest.getDeadline().getTime()))
                     .remindByTime(taskRequest.getDeadline().getRemindByTime())
                     .build();
             Reminder savedReminder = reminderRepository.save(reminder);
             reminderId = savedReminder.getId();
         }
 
-        String priority = taskRequest.getPriority();
-        if (priority == null) {
-            priority = "MIDDLE";
-        } else if (!priority.equals("LOW") &&
-                !priority.equals("MIDDLE") &&
-                !priority.equals("HIGH")) {
-            priority = "MIDDLE";
-        }
-
-        String status = taskRequest.getStatus();
-        if (status == null) {
-            status = "UNDONE";
-        } else if (!status.equals("UNDONE") &&
-                !status.equals("DONE")) {
-            status = "UNDONE";
-        }
+        String priority = normalizePriority(taskRequest.getPriority());
+        String status = normalizeStatus(taskRequest.getStatus());
 
         LocalDateTime now = LocalDateTime.now();
 
@@ -93,114 +101,213 @@ public class TaskServiceImpl implements TaskService {
                 .doerId(taskRequest.getDoerId())
                 .status(status)
                 .priority(priority)
+                .commentCount(0)
+                .subtasksTotal(0)
+                .subtasksDone(0)
                 .createdAt(now)
                 .updatedAt(now)
                 .build();
 
 
-        log.info("Try to write task");
+        log.debug("Try to write task");
         Task savedTask = taskRepository.save(task);
         log.info("Created task with ID: {}", savedTask.getId());
 
+        String deadline = taskRequest.getDeadline() != null ? taskRequest.getDeadline().getTime() : null;
+        taskStatsService.recordChange(null, statsSnapshot(savedTask, deadline));
+        taskEventPublisher.publish(TaskEventType.CREATED, savedTask);
+
         return mapTaskToTaskResponse(savedTask);
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public TaskResponse getTaskById(Long id) {
         log.info("Getting task by ID: {}", id);
 
-        Task task = taskRepository.findById(id).orElseThrow(() -> new TaskNotFoundException("Task not found with id: " + id));
+        return taskRepository.findViewById(id)
+                .or(() -> taskArchiveRepository.findViewById(id))
+                .map(this::mapTaskViewToTaskResponse)
+                .orElseThrow(() -> new TaskNotFoundException("Task not found with id: " + id));
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    @Coalesced
+    public List<TaskLookupResponse> getTasksByIds(List<Long> ids) {
+        log.info("Getting {} tasks by ID", ids.size());
+
+        if (ids.size() > multiGetProperties.getMaxIds()) {
+            throw new TooManyIdsException("At most " + multiGetProperties.getMaxIds() + " ids can be requested at once");
+        }
+
+        Set<Long> distinctIds = new LinkedHashSet<>(ids);
+        Map<Long, TaskView> views = new HashMap<>();
+        if (!distinctIds.isEmpty()) {
+            taskRepository.findViewsByIdIn(distinctIds).forEach(view -> views.put(view.getId(), view));
+        }
+        if (views.size() < distinctIds.size()) {
+            List<Long> missing = distinctIds.stream().filter(id -> !views.containsKey(id)).toList();
+            taskArchiveRepository.findViewsByIds(missing).forEach(view -> views.put(view.getId(), view));
+        }
 
-        return mapTaskToTaskResponse(task);
+        return ids.stream()
+                .map(id -> mapTaskViewToTaskLookupResponse(id, views.get(id)))
+                .collect(Collectors.toList());
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public List<TaskResponse> getPersonalTasksByAuthorId(Long authorId) {
         log.info("Getting personal tasks by author ID: {}", authorId);
 
-        List<Task> tasks = taskRepository.findByGroupIdIsNullAndAuthorIdAndTaskType(authorId, 0);
-        return tasks.stream()
-                .map(this::mapTaskToTaskResponse)
+        return taskRepository.findPersonalTaskViewsByAuthorId(authorId).stream()
+                .map(this::mapTaskViewToTaskResponse)
                 .collect(Collectors.toList());
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public List<TaskResponse> getTasksByAuthorId(Long authorId) {
         log.info("Getting tasks by author ID: {}", authorId);
 
-        List<Task> tasks = taskRepository.findByAuthorIdAndTaskType(authorId, 0);
-        return tasks.stream()
-                .map(this::mapTaskToTaskResponse)
+        return taskRepository.findTaskViewsByAuthorId(authorId).stream()
+                .map(this::mapTaskViewToTaskResponse)
                 .collect(Collectors.toList());
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public List<TaskResponse> getTasksByGroupId(Long groupId) {
         log.info("Getting tasks by group ID: {}", groupId);
 
-        List<Task> tasks = taskRepository.findByGroupIdAndTaskType(groupId, 0);
-        return tasks.stream()
-                .map(this::mapTaskToTaskResponse)
+        return taskRepository.findTaskViewsByGroupId(groupId).stream()
+                .map(this::mapTaskViewToTaskResponse)
                 .collect(Collectors.toList());
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public List<TaskResponse> getTasksByDoerId(Long doerId) {
         log.info("Getting tasks by doer ID: {}", doerId);
 
-        List<Task> tasks = taskRepository.findByDoerIdAndTaskType(doerId, 0);
-        return tasks.stream()
-                .map(this::mapTaskToTaskResponse)
+        return taskRepository.findTaskViewsByDoerId(doerId).stream()
+                .map(this::mapTaskViewToTaskResponse)
                 .collect(Collectors.toList());
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
+    public TaskPageResponse getInbox(Long userId, List<Long> groupIds, InboxSort sort, int page, int size) {
+        log.info("Getting inbox for user ID: {} with {} groups", userId, groupIds.size());
+
+        int pageSize = Math.max(1, Math.min(size, MAX_INBOX_PAGE_SIZE));
+        int pageNumber = Math.max(0, page);
+        // One extra row tells whether there is a next page without counting the whole inbox
+        List<TaskResponse> items = taskInboxRepository
+                .findInbox(userId, groupIds, sort, (long) pageNumber * pageSize, pageSize + 1).stream()
+                .map(this::mapTaskViewToTaskResponse)
+                .collect(Collectors.toList());
+        boolean hasMore = items.size() > pageSize;
+
+        return TaskPageResponse.builder()
+                .items(hasMore ? items.subList(0, pageSize) : items)
+                .page(pageNumber)
+                .size(pageSize)
+                .hasMore(hasMore)
+                .build();
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public void streamPersonalTasksByAuthorId(Long authorId, Consumer<TaskResponse> consumer) {
+        log.info("Streaming personal tasks by author ID: {}", authorId);
+
+        try (Stream<TaskView> views = taskRepository.streamPersonalTaskViewsByAuthorId(authorId)) {
+            views.map(this::mapTaskViewToTaskResponse).forEach(consumer);
+        }
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public void streamTasksByAuthorId(Long authorId, Consumer<TaskResponse> consumer) {
+        log.info("Streaming tasks by author ID: {}", authorId);
+
+        try (Stream<TaskView> views = taskRepository.streamTaskViewsByAuthorId(authorId)) {
+            views.map(this::mapTaskViewToTaskResponse).forEach(consumer);
+        }
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public void streamTasksByGroupId(Long groupId, Consumer<TaskResponse> consumer) {
+        log.info("Streaming tasks by group ID: {}", groupId);
+
+        try (Stream<TaskView> views = taskRepository.streamTaskViewsByGroupId(groupId)) {
+            views.map(this::mapTaskViewToTaskResponse).forEach(consumer);
+        }
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public void streamTasksByDoerId(Long doerId, Consumer<TaskResponse> consumer) {
+        log.info("Streaming tasks by doer ID: {}", doerId);
+
+        try (Stream<TaskView> views = taskRepository.streamTaskViewsByDoerId(doerId)) {
+            views.map(this::mapTaskViewToTaskResponse).forEach(consumer);
+        }
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public TaskDetailsResponse getTaskDetailsById(Long taskId) {
         log.info("Getting task by ID: {}", taskId);
 
-        Task task = taskRepository.findById(taskId)
-                .orElseThrow(() -> new TaskNotFoundException("Task not found with id: " + taskId));
+        List<Object[]> rows = taskRepository.findTaskWithSubtasks(taskId);
+        if (rows.isEmpty()) {
+            return taskArchiveRepository.findViewById(taskId)
+                    .map(view -> mapArchivedTaskToTaskDetailsResponse(view,
+                            taskArchiveRepository.findComments(taskId), taskArchiveRepository.findSubtasks(taskId)))
+                    .orElseThrow(() -> new TaskNotFoundException("Task not found with id: " + taskId));
+        }
+
+        Task task = (Task) rows.get(0)[0];
+        List<Subtask> subtasks = rows.stream()
+                .map(row -> (Subtask) row[1])
+                .filter(Objects::nonNull)
+                .collect(Collectors.toList());
 
-        log.info("Task found: {}", task);
-        return mapTaskToTaskDetailsResponse(task);
+        if (loggingProperties.isEntityDumps()) {
+            log.info("Task found: {}", task);
+        }
+        return mapTaskToTaskDetailsResponse(task, subtasks);
     }
 
     @Override
     public TaskResponse updateTask(Long id, UpdateTaskRequest updateTaskRequest) {
         log.info("Updating task with ID: {}", id);
 
-        Task task = taskRepository.findById(id)
+        Task task = taskRepository.findByIdForUpdate(id)
                 .orElseThrow(() -> new TaskNotFoundException("Task not found with id: " + id));
+        TaskStatsSnapshot statsBefore = statsSnapshot(task);
+        Long previousGroupId = task.getGroupId();
 
         // Update location if provided
         if (updateTaskRequest.getLocation() != null) {
-            // First delete existing location and point if they exist
+            // The point may be shared with other locations, unused ones are left to LocationPointCollector
             if (task.getLocation_id() != null) {
-                Location existingLocation = locationRepository.findById(task.getLocation_id()).orElse(null);
-                if (existingLocation != null) {
-                    Long pointIdToDelete = existingLocation.getPoint_id();
-
-                    // Delete location first (child)
-                    locationRepository.deleteById(task.getLocation_id());
-
-                    // Then delete location point (parent)
-                    if (pointIdToDelete != null) {
-                        locationPointRepository.deleteById(pointIdToDelete);
-                    }
-                }
+                locationRepository.deleteById(task.getLocation_id());
             }
 
-            // Create new location point
-            LocationPoint locationPoint = LocationPoint.builder()
-                    .latitude(updateTaskRequest.getLocation().getLatitude())
-                    .longitude(updateTaskRequest.getLocation().getLongitude())
-                    .name(updateTaskRequest.getLocation().getName())
-                    .build();
-            LocationPoint savedLocationPoint = locationPointRepository.save(locationPoint);
-
-            // Create new location
             Location location = Location.builder()
-                    .point_id(savedLocationPoint.getId())
+                    .point_id(sharedLocationPointRepository.upsert(updateTaskRequest.getLocation()))
                     .remindByLocation(updateTaskRequest.getLocation().getRemindByLocation())
                     .build();
             Location savedLocation = locationRepository.save(location);
@@ -216,6 +323,7 @@ public class TaskServiceImpl implements TaskService {
 
             Reminder reminder = Reminder.builder()
                     .time(updateTaskRequest.getDeadline().getTime())
+                    .deadlineAt(TaskStatsServiceImpl.parseDeadline(updateTaskRequest.getDeadline().getTime()))
                     .remindByTime(updateTaskRequest.getDeadline().getRemindByTime())
                     .build();
             Reminder savedReminder = reminderRepository.save(reminder);
@@ -252,6 +360,9 @@ public class TaskServiceImpl implements TaskService {
         Task updatedTask = taskRepository.save(task);
         log.info("Updated task with ID: {}", updatedTask.getId());
 
+        taskStatsService.recordChange(statsBefore, statsSnapshot(updatedTask));
+        taskEventPublisher.publish(TaskEventType.UPDATED, updatedTask, previousGroupId);
+
         return mapTaskToTaskResponse(updatedTask);
     }
 
@@ -259,20 +370,22 @@ public class TaskServiceImpl implements TaskService {
     public CommentResponse addCommentToTask(Long taskId, CommentRequest commentRequest) {
         log.info("Writing comment to task with ID: {}", taskId);
 
-        Task task = taskRepository.findById(taskId)
-                .orElseThrow(() -> new TaskNotFoundException("Task not found with id: " + taskId));
+        LocalDateTime now = LocalDateTime.now();
+
+        if (!recordCommentActivity(taskId, now)) {
+            throw new TaskNotFoundException("Task not found with id: " + taskId);
+        }
 
         Comment comment = Comment.builder()
                 .taskId(taskId)
                 .authorId(commentRequest.getAuthorId())
                 .text(commentRequest.getText())
+                .createdAt(now)
                 .build();
 
         Comment savedComment = commentRepository.save(comment);
 
-        task.setUpdatedAt(LocalDateTime.now());
-        taskRepository.save(task);
-
+        taskEventPublisher.publish(TaskEventType.COMMENTED, taskId);
         log.info("Wrote comment to task with ID: {}", taskId);
 
         return mapCommentToCommentResponse(savedComment);
@@ -282,25 +395,41 @@ public class TaskServiceImpl implements TaskService {
     public CommentResponse addCommentToNote(Long noteId, CommentRequest commentRequest) {
         log.info("Writing comment to note with ID: {}", noteId);
 
-        Task note = taskRepository.findById(noteId)
-                .orElseThrow(() -> new NoteNotFoundException("Note not found with id: " + noteId));
+        LocalDateTime now = LocalDateTime.now();
+
+        if (!recordCommentActivity(noteId, now)) {
+            throw new NoteNotFoundException("Note not found with id: " + noteId);
+        }
 
         Comment comment = Comment.builder()
                 .taskId(noteId)
                 .authorId(commentRequest.getAuthorId())
                 .text(commentRequest.getText())
+                .createdAt(now)
                 .build();
 
         Comment savedComment = commentRepository.save(comment);
 
-        note.setUpdatedAt(LocalDateTime.now());
-        taskRepository.save(note);
-
+        taskEventPublisher.publish(TaskEventType.COMMENTED, noteId);
         log.info("Wrote comment to note with ID: {}", noteId);
 
         return mapCommentToCommentResponse(savedComment);
     }
 
+    private boolean recordCommentActivity(Long taskId, LocalDateTime commentedAt) {
+        if (commentActivityBuffer.isEnabled()) {
+            // Write-behind: the task row is bumped later by a coalesced flush
+            if (!taskRepository.existsById(taskId)) {
+                return false;
+            }
+            commentActivityBuffer.recordComment(taskId, commentedAt);
+            return true;
+        }
+
+        // The counter update doubles as the existence check, so no entity is loaded
+        return taskRepository.addCommentActivity(taskId, 1, commentedAt) > 0;
+    }
+
     @Override
     public void deleteComment(Long id) {
         log.info("Deleting comment with ID: {}", id);
@@ -308,38 +437,122 @@ public class TaskServiceImpl implements TaskService {
         Comment comment = commentRepository.findById(id)
                 .orElseThrow(() -> new CommentNotFoundException("Comment not found with id: " + id));
         commentRepository.delete(comment);
+        if (commentActivityBuffer.isEnabled()) {
+            commentActivityBuffer.flush(comment.getTaskId());
+        }
+        taskRepository.decrementCommentCount(comment.getTaskId());
+        taskEventPublisher.publish(TaskEventType.COMMENTED, comment.getTaskId());
 
         log.info("Deleted comment with ID: {}", id);
     }
 
+    @Override
+    public SubtaskResponse addSubtask(Long taskId, SubtaskRequest subtaskRequest) {
+        log.info("Adding subtask to task with ID: {}", taskId);
+
+        String status = subtaskRequest.getStatus() != null ? subtaskRequest.getStatus() : "UNDONE";
+        LocalDateTime now = LocalDateTime.now();
+
+        int updated = taskRepository.adjustSubtaskProgress(taskId, 1, status.equals("DONE") ? 1 : 0, now);
+        if (updated == 0) {
+            throw new TaskNotFoundException("Task not found with id: " + taskId);
+        }
+
+        Subtask subtask = Subtask.builder()
+                .taskId(taskId)
+                .text(subtaskRequest.getText())
+                .status(status)
+                .createdAt(now)
+                .updatedAt(now)
+                .build();
+
+        Subtask savedSubtask = subtaskRepository.save(subtask);
+        log.info("Added subtask with ID: {} to task with ID: {}", savedSubtask.getId(), taskId);
+
+        taskEventPublisher.publish(TaskEventType.UPDATED, taskId);
+
+        return mapSubtaskToSubtaskResponse(savedSubtask);
+    }
+
+    @Override
+    @Coalesced
+    public List<SubtaskResponse> getSubtasksByTaskId(Long taskId) {
+        log.info("Getting subtasks by task ID: {}", taskId);
+
+        if (!taskRepository.existsById(taskId)) {
+            throw new TaskNotFoundException("Task not found with id: " + taskId);
+        }
+
+        return subtaskRepository.findByTaskIdOrderById(taskId).stream()
+                .map(this::mapSubtaskToSubtaskResponse)
+                .collect(Collectors.toList());
+    }
+
+    @Override
+    public SubtaskResponse updateSubtaskStatus(Long subtaskId, SubtaskStatusRequest subtaskStatusRequest) {
+        log.info("Updating status of subtask with ID: {}", subtaskId);
+
+        Subtask subtask = subtaskRepository.findById(subtaskId)
+                .orElseThrow(() -> new SubtaskNotFoundException("Subtask not found with id: " + subtaskId));
+
+        String status = subtaskStatusRequest.getStatus();
+        LocalDateTime now = LocalDateTime.now();
+
+        // Conditional update so concurrent identical transitions are counted once
+        if (subtaskRepository.updateStatusIfChanged(subtaskId, status, now) > 0) {
+            int doneDelta = status.equals("DONE") ? 1 : -1;
+            taskRepository.adjustSubtaskProgress(subtask.getTaskId(), 0, doneDelta, now);
+            subtask.setStatus(status);
+            subtask.setUpdatedAt(now);
+            taskEventPublisher.publish(TaskEventType.UPDATED, subtask.getTaskId());
+        }
+
+        log.info("Subtask with ID: {} has status {}", subtaskId, subtask.getStatus());
+
+        return mapSubtaskToSubtaskResponse(subtask);
+    }
+
+    @Override
+    public void deleteSubtask(Long subtaskId) {
+        log.info("Deleting subtask with ID: {}", subtaskId);
+
+        Subtask subtask = subtaskRepository.findById(subtaskId)
+                .orElseThrow(() -> new SubtaskNotFoundException("Subtask not found with id: " + subtaskId));
+        subtaskRepository.delete(subtask);
+
+        int doneDelta = "DONE".equals(subtask.getStatus()) ? -1 : 0;
+        taskRepository.adjustSubtaskProgress(subtask.getTaskId(), -1, doneDelta, LocalDateTime.now());
+        taskEventPublisher.publish(TaskEventType.UPDATED, subtask.getTaskId());
+
+        log.info("Deleted subtask with ID: {}", subtaskId);
+    }
+
     @Override
     public void deleteTask(Long id) {
         log.info("Deleting task with ID: {}", id);
 
-        Task task = taskRepository.findById(id)
+        Task task = taskRepository.findByIdForUpdate(id)
                 .orElseThrow(() -> new TaskNotFoundException("Task not found with id: " + id));
+        taskStatsService.recordChange(statsSnapshot(task), null);
+        taskEventPublisher.publish(TaskEventType.DELETED, task);
 
+        subtaskRepository.deleteByTaskId(id);
         taskRepository.deleteById(id);
 
         if (task.getLocation_id() != null) {
-            Location location = locationRepository.findById(task.getLocation_id()).orElse(null);
+            // The point may be shared with other locations, unused ones are left to LocationPointCollector
             locationRepository.deleteById(task.getLocation_id());
-            if (location != null && location.getPoint_id() != null) {
-                locationPointRepository.deleteById(location.getPoint_id());
-            }
-
         }
 
         if (task.getDeadline_id() != null) {
             reminderRepository.deleteById(task.getDeadline_id());
         }
 
-        List<Comment> comments = commentRepository.findByTaskId(id);
+        List<Comment> comments = commentRepository.findByTask(id, task.getCreatedAt());
         if (comments != null) {
             commentRepository.deleteAll(comments);
         }
 
-        taskRepository.deleteById(id);
         log.info("Deleted task with ID: {}", id);
 
     }
@@ -350,13 +563,7 @@ public class TaskServiceImpl implements TaskService {
 
         Long locationPointId = null;
         if (noteRequest.getLocation() != null) {
-            LocationPoint locationPoint = LocationPoint.builder()
-                    .latitude(noteRequest.getLocation().getLatitude())
-                    .longitude(noteRequest.getLocation().getLongitude())
-                    .name(noteRequest.getLocation().getName())
-                    .build();
-            LocationPoint savedLocationPoint = locationPointRepository.save(locationPoint);
-            locationPointId = savedLocationPoint.getId();
+            locationPointId = sharedLocationPointRepository.upsert(noteRequest.getLocation());
         }
 
         Long locationId = null;
@@ -378,21 +585,24 @@ public class TaskServiceImpl implements TaskService {
                 .location_id(locationId)
                 .authorId(noteRequest.getAuthorId())
                 .groupId(noteRequest.getGroupId())
+                .commentCount(0)
                 .createdAt(now)
                 .updatedAt(now)
                 .build();
 
 
-        log.info("Try to write note");
+        log.debug("Try to write note");
         Task savedNote = taskRepository.save(task);
         log.info("Created note with ID: {}", savedNote.getId());
 
+        taskEventPublisher.publish(TaskEventType.CREATED, savedNote);
+
         return mapNoteToNoteResponse(savedNote);
     }
 
     @Override
     public void deleteNote(Long id) {
-        taskRepository.findById(id)
+        taskRepository.findByIdForUpdate(id)
                 .orElseThrow(() -> new NoteNotFoundException("Note not found with id: " + id));
         deleteTask(id);
     }
@@ -401,36 +611,18 @@ public class TaskServiceImpl implements TaskService {
     public NoteResponse updateNote(Long id, UpdateNoteRequest updateNoteRequest) {
         log.info("Updating note with ID: {}", id);
 
-        Task note = taskRepository.findById(id)
+        Task note = taskRepository.findByIdForUpdate(id)
                 .orElseThrow(() -> new NoteNotFoundException("Note not found with id: " + id));
+        Long previousGroupId = note.getGroupId();
 
         if (updateNoteRequest.getLocation() != null) {
+            // The point may be shared with other locations, unused ones are left to LocationPointCollector
             if (note.getLocation_id() != null) {
-                Location existingLocation = locationRepository.findById(note.getLocation_id()).orElse(null);
-                if (existingLocation != null) {
-                    Long pointIdToDelete = existingLocation.getPoint_id();
-
-                    // Delete location first (child with foreign key)
-                    locationRepository.deleteById(note.getLocation_id());
-
-                    // Then delete location point (parent being referenced)
-                    if (pointIdToDelete != null) {
-                        locationPointRepository.deleteById(pointIdToDelete);
-                    }
-                }
+                locationRepository.deleteById(note.getLocation_id());
             }
 
-            // Create new location point
-            LocationPoint locationPoint = LocationPoint.builder()
-                    .latitude(updateNoteRequest.getLocation().getLatitude())
-                    .longitude(updateNoteRequest.getLocation().getLongitude())
-                    .name(updateNoteRequest.getLocation().getName())
-                    .build();
-            LocationPoint savedLocationPoint = locationPointRepository.save(locationPoint);
-
-            // Create new location
             Location location = Location.builder()
-                    .point_id(savedLocationPoint.getId())
+                    .point_id(sharedLocationPointRepository.upsert(updateNoteRequest.getLocation()))
                     .remindByLocation(updateNoteRequest.getLocation().getRemindByLocation())
                     .build();
             Location savedLocation = locationRepository.save(location);
@@ -452,56 +644,97 @@ public class TaskServiceImpl implements TaskService {
         Task updatedNote = taskRepository.save(note);
         log.info("Updated note with ID: {}", updatedNote.getId());
 
+        taskEventPublisher.publish(TaskEventType.UPDATED, updatedNote, previousGroupId);
+
         return mapNoteToNoteResponse(updatedNote);
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public NoteResponse getNoteById(Long id) {
         log.info("Getting note by ID: {}", id);
 
-        Task note = taskRepository.findById(id).orElseThrow(() -> new NoteNotFoundException("Note not found with id: " + id));
-
-        return mapNoteToNoteResponse(note);
+        return taskRepository.findViewById(id)
+                .map(this::mapTaskViewToNoteResponse)
+                .orElseThrow(() -> new NoteNotFoundException("Note not found with id: " + id));
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public List<NoteResponse> getPersonalNotesByAuthorId(Long authorId) {
         log.info("Getting personal notes by author ID: {}", authorId);
 
-        List<Task> notes = taskRepository.findByGroupIdIsNullAndAuthorIdAndTaskType(authorId, 1);
-        return notes.stream()
-                .map(this::mapNoteToNoteResponse)
+        return taskRepository.findPersonalNoteViewsByAuthorId(authorId).stream()
+                .map(this::mapTaskViewToNoteResponse)
                 .collect(Collectors.toList());
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public List<NoteResponse> getNotesByAuthorId(Long authorId) {
         log.info("Getting notes by author ID: {}", authorId);
 
-        List<Task> notes = taskRepository.findByAuthorIdAndTaskType(authorId, 1);
-        return notes.stream()
-                .map(this::mapNoteToNoteResponse)
+        return taskRepository.findNoteViewsByAuthorId(authorId).stream()
+                .map(this::mapTaskViewToNoteResponse)
                 .collect(Collectors.toList());
     }
 
     @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public List<NoteResponse> getNotesByGroupId(Long groupId) {
         log.info("Getting notes by group ID: {}", groupId);
 
-        List<Task> notes = taskRepository.findByGroupIdAndTaskType(groupId, 1);
-        return notes.stream()
-                .map(this::mapNoteToNoteResponse)
+        return taskRepository.findNoteViewsByGroupId(groupId).stream()
+                .map(this::mapTaskViewToNoteResponse)
                 .collect(Collectors.toList());
     }
 
     @Override
+    @Transactional(readOnly = true)
+    public void streamPersonalNotesByAuthorId(Long authorId, Consumer<NoteResponse> consumer) {
+        log.info("Streaming personal notes by author ID: {}", authorId);
+
+        try (Stream<TaskView> views = taskRepository.streamPersonalNoteViewsByAuthorId(authorId)) {
+            views.map(this::mapTaskViewToNoteResponse).forEach(consumer);
+        }
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public void streamNotesByAuthorId(Long authorId, Consumer<NoteResponse> consumer) {
+        log.info("Streaming notes by author ID: {}", authorId);
+
+        try (Stream<TaskView> views = taskRepository.streamNoteViewsByAuthorId(authorId)) {
+            views.map(this::mapTaskViewToNoteResponse).forEach(consumer);
+        }
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public void streamNotesByGroupId(Long groupId, Consumer<NoteResponse> consumer) {
+        log.info("Streaming notes by group ID: {}", groupId);
+
+        try (Stream<TaskView> views = taskRepository.streamNoteViewsByGroupId(groupId)) {
+            views.map(this::mapTaskViewToNoteResponse).forEach(consumer);
+        }
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    @Coalesced
     public NoteDetailsResponse getNoteDetailsById(Long id) {
         log.info("Getting note by ID: {}", id);
 
         Task task = taskRepository.findById(id)
                 .orElseThrow(() -> new NoteNotFoundException("Note not found with id: " + id));
 
-        log.info("Note found: {}", task);
+        if (loggingProperties.isEntityDumps()) {
+            log.info("Note found: {}", task);
+        }
         return mapNoteToNoteDetailsResponse(task);
     }
 
@@ -534,6 +767,8 @@ public class TaskServiceImpl implements TaskService {
                 .location(locationRequest)
                 .groupId(note.getGroupId())
                 .createdAt(note.getCreatedAt())
+                .commentCount(note.getCommentCount() != null ? note.getCommentCount() : 0)
+                .lastCommentAt(note.getLastCommentAt())
                 .build();
     }
 
@@ -554,7 +789,7 @@ public class TaskServiceImpl implements TaskService {
                 .build();
     }
 
-    public TaskDetailsResponse mapTaskToTaskDetailsResponse(Task task) {
+    public TaskDetailsResponse mapTaskToTaskDetailsResponse(Task task, List<Subtask> subtasks) {
         if (task == null) {
             return null;
         }
@@ -573,6 +808,64 @@ public class TaskServiceImpl implements TaskService {
                 .comments(getComments(task).stream().map(this::mapCommentToCommentResponse).collect(Collectors.toList()))
                 .priority(task.getPriority())
                 .status(task.getStatus())
+                .subtasksTotal(task.getSubtasksTotal() != null ? task.getSubtasksTotal() : 0)
+                .subtasksDone(task.getSubtasksDone() != null ? task.getSubtasksDone() : 0)
+                .subtasks(subtasks.stream().map(this::mapSubtaskToSubtaskResponse).collect(Collectors.toList()))
+                .build();
+    }
+
+    public TaskDetailsResponse mapArchivedTaskToTaskDetailsResponse(TaskView view,
+                                                                   List<Comment> comments,
+                                                                   List<Subtask> subtasks) {
+        LocationResponse location = null;
+        if (view.getLocationPointId() != null) {
+            location = LocationResponse.builder()
+                    .latitude(view.getLatitude())
+                    .longitude(view.getLongitude())
+                    .name(view.getLocationName())
+                    .remindByLocation(view.getRemindByLocation() != null ? view.getRemindByLocation() : false)
+                    .build();
+        }
+
+        DeadlineResponse deadline = null;
+        if (view.getReminderId() != null) {
+            deadline = DeadlineResponse.builder()
+                    .time(view.getDeadlineTime())
+                    .remindByTime(view.getRemindByTime())
+                    .build();
+        }
+
+        return TaskDetailsResponse.builder()
+                .id(view.getId())
+                .title(view.getTitle())
+                .description(view.getDescription())
+                .taskType(view.getTaskType())
+                .authorId(view.getAuthorId())
+                .groupId(view.getGroupId())
+                .doerId(view.getDoerId())
+                .location(location)
+                .deadline(deadline)
+                .createdAt(view.getCreatedAt())
+                .comments(comments.stream().map(this::mapCommentToCommentResponse).collect(Collectors.toList()))
+                .priority(view.getPriority())
+                .status(view.getStatus())
+                .subtasksTotal(view.getSubtasksTotal() != null ? view.getSubtasksTotal() : 0)
+                .subtasksDone(view.getSubtasksDone() != null ? view.getSubtasksDone() : 0)
+                .subtasks(subtasks.stream().map(this::mapSubtaskToSubtaskResponse).collect(Collectors.toList()))
+                .build();
+    }
+
+    public SubtaskResponse mapSubtaskToSubtaskResponse(Subtask subtask) {
+        if (subtask == null) {
+            return null;
+        }
+
+        return SubtaskResponse.builder()
+                .id(subtask.getId())
+                .taskId(subtask.getTaskId())
+                .text(subtask.getText())
+                .status(subtask.getStatus())
+                .createdAt(subtask.getCreatedAt())
                 .build();
     }
 
@@ -591,7 +884,7 @@ public class TaskServiceImpl implements TaskService {
     }
 
     public List<Comment> getComments(Task task) {
-        return commentRepository.findByTaskId(task.getId());
+        return commentRepository.findByTask(task.getId(), task.getCreatedAt());
     }
 
     public DeadlineResponse mapReminderToDeadlineResponse(Reminder reminder) {
@@ -640,10 +933,95 @@ public class TaskServiceImpl implements TaskService {
         }
         return Reminder.builder()
                 .time(deadlineRequest.getTime())
+                .deadlineAt(TaskStatsServiceImpl.parseDeadline(deadlineRequest.getTime()))
                 .remindByTime(deadlineRequest.getRemindByTime() != null ? deadlineRequest.getRemindByTime() : false)
                 .build();
     }
 
+    public TaskResponse mapTaskViewToTaskResponse(TaskView view) {
+        if (view == null) {
+            return null;
+        }
+
+        return TaskResponse.builder()
+                .id(view.getId())
+                .authorId(view.getAuthorId())
+                .title(view.getTitle())
+                .description(view.getDescription())
+                .taskType(view.getTaskType())
+                .location(mapTaskViewToLocationRequest(view))
+                .deadline(mapTaskViewToDeadlineRequest(view))
+                .groupId(view.getGroupId())
+                .doerId(view.getDoerId())
+                .status(view.getStatus())
+                .priority(view.getPriority())
+                .createdAt(view.getCreatedAt())
+                .commentCount(view.getCommentCount() != null ? view.getCommentCount() : 0)
+                .lastCommentAt(view.getLastCommentAt())
+                .subtasksTotal(view.getSubtasksTotal() != null ? view.getSubtasksTotal() : 0)
+                .subtasksDone(view.getSubtasksDone() != null ? view.getSubtasksDone() : 0)
+                .build();
+    }
+
+    public TaskLookupResponse mapTaskViewToTaskLookupResponse(Long id, TaskView view) {
+        if (view == null) {
+            return TaskLookupResponse.builder()
+                    .id(id)
+                    .found(false)
+                    .build();
+        }
+
+        boolean note = view.getTaskType() != null && view.getTaskType() == 1L;
+        return TaskLookupResponse.builder()
+                .id(id)
+                .found(true)
+                .task(note ? null : mapTaskViewToTaskResponse(view))
+                .note(note ? mapTaskViewToNoteResponse(view) : null)
+                .build();
+    }
+
+    public NoteResponse mapTaskViewToNoteResponse(TaskView view) {
+        if (view == null) {
+            return null;
+        }
+
+        return NoteResponse.builder()
+                .id(view.getId())
+                .authorId(view.getAuthorId())
+                .title(view.getTitle())
+                .description(view.getDescription())
+                .location(mapTaskViewToLocationRequest(view))
+                .groupId(view.getGroupId())
+                .createdAt(view.getCreatedAt())
+                .commentCount(view.getCommentCount() != null ? view.getCommentCount() : 0)
+                .lastCommentAt(view.getLastCommentAt())
+                .build();
+    }
+
+    public LocationRequest mapTaskViewToLocationRequest(TaskView view) {
+        if (view.getLocationPointId() == null) {
+            return null;
+        }
+
+        return LocationRequest.builder()
+                .latitude(view.getLatitude())
+                .longitude(view.getLongitude())
+                .name(view.getLocationName())
+                .remindByLocation(view.getRemindByLocation())
+                .build();
+    }
+
+    public DeadlineRequest mapTaskViewToDeadlineRequest(TaskView view) {
+        if (view.getReminderId() == null) {
+            return null;
+        }
+
+        return DeadlineRequest.builder()
+                .time(view.getDeadlineTime())
+                .remindByTime(view.getRemindByTime())
+                .build();
+    }
+
     public TaskResponse mapTaskToTaskResponse(Task task) {
         if (task == null) {
             return null;
@@ -689,6 +1067,48 @@ public class TaskServiceImpl implements TaskService {
                 .status(task.getStatus())
                 .priority(task.getPriority())
                 .createdAt(task.getCreatedAt())
+                .commentCount(task.getCommentCount() != null ? task.getCommentCount() : 0)
+                .lastCommentAt(task.getLastCommentAt())
+                .subtasksTotal(task.getSubtasksTotal() != null ? task.getSubtasksTotal() : 0)
+                .subtasksDone(task.getSubtasksDone() != null ? task.getSubtasksDone() : 0)
                 .build();
     }
+
+    private TaskStatsSnapshot statsSnapshot(Task task) {
+        String deadline = null;
+        if (task.getDeadline_id() != null) {
+            deadline = reminderRepository.findById(task.getDeadline_id()).map(Reminder::getTime).orElse(null);
+        }
+        return statsSnapshot(task, deadline);
+    }
+
+    // Only tasks are counted on the dashboards, notes are not
+    private static TaskStatsSnapshot statsSnapshot(Task task, String deadline) {
+        if (task.getTaskType() == null || task.getTaskType() != 0L) {
+            return null;
+        }
+        return new TaskStatsSnapshot(task.getAuthorId(), task.getGroupId(), task.getStatus(), task.getPriority(),
+                deadline);
+    }
+
+    static String normalizePriority(String priority) {
+        if (priority == null) {
+            return "MIDDLE";
+        } else if (!priority.equals("LOW") &&
+                !priority.equals("MIDDLE") &&
+                !priority.equals("HIGH")) {
+            return "MIDDLE";
+        }
+        return priority;
+    }
+
+    static String normalizeStatus(String status) {
+        if (status == null) {
+            return "UNDONE";
+        } else if (!status.equals("UNDONE") &&
+                !status.equals("DONE")) {
+            return "UNDONE";
+        }
+        return status;
+    }
 }
@@ -0,0 +1,22 @@
+package ru.tcai.taskservice.service;
+
+import ru.tcai.taskservice.dto.projection.TaskStatsSnapshot;
+import ru.tcai.taskservice.dto.response.TaskStatsResponse;
+
+import java.util.Collection;
+
+public interface TaskStatsService {
+    TaskStatsResponse getGroupStats(Long groupId);
+
+    TaskStatsResponse getUserStats(Long userId);
+
+    /**
+     * Moves a task's counters from {@code before} to {@code after}; either side is null when the task did not
+     * exist or was not counted. Must be called in the transaction that writes the task.
+     */
+    void recordChange(TaskStatsSnapshot before, TaskStatsSnapshot after);
+
+    void recordCreated(Collection<TaskStatsSnapshot> created);
+
+    long rebuild();
+}
@@ -0,0 +1,236 @@
+package ru.tcai.taskservice.service;
+
+import lombok.RequiredArgsConstructor;
+import lombok.Value;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Propagation;
+import org.springframework.transaction.annotation.Transactional;
+import ru.tcai.taskservice.dto.projection.TaskStatsSnapshot;
+import ru.tcai.taskservice.dto.response.TaskStatsResponse;
+
+import java.sql.Timestamp;
+import java.time.LocalDateTime;
+import java.time.OffsetDateTime;
+import java.time.ZoneOffset;
+import java.time.format.DateTimeParseException;
+import java.time.temporal.ChronoUnit;
+import java.util.ArrayList;
+import java.util.Collection;
+import java.util.Comparator;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.TreeMap;
+
+@Service
+@RequiredArgsConstructor
+@Slf4j
+@Transactional
+public class TaskStatsServiceImpl implements TaskStatsService {
+
+    static final String USER_SCOPE = "USER";
+    static final String GROUP_SCOPE = "GROUP";
+
+    private static final String UPSERT_COUNTER = "INSERT INTO task_stats " +
+            "(scope_type, scope_id, status, priority, task_count) VALUES (?, ?, ?, ?, ?) " +
+            "ON CONFLICT (scope_type, scope_id, status, priority) " +
+            "DO UPDATE SET task_count = task_stats.task_count + EXCLUDED.task_count";
+
+    private static final String UPSERT_DEADLINE = "INSERT INTO task_deadline_stats " +
+            "(scope_type, scope_id, deadline_at, task_count) VALUES (?, ?, ?, ?) " +
+            "ON CONFLICT (scope_type, scope_id, deadline_at) " +
+            "DO UPDATE SET task_count = task_deadline_stats.task_count + EXCLUDED.task_count";
+
+    // Emptied deadline rows would otherwise pile up under the overdue range sum
+    private static final String DELETE_EMPTY_DEADLINE = "DELETE FROM task_deadline_stats " +
+            "WHERE scope_type = ? AND scope_id = ? AND deadline_at = ? AND task_count <= 0";
+
+    private static final String SELECT_COUNTERS = "SELECT status, priority, task_count FROM task_stats " +
+            "WHERE scope_type = ? AND scope_id = ? AND task_count > 0";
+
+    private static final String SELECT_OVERDUE = "SELECT coalesce(sum(task_count), 0) FROM task_deadline_stats " +
+            "WHERE scope_type = ? AND scope_id = ? AND deadline_at <= ?";
+
+    // Rows are upserted in key order so that concurrent writers lock them in the same order
+    private static final Comparator<CounterKey> COUNTER_ORDER = Comparator.comparing(CounterKey::getScopeType)
+            .thenComparing(CounterKey::getScopeId)
+            .thenComparing(CounterKey::getStatus)
+            .thenComparing(CounterKey::getPriority);
+
+    private static final Comparator<DeadlineKey> DEADLINE_ORDER = Comparator.comparing(DeadlineKey::getScopeType)
+            .thenComparing(DeadlineKey::getScopeId)
+            .thenComparing(DeadlineKey::getDeadlineAt);
+
+    private final JdbcTemplate jdbcTemplate;
+
+    @Override
+    @Transactional(readOnly = true)
+    public TaskStatsResponse getGroupStats(Long groupId) {
+        log.info("Getting task stats for group ID: {}", groupId);
+        return stats(GROUP_SCOPE, groupId);
+    }
+
+    @Override
+    @Transactional(readOnly = true)
+    public TaskStatsResponse getUserStats(Long userId) {
+        log.info("Getting task stats for user ID: {}", userId);
+        return stats(USER_SCOPE, userId);
+    }
+
+    @Override
+    @Transactional(propagation = Propagation.MANDATORY)
+    public void recordChange(TaskStatsSnapshot before, TaskStatsSnapshot after) {
+        Map<CounterKey, Long> counters = new TreeMap<>(COUNTER_ORDER);
+        Map<DeadlineKey, Long> deadlines = new TreeMap<>(DEADLINE_ORDER);
+        if (before != null) {
+            collect(before, -1, counters, deadlines);
+        }
+        if (after != null) {
+            collect(after, 1, counters, deadlines);
+        }
+        apply(counters, deadlines);
+    }
+
+    @Override
+    @Transactional(propagation = Propagation.MANDATORY)
+    public void recordCreated(Collection<TaskStatsSnapshot> created) {
+        Map<CounterKey, Long> counters = new TreeMap<>(COUNTER_ORDER);
+        Map<DeadlineKey, Long> deadlines = new TreeMap<>(DEADLINE_ORDER);
+        for (TaskStatsSnapshot snapshot : created) {
+            collect(snapshot, 1, counters, deadlines);
+        }
+        apply(counters, deadlines);
+    }
+
+    @Override
+    public long rebuild() {
+        log.info("Rebuilding task stats");
+        Long rows = jdbcTemplate.queryForObject("SELECT rebuild_task_stats()", Long.class);
+        log.info("Rebuilt task stats with {} rows", rows);
+        return rows != null ? rows : 0;
+    }
+
+    /**
+     * Deadlines are ISO-8601 date-times; ones without an offset are taken as UTC. Anything else counts as no
+     * deadline, exactly like {@code parse_deadline} in the rebuild.
+     */
+    static LocalDateTime parseDeadline(String value) {
+        if (value == null) {
+            return null;
+        }
+        LocalDateTime deadline;
+        try {
+            deadline = OffsetDateTime.parse(value).withOffsetSameInstant(ZoneOffset.UTC).toLocalDateTime();
+        } catch (DateTimeParseException e) {
+            try {
+                deadline = LocalDateTime.parse(value);
+            } catch (DateTimeParseException ignored) {
+                return null;
+            }
+        }
+        return deadline.truncatedTo(ChronoUnit.MINUTES);
+    }
+
+    private TaskStatsResponse stats(String scopeType, Long scopeId) {
+        Map<String, Long> byStatus = new LinkedHashMap<>();
+        byStatus.put("UNDONE", 0L);
+        byStatus.put("DONE", 0L);
+        Map<String, Long> byPriority = new LinkedHashMap<>();
+        byPriority.put("LOW", 0L);
+        byPriority.put("MIDDLE", 0L);
+        byPriority.put("HIGH", 0L);
+
+        long[] total = {0};
+        jdbcTemplate.query(SELECT_COUNTERS, rs -> {
+            long count = rs.getLong("task_count");
+            byStatus.merge(rs.getString("status"), count, Long::sum);
+            byPriority.merge(rs.getString("priority"), count, Long::sum);
+            total[0] += count;
+        }, scopeType, scopeId);
+
+        Long overdue = jdbcTemplate.queryForObject(SELECT_OVERDUE, Long.class, scopeType, scopeId,
+                Timestamp.valueOf(LocalDateTime.now(ZoneOffset.UTC)));
+
+        return TaskStatsResponse.builder()
+                .scopeType(scopeType)
+                .scopeId(scopeId)
+                .total(total[0])
+                .byStatus(byStatus)
+                .byPriority(byPriority)
+                .overdue(overdue != null ? overdue : 0)
+                .build();
+    }
+
+    private void collect(TaskStatsSnapshot snapshot, long delta,
+                         Map<CounterKey, Long> counters, Map<DeadlineKey, Long> deadlines) {
+        String status = TaskServiceImpl.normalizeStatus(snapshot.getStatus());
+        String priority = TaskServiceImpl.normalizePriority(snapshot.getPriority());
+        LocalDateTime deadlineAt = "DONE".equals(status) ? null : parseDeadline(snapshot.getDeadline());
+
+        for (Object[] scope : scopes(snapshot)) {
+            String scopeType = (String) scope[0];
+            Long scopeId = (Long) scope[1];
+            counters.merge(new CounterKey(scopeType, scopeId, status, priority), delta, Long::sum);
+            if (deadlineAt != null) {
+                deadlines.merge(new DeadlineKey(scopeType, scopeId, deadlineAt), delta, Long::sum);
+            }
+        }
+    }
+
+    private static List<Object[]> scopes(TaskStatsSnapshot snapshot) {
+        List<Object[]> scopes = new ArrayList<>(2);
+        if (snapshot.getAuthorId() != null) {
+            scopes.add(new Object[]{USER_SCOPE, snapshot.getAuthorId()});
+        }
+        if (snapshot.getGroupId() != null) {
+            scopes.add(new Object[]{GROUP_SCOPE, snapshot.getGroupId()});
+        }
+        return scopes;
+    }
+
+    private void apply(Map<CounterKey, Long> counters, Map<DeadlineKey, Long> deadlines) {
+        // An update that touches none of the counted fields nets out to nothing
+        counters.values().removeIf(delta -> delta == 0);
+        deadlines.values().removeIf(delta -> delta == 0);
+
+        if (!counters.isEmpty()) {
+            List<Object[]> args = new ArrayList<>(counters.size());
+            counters.forEach((key, delta) -> args.add(new Object[]{
+                    key.getScopeType(), key.getScopeId(), key.getStatus(), key.getPriority(), delta}));
+            jdbcTemplate.batchUpdate(UPSERT_COUNTER, args);
+        }
+
+        if (!deadlines.isEmpty()) {
+            List<Object[]> args = new ArrayList<>(deadlines.size());
+            List<Object[]> decremented = new ArrayList<>();
+            deadlines.forEach((key, delta) -> {
+                Object[] row = {key.getScopeType(), key.getScopeId(), Timestamp.valueOf(key.getDeadlineAt())};
+                args.add(new Object[]{row[0], row[1], row[2], delta});
+                if (delta < 0) {
+                    decremented.add(row);
+                }
+            });
+            jdbcTemplate.batchUpdate(UPSERT_DEADLINE, args);
+            if (!decremented.isEmpty()) {
+                jdbcTemplate.batchUpdate(DELETE_EMPTY_DEADLINE, decremented);
+            }
+        }
+    }
+
+    @Value
+    private static class CounterKey {
+        String scopeType;
+        Long scopeId;
+        String status;
+        String priority;
+    }
+
+    @Value
+    private static class DeadlineKey {
+        String scopeType;
+        Long scopeId;
+        LocalDateTime deadlineAt;
+    }
+}
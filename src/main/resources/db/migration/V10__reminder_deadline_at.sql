@@ -0,0 +1,8 @@
+-- The parsed deadline of a reminder, written by the service next to the raw time.
+--
+-- Ordering the inbox by parse_deadline(time) ran the plpgsql parser, and the subtransaction of its
+-- exception handler, for every candidate row of every inbox page. Existing rows are parsed once here.
+
+ALTER TABLE reminder ADD COLUMN deadline_at TIMESTAMP;
+
+UPDATE reminder SET deadline_at = parse_deadline(time) WHERE time IS NOT NULL;
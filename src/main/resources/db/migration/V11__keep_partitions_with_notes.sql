@@ -0,0 +1,60 @@
+-- Notes keep their partition from expiring, like open tasks do.
+--
+-- V9 only looked for task rows that are not DONE, so a month holding notes and DONE tasks was
+-- detached, and with drop-expired dropped, together with notes users still had. Notes are never
+-- archived or done, so such a partition now stays.
+
+CREATE OR REPLACE FUNCTION expire_task_partitions(retention interval, drop_detached boolean) RETURNS integer
+    LANGUAGE plpgsql AS
+$$
+DECLARE
+    expired    record;
+    comments   regclass;
+    live_rows  boolean;
+    detached   integer := 0;
+BEGIN
+    FOR expired IN SELECT inhrelid::regclass AS child,
+                          partition_bound(inhrelid, 'from') AS from_bound,
+                          partition_bound(inhrelid, 'to') AS to_bound
+                   FROM pg_inherits
+                   WHERE inhparent = 'task'::regclass
+                     AND partition_bound(inhrelid, 'to') <= localtimestamp - retention
+                   ORDER BY partition_bound(inhrelid, 'to') LOOP
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %s WHERE task_type IS DISTINCT FROM 0 ' ||
+                       'OR status IS DISTINCT FROM %L)', expired.child, 'DONE') INTO live_rows;
+        IF live_rows THEN
+            RAISE NOTICE 'Keeping % and newer partitions: it still holds notes or open tasks', expired.child;
+            EXIT;
+        END IF;
+
+        EXECUTE format('DELETE FROM subtask WHERE task_id IN (SELECT id FROM %s)', expired.child);
+        EXECUTE format('DELETE FROM comment WHERE created_at >= %L AND task_id IN (SELECT id FROM %s)',
+                       expired.to_bound, expired.child);
+
+        SELECT inhrelid::regclass INTO comments
+        FROM pg_inherits
+        WHERE inhparent = 'comment'::regclass
+          AND partition_bound(inhrelid, 'from') = expired.from_bound
+          AND partition_bound(inhrelid, 'to') = expired.to_bound;
+
+        EXECUTE format('ALTER TABLE task DETACH PARTITION %s', expired.child);
+        IF comments IS NOT NULL THEN
+            EXECUTE format('ALTER TABLE comment DETACH PARTITION %s', comments);
+        END IF;
+
+        IF drop_detached THEN
+            CREATE TEMP TABLE expired_task_refs AS SELECT location_id, deadline_id FROM task WHERE false;
+            EXECUTE format('INSERT INTO expired_task_refs SELECT location_id, deadline_id FROM %s', expired.child);
+            EXECUTE format('DROP TABLE %s', expired.child);
+            IF comments IS NOT NULL THEN
+                EXECUTE format('DROP TABLE %s', comments);
+            END IF;
+            DELETE FROM location WHERE id IN (SELECT location_id FROM expired_task_refs);
+            DELETE FROM reminder WHERE id IN (SELECT deadline_id FROM expired_task_refs);
+            DROP TABLE expired_task_refs;
+        END IF;
+        detached := detached + 1;
+    END LOOP;
+    RETURN detached;
+END
+$$;
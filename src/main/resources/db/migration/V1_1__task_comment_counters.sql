@@ -0,0 +1,14 @@
+-- Comment counters on task. Written to also apply to databases baselined at V1 whose schema
+-- Hibernate had already extended; existing tasks get their counts from the comment table.
+
+ALTER TABLE task
+    ADD COLUMN IF NOT EXISTS comment_count   INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS last_comment_at TIMESTAMP;
+
+UPDATE task t
+SET comment_count   = c.comment_count,
+    last_comment_at = c.last_comment_at
+FROM (SELECT task_id, count(*) AS comment_count, max(created_at) AS last_comment_at
+      FROM comment
+      GROUP BY task_id) c
+WHERE t.id = c.task_id;
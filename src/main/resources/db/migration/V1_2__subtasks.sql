@@ -0,0 +1,18 @@
+-- Subtasks and the progress counters on task. Written to also apply to databases baselined at V1
+-- whose schema Hibernate had already extended.
+
+ALTER TABLE task
+    ADD COLUMN IF NOT EXISTS subtasks_total INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS subtasks_done  INTEGER DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS subtask
+(
+    id                 BIGSERIAL PRIMARY KEY,
+    task_id            BIGINT                  NOT NULL CONSTRAINT fk_subtask_task REFERENCES task (id),
+    text               VARCHAR(255),
+    status             VARCHAR(255),
+    created_at         TIMESTAMP,
+    updated_at         TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_subtask_task_id ON subtask (task_id, id);
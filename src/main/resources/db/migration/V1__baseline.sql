@@ -1,13 +1,38 @@
+-- Schema as previously created by database/scripts/migrations/init.sql and Hibernate's ddl-auto.
+-- Existing databases are baselined at this version and skip it.
+
+CREATE TABLE IF NOT EXISTS location_point
+(
+    id                 BIGSERIAL PRIMARY KEY,
+    latitude           DOUBLE PRECISION,
+    longitude          DOUBLE PRECISION,
+    name               VARCHAR(255)
+);
+
+CREATE TABLE IF NOT EXISTS location
+(
+    id                 BIGSERIAL PRIMARY KEY,
+    point_id           BIGINT REFERENCES location_point (id),
+    remind_by_location BOOLEAN
+);
+
+CREATE TABLE IF NOT EXISTS reminder
+(
+    id                 BIGSERIAL PRIMARY KEY,
+    time               VARCHAR(255),
+    remind_by_time     BOOLEAN
+);
+
 CREATE TABLE IF NOT EXISTS task
 (
     id                 BIGSERIAL PRIMARY KEY,
     author             BIGINT,
     title              VARCHAR(255),
-    taskType           BIGINT,
+    task_type          BIGINT,
     description        VARCHAR(255)            NOT NULL,
-    location_id	       BIGINT,
-    deadline_id        BIGINT,
-    groupId            BIGINT,
+    location_id        BIGINT REFERENCES location (id),
+    deadline_id        BIGINT REFERENCES reminder (id),
+    group_id           BIGINT,
     doer               BIGINT,
     created_at         TIMESTAMP,
     updated_at         TIMESTAMP,
@@ -18,36 +43,8 @@ CREATE TABLE IF NOT EXISTS task
 CREATE TABLE IF NOT EXISTS comment
 (
     id                 BIGSERIAL PRIMARY KEY,
-    task_id            BIGINT,
+    task_id            BIGINT CONSTRAINT fk_comment_task REFERENCES task (id),
     author_id          BIGINT,
     text               VARCHAR(255),
     created_at         TIMESTAMP
 );
-
-CREATE TABLE IF NOT EXISTS location
-(
-    id                 BIGSERIAL PRIMARY KEY,
-    point_id           BIGSERIAL,
-    remindByLocation   BOOLEAN
-);
-
-CREATE TABLE IF NOT EXISTS location_point
-(
-   id                  BIGSERIAL PRIMARY KEY,
-   latitude            DOUBLE PRECISION,
-   longitude           DOUBLE PRECISION,
-   name                VARCHAR(255)
-);
-
-CREATE TABLE IF NOT EXISTS reminder
-(
-    id                 BIGSERIAL PRIMARY KEY,
-    time               VARCHAR(255),
-    remindByTime       BOOLEAN
-);
-
-ALTER TABLE location ADD FOREIGN KEY (point_id)    REFERENCES location_point(id);
-ALTER TABLE task     ADD FOREIGN KEY (location_id) REFERENCES location(id);
-ALTER TABLE task     ADD FOREIGN KEY (deadline_id) REFERENCES reminder(id);
-
-ALTER TABLE comment ADD CONSTRAINT fk_comment_task FOREIGN KEY (task_id) REFERENCES task(id);
@@ -0,0 +1,13 @@
+-- Tasks and notes share the task table. Each list query filters on one literal task_type,
+-- so per-type partial indexes keep note lookups off task index pages and the other way round.
+
+CREATE INDEX IF NOT EXISTS idx_task_tasks_author ON task (author, id) WHERE task_type = 0;
+CREATE INDEX IF NOT EXISTS idx_task_tasks_personal ON task (author, id) WHERE task_type = 0 AND group_id IS NULL;
+CREATE INDEX IF NOT EXISTS idx_task_tasks_group ON task (group_id, id) WHERE task_type = 0;
+CREATE INDEX IF NOT EXISTS idx_task_tasks_doer ON task (doer, id) WHERE task_type = 0;
+
+CREATE INDEX IF NOT EXISTS idx_task_notes_author ON task (author, id) WHERE task_type = 1;
+CREATE INDEX IF NOT EXISTS idx_task_notes_personal ON task (author, id) WHERE task_type = 1 AND group_id IS NULL;
+CREATE INDEX IF NOT EXISTS idx_task_notes_group ON task (group_id, id) WHERE task_type = 1;
+
+ANALYZE task;
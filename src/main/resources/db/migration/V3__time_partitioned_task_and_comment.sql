@@ -0,0 +1,142 @@
+-- Range-partitions task and comment by month on created_at.
+--
+-- The existing heaps are attached as a single <table>_p_history partition covering everything up to
+-- the end of the current month, so no rows are copied. Monthly partitions are created after that
+-- and kept ahead by create_monthly_partitions(), which the service calls on startup and on a schedule.
+-- Primary keys become (id, created_at) since a partitioned unique key has to contain the partition
+-- key. As a consequence comment and subtask can no longer reference task through a foreign key.
+
+CREATE OR REPLACE FUNCTION partition_bound(child regclass, side text) RETURNS timestamp
+    LANGUAGE plpgsql STABLE AS
+$$
+DECLARE
+    bounds text[];
+    bound  text;
+BEGIN
+    bounds := regexp_match(pg_get_expr((SELECT relpartbound FROM pg_class WHERE oid = child), child),
+                           'FROM \((.*)\) TO \((.*)\)');
+    IF bounds IS NULL THEN
+        RETURN NULL;
+    END IF;
+    bound := CASE WHEN side = 'from' THEN bounds[1] ELSE bounds[2] END;
+    IF bound = 'MINVALUE' THEN
+        RETURN '-infinity';
+    ELSIF bound = 'MAXVALUE' THEN
+        RETURN 'infinity';
+    END IF;
+    RETURN btrim(bound, '''')::timestamp;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent regclass, months_ahead integer) RETURNS integer
+    LANGUAGE plpgsql AS
+$$
+DECLARE
+    parent_name text := (SELECT relname FROM pg_class WHERE oid = parent);
+    month_start timestamp := date_trunc('month', localtimestamp);
+    created     integer := 0;
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        IF NOT EXISTS (SELECT 1
+                       FROM pg_inherits
+                       WHERE inhparent = parent
+                         AND partition_bound(inhrelid, 'from') <= month_start
+                         AND partition_bound(inhrelid, 'to') > month_start) THEN
+            EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                           parent_name || '_p' || to_char(month_start, 'YYYYMM'), parent,
+                           month_start, month_start + interval '1 month');
+            created := created + 1;
+        END IF;
+        month_start := month_start + interval '1 month';
+    END LOOP;
+    RETURN created;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION detach_expired_partitions(parent regclass, retention interval, drop_detached boolean)
+    RETURNS integer
+    LANGUAGE plpgsql AS
+$$
+DECLARE
+    expired  record;
+    detached integer := 0;
+BEGIN
+    FOR expired IN SELECT inhrelid::regclass AS child
+                   FROM pg_inherits
+                   WHERE inhparent = parent
+                     AND partition_bound(inhrelid, 'to') <= localtimestamp - retention
+                   ORDER BY partition_bound(inhrelid, 'to') LOOP
+        EXECUTE format('ALTER TABLE %s DETACH PARTITION %s', parent, expired.child);
+        IF drop_detached THEN
+            EXECUTE format('DROP TABLE %s', expired.child);
+        END IF;
+        detached := detached + 1;
+    END LOOP;
+    RETURN detached;
+END
+$$;
+
+CREATE FUNCTION pg_temp.partition_by_created_at(table_name text) RETURNS void
+    LANGUAGE plpgsql AS
+$$
+DECLARE
+    history     text := table_name || '_p_history';
+    history_end timestamp := date_trunc('month', localtimestamp) + interval '1 month';
+    legacy      record;
+    id_sequence text;
+BEGIN
+    EXECUTE format('UPDATE %I SET created_at = localtimestamp WHERE created_at IS NULL', table_name);
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', table_name, history);
+    EXECUTE format('ALTER TABLE %I ALTER COLUMN created_at SET NOT NULL', history);
+
+    -- Index names are schema-wide; freeing them lets indexes created on the parent attach to these
+    FOR legacy IN SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = history LOOP
+        EXECUTE format('ALTER INDEX %I RENAME TO %I', legacy.indexname, left(legacy.indexname, 54) || '_history');
+    END LOOP;
+
+    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)', table_name, history);
+    EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (id, created_at)', table_name);
+
+    id_sequence := pg_get_serial_sequence(history, 'id');
+    IF id_sequence IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY %I.id', id_sequence, table_name);
+    END IF;
+
+    -- A matching check constraint lets ATTACH skip scanning the whole table
+    EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I CHECK (created_at < %L)', history, history || '_bound', history_end);
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (MINVALUE) TO (%L)', table_name, history, history_end);
+    EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', history, history || '_bound');
+END
+$$;
+
+DO
+$$
+DECLARE
+    reference record;
+BEGIN
+    FOR reference IN SELECT conrelid::regclass AS referencing, conname
+                     FROM pg_constraint
+                     WHERE contype = 'f' AND confrelid IN ('task'::regclass, 'comment'::regclass) LOOP
+        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', reference.referencing, reference.conname);
+    END LOOP;
+END
+$$;
+
+SELECT pg_temp.partition_by_created_at('task');
+SELECT pg_temp.partition_by_created_at('comment');
+
+ALTER TABLE task ADD CONSTRAINT fk_task_location FOREIGN KEY (location_id) REFERENCES location (id);
+ALTER TABLE task ADD CONSTRAINT fk_task_deadline FOREIGN KEY (deadline_id) REFERENCES reminder (id);
+
+CREATE INDEX idx_task_tasks_author ON task (author, id) WHERE task_type = 0;
+CREATE INDEX idx_task_tasks_personal ON task (author, id) WHERE task_type = 0 AND group_id IS NULL;
+CREATE INDEX idx_task_tasks_group ON task (group_id, id) WHERE task_type = 0;
+CREATE INDEX idx_task_tasks_doer ON task (doer, id) WHERE task_type = 0;
+CREATE INDEX idx_task_notes_author ON task (author, id) WHERE task_type = 1;
+CREATE INDEX idx_task_notes_personal ON task (author, id) WHERE task_type = 1 AND group_id IS NULL;
+CREATE INDEX idx_task_notes_group ON task (group_id, id) WHERE task_type = 1;
+
+CREATE INDEX idx_comment_task_id ON comment (task_id, id);
+
+SELECT create_monthly_partitions('task', 3);
+SELECT create_monthly_partitions('comment', 3);
@@ -0,0 +1,80 @@
+-- Cold storage for completed tasks.
+--
+-- TaskArchiver moves DONE tasks that have not been touched for a while out of task, together with
+-- their comments, subtasks, location and reminder. The archive tables mirror the live ones plus an
+-- archived_at column. Locations are stored with their point inlined since they are only read back
+-- as part of an archived task.
+
+CREATE TABLE task_archive
+(
+    id                 BIGINT PRIMARY KEY,
+    author             BIGINT,
+    title              VARCHAR(255),
+    task_type          BIGINT,
+    description        VARCHAR(255)            NOT NULL,
+    location_id        BIGINT,
+    deadline_id        BIGINT,
+    group_id           BIGINT,
+    doer               BIGINT,
+    created_at         TIMESTAMP               NOT NULL,
+    updated_at         TIMESTAMP,
+    status             VARCHAR(255),
+    priority           VARCHAR(255),
+    comment_count      INTEGER,
+    last_comment_at    TIMESTAMP,
+    subtasks_total     INTEGER,
+    subtasks_done      INTEGER,
+    archived_at        TIMESTAMP               NOT NULL
+);
+
+CREATE TABLE comment_archive
+(
+    id                 BIGINT PRIMARY KEY,
+    task_id            BIGINT,
+    author_id          BIGINT,
+    text               VARCHAR(255),
+    created_at         TIMESTAMP,
+    archived_at        TIMESTAMP               NOT NULL
+);
+
+CREATE INDEX idx_comment_archive_task_id ON comment_archive (task_id, id);
+
+CREATE TABLE subtask_archive
+(
+    id                 BIGINT PRIMARY KEY,
+    task_id            BIGINT                  NOT NULL,
+    text               VARCHAR(255),
+    status             VARCHAR(255),
+    created_at         TIMESTAMP,
+    updated_at         TIMESTAMP,
+    archived_at        TIMESTAMP               NOT NULL
+);
+
+CREATE INDEX idx_subtask_archive_task_id ON subtask_archive (task_id, id);
+
+CREATE TABLE location_archive
+(
+    id                 BIGINT PRIMARY KEY,
+    point_id           BIGINT,
+    latitude           DOUBLE PRECISION,
+    longitude          DOUBLE PRECISION,
+    name               VARCHAR(255),
+    remind_by_location BOOLEAN,
+    archived_at        TIMESTAMP               NOT NULL
+);
+
+CREATE TABLE reminder_archive
+(
+    id                 BIGINT PRIMARY KEY,
+    time               VARCHAR(255),
+    remind_by_time     BOOLEAN,
+    archived_at        TIMESTAMP               NOT NULL
+);
+
+-- The archiver ages tasks by updated_at, which older rows may not have
+UPDATE task SET updated_at = created_at WHERE updated_at IS NULL;
+
+CREATE INDEX idx_task_done_updated_at ON task (updated_at, id) WHERE task_type = 0 AND status = 'DONE';
+
+-- Lets the archiver check cheaply whether a location point is still referenced before removing it
+CREATE INDEX idx_location_point_id ON location (point_id);
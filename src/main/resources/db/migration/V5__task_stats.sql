@@ -0,0 +1,93 @@
+-- Dashboard counters per user (tasks they authored) and per group.
+--
+-- task_stats counts tasks by status and priority. task_deadline_stats counts open tasks by deadline
+-- (to the minute, UTC) so that the overdue count is a range sum up to the current time. Both are
+-- maintained by the service in the same transaction as the task write and can be rebuilt from
+-- task and task_archive with rebuild_task_stats(), which POST /tasks/stats/rebuild calls.
+
+CREATE TABLE task_stats
+(
+    scope_type         VARCHAR(16)             NOT NULL,
+    scope_id           BIGINT                  NOT NULL,
+    status             VARCHAR(255)            NOT NULL,
+    priority           VARCHAR(255)            NOT NULL,
+    task_count         BIGINT                  NOT NULL,
+    PRIMARY KEY (scope_type, scope_id, status, priority)
+);
+
+CREATE TABLE task_deadline_stats
+(
+    scope_type         VARCHAR(16)             NOT NULL,
+    scope_id           BIGINT                  NOT NULL,
+    deadline_at        TIMESTAMP               NOT NULL,
+    task_count         BIGINT                  NOT NULL,
+    PRIMARY KEY (scope_type, scope_id, deadline_at)
+);
+
+-- Mirrors TaskStatsServiceImpl.parseDeadline: ISO-8601 with or without offset, anything else is no deadline
+CREATE FUNCTION parse_deadline(value text) RETURNS timestamp
+    LANGUAGE plpgsql STABLE AS
+$$
+BEGIN
+    IF value IS NULL OR value !~ '^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d{1,9})?)?(Z|[+-]\d{2}:\d{2})?$' THEN
+        RETURN NULL;
+    END IF;
+    IF value ~ '(Z|[+-]\d{2}:\d{2})$' THEN
+        RETURN date_trunc('minute', value::timestamptz AT TIME ZONE 'UTC');
+    END IF;
+    RETURN date_trunc('minute', value::timestamp);
+EXCEPTION
+    WHEN others THEN
+        RETURN NULL;
+END
+$$;
+
+CREATE FUNCTION rebuild_task_stats() RETURNS bigint
+    LANGUAGE plpgsql AS
+$$
+DECLARE
+    counters  bigint;
+    deadlines bigint;
+BEGIN
+    -- Writers block on their counter upsert until the rebuild commits, so none of their tasks is
+    -- counted twice or missed
+    LOCK TABLE task_stats, task_deadline_stats IN EXCLUSIVE MODE;
+    DELETE FROM task_stats;
+    DELETE FROM task_deadline_stats;
+
+    WITH tasks AS (
+        SELECT author, group_id, status, priority FROM task WHERE task_type = 0
+        UNION ALL
+        SELECT author, group_id, status, priority FROM task_archive WHERE task_type = 0
+    )
+    INSERT INTO task_stats (scope_type, scope_id, status, priority, task_count)
+    SELECT s.scope_type,
+           s.scope_id,
+           CASE WHEN t.status IN ('UNDONE', 'DONE') THEN t.status ELSE 'UNDONE' END,
+           CASE WHEN t.priority IN ('LOW', 'MIDDLE', 'HIGH') THEN t.priority ELSE 'MIDDLE' END,
+           count(*)
+    FROM tasks t
+             CROSS JOIN LATERAL (VALUES ('USER', t.author), ('GROUP', t.group_id)) AS s (scope_type, scope_id)
+    WHERE s.scope_id IS NOT NULL
+    GROUP BY 1, 2, 3, 4;
+    GET DIAGNOSTICS counters = ROW_COUNT;
+
+    -- Archived tasks are all DONE and so never overdue
+    INSERT INTO task_deadline_stats (scope_type, scope_id, deadline_at, task_count)
+    SELECT s.scope_type, s.scope_id, d.deadline_at, count(*)
+    FROM task t
+             JOIN reminder r ON r.id = t.deadline_id
+             CROSS JOIN LATERAL (VALUES ('USER', t.author), ('GROUP', t.group_id)) AS s (scope_type, scope_id)
+             CROSS JOIN LATERAL (SELECT parse_deadline(r.time) AS deadline_at) AS d
+    WHERE t.task_type = 0
+      AND t.status IS DISTINCT FROM 'DONE'
+      AND s.scope_id IS NOT NULL
+      AND d.deadline_at IS NOT NULL
+    GROUP BY 1, 2, 3;
+    GET DIAGNOSTICS deadlines = ROW_COUNT;
+
+    RETURN counters + deadlines;
+END
+$$;
+
+SELECT rebuild_task_stats();
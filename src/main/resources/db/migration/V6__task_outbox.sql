@@ -0,0 +1,18 @@
+-- Transactional outbox for downstream consumers of task changes.
+--
+-- Every task mutation appends a row here in its own transaction; OutboxRelay drains the table in id
+-- order to the configured sink and deletes what was delivered. Writes to one task lock its row, so
+-- the events of a task are appended, and delivered, in the order they happened.
+
+CREATE TABLE task_outbox
+(
+    id                 BIGSERIAL PRIMARY KEY,
+    event_type         VARCHAR(32)             NOT NULL,
+    task_id            BIGINT                  NOT NULL,
+    task_type          BIGINT,
+    group_id           BIGINT,
+    previous_group_id  BIGINT,
+    author_id          BIGINT,
+    doer_id            BIGINT,
+    created_at         TIMESTAMP DEFAULT now() NOT NULL
+);
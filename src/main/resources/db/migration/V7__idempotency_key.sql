@@ -0,0 +1,19 @@
+-- Responses to create, comment and import requests sent with an Idempotency-Key header, so that a
+-- client retry is answered from here instead of repeating the write.
+--
+-- A row without status_code is a request still in flight. Storing its response only touches
+-- unindexed columns, which keeps that update HOT; the free space left by the fill factor is for it.
+
+CREATE TABLE idempotency_key
+(
+    idempotency_key VARCHAR(255) PRIMARY KEY,
+    fingerprint     BYTEA                   NOT NULL,
+    status_code     SMALLINT,
+    content_type    VARCHAR(255),
+    body            BYTEA,
+    compressed      BOOLEAN   DEFAULT FALSE NOT NULL,
+    created_at      TIMESTAMP DEFAULT now() NOT NULL,
+    expires_at      TIMESTAMP               NOT NULL
+) WITH (fillfactor = 80);
+
+CREATE INDEX idx_idempotency_key_expires_at ON idempotency_key (expires_at);
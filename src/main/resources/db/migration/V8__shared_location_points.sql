@@ -0,0 +1,36 @@
+-- Location points are shared: one row per quantized position and name, referenced by every location
+-- there. Coordinates are keyed to 6 decimal places (about 0.1 m) and the first point written for a
+-- key keeps its exact coordinates. Points no location references any more are removed by
+-- LocationPointCollector instead of by the writes that drop the reference.
+
+-- Every point mapped to the lowest id of its key
+CREATE TEMPORARY TABLE location_point_canonical ON COMMIT DROP AS
+SELECT id,
+       min(id) OVER (PARTITION BY round(latitude * 1000000), round(longitude * 1000000), coalesce(name, '')) AS canonical_id
+FROM location_point;
+
+DELETE FROM location_point_canonical WHERE id = canonical_id;
+CREATE UNIQUE INDEX ON location_point_canonical (id);
+ANALYZE location_point_canonical;
+
+UPDATE location l
+SET point_id = c.canonical_id
+FROM location_point_canonical c
+WHERE l.point_id = c.id;
+
+-- Archived locations carry their point inline, the id is only kept for reference
+UPDATE location_archive l
+SET point_id = c.canonical_id
+FROM location_point_canonical c
+WHERE l.point_id = c.id;
+
+-- The collapsed duplicates, and points orphaned before
+DELETE FROM location_point p
+WHERE NOT EXISTS (SELECT 1 FROM location l WHERE l.point_id = p.id);
+
+-- Adding stored columns rewrites the table, so it and its primary key are compacted after the delete
+ALTER TABLE location_point
+    ADD COLUMN lat_key INTEGER GENERATED ALWAYS AS (round(latitude * 1000000)::integer) STORED,
+    ADD COLUMN lon_key INTEGER GENERATED ALWAYS AS (round(longitude * 1000000)::integer) STORED;
+
+CREATE UNIQUE INDEX uq_location_point_key ON location_point (lat_key, lon_key, (coalesce(name, '')));
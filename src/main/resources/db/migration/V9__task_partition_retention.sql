@@ -0,0 +1,66 @@
+-- Expires task partitions together with everything hanging off their tasks.
+--
+-- detach_expired_partitions() expired task and comment independently, so it could detach open tasks
+-- (the <table>_p_history partition holds every task from before V3) and leave comments and subtasks
+-- of expired tasks behind. expire_task_partitions() walks expired task partitions oldest first and
+-- stops at the first one that still holds a task that is not DONE. For each partition it expires it
+-- deletes the subtasks of its tasks and their comments in newer comment partitions, then detaches it
+-- together with the comment partition of the same range. When dropping, the locations and reminders
+-- of the dropped tasks are deleted too.
+
+DROP FUNCTION detach_expired_partitions(regclass, interval, boolean);
+
+CREATE FUNCTION expire_task_partitions(retention interval, drop_detached boolean) RETURNS integer
+    LANGUAGE plpgsql AS
+$$
+DECLARE
+    expired    record;
+    comments   regclass;
+    open_tasks boolean;
+    detached   integer := 0;
+BEGIN
+    FOR expired IN SELECT inhrelid::regclass AS child,
+                          partition_bound(inhrelid, 'from') AS from_bound,
+                          partition_bound(inhrelid, 'to') AS to_bound
+                   FROM pg_inherits
+                   WHERE inhparent = 'task'::regclass
+                     AND partition_bound(inhrelid, 'to') <= localtimestamp - retention
+                   ORDER BY partition_bound(inhrelid, 'to') LOOP
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %s WHERE task_type = 0 AND status IS DISTINCT FROM %L)',
+                       expired.child, 'DONE') INTO open_tasks;
+        IF open_tasks THEN
+            RAISE NOTICE 'Keeping % and newer partitions: it still holds open tasks', expired.child;
+            EXIT;
+        END IF;
+
+        EXECUTE format('DELETE FROM subtask WHERE task_id IN (SELECT id FROM %s)', expired.child);
+        EXECUTE format('DELETE FROM comment WHERE created_at >= %L AND task_id IN (SELECT id FROM %s)',
+                       expired.to_bound, expired.child);
+
+        SELECT inhrelid::regclass INTO comments
+        FROM pg_inherits
+        WHERE inhparent = 'comment'::regclass
+          AND partition_bound(inhrelid, 'from') = expired.from_bound
+          AND partition_bound(inhrelid, 'to') = expired.to_bound;
+
+        EXECUTE format('ALTER TABLE task DETACH PARTITION %s', expired.child);
+        IF comments IS NOT NULL THEN
+            EXECUTE format('ALTER TABLE comment DETACH PARTITION %s', comments);
+        END IF;
+
+        IF drop_detached THEN
+            CREATE TEMP TABLE expired_task_refs AS SELECT location_id, deadline_id FROM task WHERE false;
+            EXECUTE format('INSERT INTO expired_task_refs SELECT location_id, deadline_id FROM %s', expired.child);
+            EXECUTE format('DROP TABLE %s', expired.child);
+            IF comments IS NOT NULL THEN
+                EXECUTE format('DROP TABLE %s', comments);
+            END IF;
+            DELETE FROM location WHERE id IN (SELECT location_id FROM expired_task_refs);
+            DELETE FROM reminder WHERE id IN (SELECT deadline_id FROM expired_task_refs);
+            DROP TABLE expired_task_refs;
+        END IF;
+        detached := detached + 1;
+    END LOOP;
+    RETURN detached;
+END
+$$;
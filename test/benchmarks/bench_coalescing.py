@@ -0,0 +1,82 @@
+"""Request coalescing benchmark.
+
+Simulates a shared board refresh: waves of concurrent clients request the
+same group's task list at once. The same waves are then sent at as many
+different groups, where nothing can be collapsed. Reports latency per
+request and, from /actuator/metrics, how many calls were collapsed into
+another call's query.
+
+    python -m test.benchmarks.bench_coalescing --base-url http://localhost:8083
+"""
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from ..conftest import ENDPOINT_GROUP_TASKS
+from .common import base_parser, create_task, latency_summary, print_report
+
+METRIC = "/actuator/metrics/coalescing.calls"
+
+
+def collapsed_calls(session, base_url):
+    response = session.get(base_url + METRIC, params={"tag": "outcome:collapsed"})
+    if response.status_code == 404:
+        # No call has been collapsed yet, so the counter does not exist
+        return 0
+    response.raise_for_status()
+    return int(response.json()["measurements"][0]["value"])
+
+
+def fetch(session, url):
+    started = time.perf_counter()
+    session.get(url).raise_for_status()
+    return time.perf_counter() - started
+
+
+def run_waves(pool, sessions, base_url, group_ids, waves):
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(waves):
+        urls = [base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_ids[i % len(group_ids)])
+                for i in range(len(sessions))]
+        latencies.extend(pool.map(fetch, sessions, urls))
+    return latencies, time.perf_counter() - started
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--waves", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=200)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    shared_group = random.randint(10_000_000, 20_000_000)
+    distinct_groups = [shared_group + i + 1 for i in range(args.clients)]
+    for _ in range(args.tasks):
+        create_task(session, args.base_url, group_id=shared_group)
+    for group_id in distinct_groups:
+        for _ in range(args.tasks // args.clients or 1):
+            create_task(session, args.base_url, group_id=group_id)
+
+    sessions = [requests.Session() for _ in range(args.clients)]
+    rows = []
+    with ThreadPoolExecutor(max_workers=args.clients) as pool:
+        for name, group_ids in (("same group", [shared_group]), ("distinct groups", distinct_groups)):
+            run_waves(pool, sessions, args.base_url, group_ids, 2)
+
+            before = collapsed_calls(session, args.base_url)
+            latencies, elapsed = run_waves(pool, sessions, args.base_url, group_ids, args.waves)
+            collapsed = collapsed_calls(session, args.base_url) - before
+
+            summary = latency_summary(latencies, elapsed)
+            summary["collapsed_pct"] = collapsed / len(latencies) * 100
+            rows.append((name, summary))
+
+    print_report(f"Group board refresh ({args.clients} concurrent clients, {args.waves} waves)", rows)
+
+
+if __name__ == "__main__":
+    main()
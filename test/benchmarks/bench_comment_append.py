@@ -0,0 +1,55 @@
+"""Comment-append throughput benchmark.
+
+Appends comments spread over a pool of tasks, so the numbers reflect the cost of
+the write path itself rather than row contention on a single task. Run it
+against a build before and after a change and compare the reports:
+
+    python -m test.benchmarks.bench_comment_append --base-url http://localhost:8083
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from ..conftest import ENDPOINT_TASK_COMMENT
+from .common import base_parser, create_task, latency_summary, print_report
+
+
+def append_comments(base_url, task_ids, count, worker):
+    session = requests.Session()
+    latencies = []
+    for i in range(count):
+        task_id = task_ids[(worker + i) % len(task_ids)]
+        endpoint = ENDPOINT_TASK_COMMENT.format(taskId=task_id)
+        started = time.perf_counter()
+        response = session.put(base_url + endpoint, json={"authorId": 1, "text": f"bench comment {i}"})
+        latencies.append(time.perf_counter() - started)
+        response.raise_for_status()
+    return latencies
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=50, help="number of tasks to spread comments over")
+    parser.add_argument("--comments", type=int, default=2000, help="total comments to append")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args()
+
+    session = requests.Session()
+    task_ids = [create_task(session, args.base_url)["id"] for _ in range(args.tasks)]
+
+    rows = []
+    for concurrency in args.concurrency:
+        per_worker = args.comments // concurrency
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(append_comments, args.base_url, task_ids, per_worker, worker)
+                       for worker in range(concurrency)]
+            latencies = [latency for future in futures for latency in future.result()]
+        rows.append((f"concurrency={concurrency}", latency_summary(latencies, time.perf_counter() - started)))
+
+    print_report("Comment append throughput", rows)
+
+
+if __name__ == "__main__":
+    main()
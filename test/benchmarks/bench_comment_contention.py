@@ -0,0 +1,68 @@
+"""Hot-task comment contention benchmark.
+
+Fires concurrent comments at a single task, the pattern that serializes on the
+task row lock, and reports throughput and tail latency per concurrency level.
+Compare a run with task-service.comments.activity.write-behind=false against
+one with it set to true:
+
+    python -m test.benchmarks.bench_comment_contention --base-url http://localhost:8083
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from ..conftest import ENDPOINT_TASK_BY_ID, ENDPOINT_TASK_COMMENT
+from .common import base_parser, create_task, latency_summary, print_report
+
+
+def comment_worker(base_url, task_id, count):
+    session = requests.Session()
+    endpoint = base_url + ENDPOINT_TASK_COMMENT.format(taskId=task_id)
+    latencies = []
+    errors = 0
+    for i in range(count):
+        started = time.perf_counter()
+        response = session.put(endpoint, json={"authorId": 1, "text": f"hot comment {i}"})
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors += 1
+    return latencies, errors
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--comments-per-worker", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--settle-seconds", type=float, default=1.0,
+                        help="time to wait for write-behind flushes before checking the counter")
+    args = parser.parse_args()
+
+    session = requests.Session()
+    rows = []
+    for concurrency in args.concurrency:
+        task_id = create_task(session, args.base_url)["id"]
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(comment_worker, args.base_url, task_id, args.comments_per_worker)
+                       for _ in range(concurrency)]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        latencies = [latency for worker_latencies, _ in results for latency in worker_latencies]
+        errors = sum(worker_errors for _, worker_errors in results)
+
+        time.sleep(args.settle_seconds)
+        task = session.get(args.base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id)).json()
+
+        summary = latency_summary(latencies, elapsed)
+        summary["errors"] = errors
+        summary["count_ok"] = task.get("commentCount") == len(latencies) - errors
+        rows.append((f"concurrency={concurrency}", summary))
+
+    print_report("Single-task comment contention", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Response compression benchmark.
+
+Seeds one group with tasks, then fetches the list, streamed list, details and
+export endpoints with each Accept-Encoding and reports bytes on the wire,
+latency and CPU per request. Client CPU is the time spent receiving and
+decoding the body. Server CPU is only reported when --server-pid points at a
+service running on the same Linux host; it is read from /proc. Brotli bodies
+are decoded when the optional `brotli` package is installed.
+
+    python -m test.benchmarks.bench_compression --base-url http://localhost:8083 --server-pid 12345
+"""
+import gzip
+import os
+import random
+import time
+
+import requests
+
+from ..conftest import ENDPOINT_EXPORT_GROUP, ENDPOINT_GROUP_TASKS, ENDPOINT_TASK_DETAILS
+from .common import base_parser, create_task, latency_summary, print_report
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENCODINGS = ("identity", "gzip", "br")
+
+
+def server_cpu_seconds(pid):
+    if pid is None:
+        return None
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    # utime and stime are fields 14 and 15 of the stat line, counted after the command name
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def decode(body, encoding):
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "br":
+        # Without the brotli package the ratio is reported as 0
+        return brotli.decompress(body) if brotli is not None else b""
+    return body
+
+
+def fetch(session, url, encoding, headers):
+    response = session.get(url, headers={**headers, "Accept-Encoding": encoding}, stream=True)
+    response.raise_for_status()
+    wire = response.raw.read(decode_content=False)
+    applied = response.headers.get("Content-Encoding", "identity")
+    return len(wire), len(decode(wire, applied)), applied
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--server-pid", type=int, default=None)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    group_id = random.randint(10_000_000, 20_000_000)
+    tasks = [create_task(session, args.base_url, group_id=group_id) for _ in range(args.tasks)]
+
+    endpoints = [
+        ("list", ENDPOINT_GROUP_TASKS.format(groupId=group_id), {}),
+        ("list-ndjson", ENDPOINT_GROUP_TASKS.format(groupId=group_id), {"Accept": "application/x-ndjson"}),
+        ("details", ENDPOINT_TASK_DETAILS.format(taskId=tasks[0]["id"]), {}),
+        ("export", ENDPOINT_EXPORT_GROUP.format(groupId=group_id), {}),
+    ]
+
+    rows = []
+    for name, path, headers in endpoints:
+        url = args.base_url + path
+        for encoding in ENCODINGS:
+            fetch(session, url, encoding, headers)
+
+            latencies = []
+            wire_bytes = body_bytes = 0
+            applied = "identity"
+            server_before = server_cpu_seconds(args.server_pid)
+            client_before = time.process_time()
+            started = time.perf_counter()
+            for _ in range(args.requests):
+                request_started = time.perf_counter()
+                wire, body, applied = fetch(session, url, encoding, headers)
+                latencies.append(time.perf_counter() - request_started)
+                wire_bytes += wire
+                body_bytes += body
+            elapsed = time.perf_counter() - started
+            client_cpu = time.process_time() - client_before
+            server_after = server_cpu_seconds(args.server_pid)
+
+            summary = latency_summary(latencies, elapsed)
+            summary["applied"] = applied
+            summary["wire_kb"] = wire_bytes / args.requests / 1024
+            summary["ratio"] = body_bytes / wire_bytes if wire_bytes else 0.0
+            summary["client_cpu_ms"] = client_cpu / args.requests * 1000
+            if server_before is not None:
+                summary["server_cpu_ms"] = (server_after - server_before) / args.requests * 1000
+            rows.append((f"{name} {encoding}", summary))
+
+    print_report(f"Response compression ({args.tasks} tasks in group, {args.requests} requests each)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Dashboard read benchmark.
+
+Fills a group with --tasks tasks and compares two ways of drawing its
+dashboard: downloading the full task list and counting on the client, and
+reading the maintained counters from /tasks/stats. Reports latency and
+response size per request.
+
+    python -m test.benchmarks.bench_dashboard --base-url http://localhost:8083
+"""
+import random
+import time
+
+import requests
+
+from ..conftest import ENDPOINT_GROUP_STATS, ENDPOINT_GROUP_TASKS
+from .common import base_parser, create_task, latency_summary, print_report
+
+
+def measure(session, url, iterations):
+    latencies = []
+    size = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        request_started = time.perf_counter()
+        response = session.get(url)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - request_started)
+        size = len(response.content)
+    summary = latency_summary(latencies, time.perf_counter() - started)
+    summary["kb_per_req"] = size / 1024
+    return summary
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    group_id = random.randint(10_000_000, 20_000_000)
+    for _ in range(args.tasks):
+        create_task(session, args.base_url, group_id=group_id)
+
+    rows = []
+    for name, path in (("full list", ENDPOINT_GROUP_TASKS), ("counters", ENDPOINT_GROUP_STATS)):
+        url = args.base_url + path.format(groupId=group_id)
+        measure(session, url, 5)
+        rows.append((name, measure(session, url, args.iterations)))
+
+    print_report(f"Group dashboard ({args.tasks} tasks, {args.iterations} reads)", rows)
+
+
+if __name__ == "__main__":
+    main()
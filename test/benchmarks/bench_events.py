@@ -0,0 +1,103 @@
+"""Task event delivery benchmark.
+
+Holds --subscribers SSE subscriptions on one group and reports the heap
+each one takes, from /actuator/metrics. Then it creates --events
+tasks in it one after another and measures, for every subscriber, the time
+from the create response to the event arriving. For comparison it prints
+what clients polling the group list every --poll-interval seconds would
+cost: requests per second and the average staleness of what they show.
+
+    python -m test.benchmarks.bench_events --base-url http://localhost:8083
+"""
+import random
+import resource
+import selectors
+import socket
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from ..conftest import ENDPOINT_GROUP_EVENTS
+from .common import base_parser, create_task, latency_summary, print_report
+
+HEAP_METRIC = "/actuator/metrics/jvm.memory.used"
+SUBSCRIBERS_METRIC = "/actuator/metrics/events.subscribers"
+
+
+def metric(session, base_url, path, **params):
+    response = session.get(base_url + path, params=params)
+    response.raise_for_status()
+    return response.json()["measurements"][0]["value"]
+
+
+def subscribe(host, port, path):
+    sock = socket.create_connection((host, port))
+    sock.sendall(f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nAccept: text/event-stream\r\n\r\n".encode())
+    received = b""
+    while b"subscribed" not in received:
+        chunk = sock.recv(4096)
+        if not chunk:
+            raise SystemExit(f"Subscription refused: {received[:200]!r}")
+        received += chunk
+    sock.setblocking(False)
+    return sock
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--poll-interval", type=float, default=5)
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (max(soft, min(hard, args.subscribers + 100)), hard))
+
+    url = urlparse(args.base_url)
+    group_id = random.randint(10_000_000, 20_000_000)
+    path = ENDPOINT_GROUP_EVENTS.format(groupId=group_id)
+    session = requests.Session()
+    subscribers_before = metric(session, args.base_url, SUBSCRIBERS_METRIC)
+    heap_before = metric(session, args.base_url, HEAP_METRIC, tag="area:heap")
+    sockets = [subscribe(url.hostname, url.port or 80, path) for _ in range(args.subscribers)]
+    subscribers = metric(session, args.base_url, SUBSCRIBERS_METRIC) - subscribers_before
+    heap_per_subscription = (metric(session, args.base_url, HEAP_METRIC, tag="area:heap") - heap_before) \
+        / args.subscribers
+    selector = selectors.DefaultSelector()
+    for sock in sockets:
+        selector.register(sock, selectors.EVENT_READ, b"")
+
+    latencies = []
+    started = time.perf_counter()
+    try:
+        for _ in range(args.events):
+            task = create_task(session, args.base_url, group_id=group_id)
+            created_at = time.perf_counter()
+            marker = f'"taskId":{task["id"]}'.encode()
+            pending = set(sockets)
+            while pending and time.perf_counter() - created_at < 30:
+                for key, _ in selector.select(timeout=1):
+                    data = key.data + key.fileobj.recv(65536)
+                    if marker in data:
+                        latencies.append(time.perf_counter() - created_at)
+                        pending.discard(key.fileobj)
+                        data = data[data.index(marker) + len(marker):]
+                    selector.modify(key.fileobj, selectors.EVENT_READ, data)
+            if pending:
+                print(f"{len(pending)} subscribers missed task {task['id']}")
+        elapsed = time.perf_counter() - started
+    finally:
+        selector.close()
+        for sock in sockets:
+            sock.close()
+
+    rows = [("sse delivery", latency_summary(latencies, elapsed))]
+    print_report(f"Event delivery to {args.subscribers} subscribers ({args.events} events)", rows)
+    print(f"{subscribers:.0f} subscriptions registered, {heap_per_subscription / 1024:.1f} KB heap each")
+    print(f"polling every {args.poll_interval:.0f}s instead: {args.subscribers / args.poll_interval:.0f} "
+          f"list requests/s, {args.poll_interval / 2 * 1000:.0f} ms average staleness")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Idempotency key overhead benchmark.
+
+Creates --requests tasks from --concurrency threads three ways: without a
+key, with a fresh Idempotency-Key each (the cost added to every write), and
+as retries of already completed keys (the cost of a replay, which never
+reaches the write path).
+
+    python -m test.benchmarks.bench_idempotency --base-url http://localhost:8083
+"""
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from ..conftest import ENDPOINT_TASKS
+from .common import base_parser, latency_summary, print_report, task_payload
+
+
+def run(base_url, payloads, keys, concurrency):
+    def timed_create(index):
+        headers = {"Idempotency-Key": keys[index]} if keys else {}
+        started = time.perf_counter()
+        response = requests.post(base_url + ENDPOINT_TASKS, json=payloads[index], headers=headers)
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        latencies = list(pool.map(timed_create, range(len(payloads))))
+    return latency_summary(latencies, time.perf_counter() - started)
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    payloads = [task_payload() for _ in range(args.requests)]
+    keys = [str(uuid.uuid4()) for _ in range(args.requests)]
+
+    rows = [
+        ("no key", run(args.base_url, payloads, None, args.concurrency)),
+        ("fresh key", run(args.base_url, payloads, keys, args.concurrency)),
+        ("replayed key", run(args.base_url, payloads, keys, args.concurrency)),
+    ]
+    print_report(f"Task create with {args.concurrency} clients", rows)
+
+
+if __name__ == "__main__":
+    main()
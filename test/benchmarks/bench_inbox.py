@@ -0,0 +1,87 @@
+"""Home screen benchmark: per-source lists versus the unified inbox.
+
+Gives each simulated user authored tasks, assigned tasks and --groups
+groups, then loads their home screen the old way (the author, doer and one
+group list per group, merged and sorted on the client) and through
+/tasks/inbox. Reports latency per home screen load and bytes transferred.
+
+    python -m test.benchmarks.bench_inbox --base-url http://localhost:8083
+"""
+import random
+import time
+
+import requests
+
+from ..conftest import ENDPOINT_DOER_TASKS, ENDPOINT_GROUP_TASKS, ENDPOINT_INBOX, ENDPOINT_TASKS, ENDPOINT_USER_TASKS
+from .common import base_parser, create_task, latency_summary, print_report, task_payload
+
+
+def deadline_of(task):
+    return (task.get("deadline") or {}).get("time") or "~"
+
+
+def load_separately(session, base_url, user_id, group_ids):
+    size = 0
+    merged = {}
+    urls = [ENDPOINT_USER_TASKS.format(userId=user_id), ENDPOINT_DOER_TASKS.format(doerId=user_id)]
+    urls += [ENDPOINT_GROUP_TASKS.format(groupId=group_id) for group_id in group_ids]
+    for url in urls:
+        response = session.get(base_url + url)
+        response.raise_for_status()
+        size += len(response.content)
+        for task in response.json():
+            merged[task["id"]] = task
+    # What the device did with the lists: first page of the merged set by deadline
+    sorted(merged.values(), key=lambda task: (deadline_of(task), task["id"]))[:50]
+    return size
+
+
+def load_inbox(session, base_url, user_id, group_ids):
+    response = session.get(base_url + ENDPOINT_INBOX.format(userId=user_id),
+                           params={"groupIds": ",".join(map(str, group_ids)), "size": 50})
+    response.raise_for_status()
+    return len(response.content)
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--groups", type=int, default=5)
+    parser.add_argument("--tasks-per-source", type=int, default=30)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    homes = []
+    for _ in range(args.users):
+        user_id = random.randint(10_000_000, 20_000_000)
+        group_ids = [random.randint(10_000_000, 20_000_000) for _ in range(args.groups)]
+        for _ in range(args.tasks_per_source):
+            create_task(session, args.base_url, author_id=user_id)
+            session.post(args.base_url + ENDPOINT_TASKS,
+                         json={**task_payload(), "doerId": user_id}).raise_for_status()
+            # Shared group tasks the user also authored show up in several lists
+            create_task(session, args.base_url, author_id=user_id, group_id=random.choice(group_ids))
+            for group_id in group_ids:
+                create_task(session, args.base_url, group_id=group_id)
+        homes.append((user_id, group_ids))
+
+    rows = []
+    for name, load in (("per-source lists", load_separately), ("inbox", load_inbox)):
+        latencies = []
+        size = 0
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            for user_id, group_ids in homes:
+                request_started = time.perf_counter()
+                size += load(session, args.base_url, user_id, group_ids)
+                latencies.append(time.perf_counter() - request_started)
+        summary = latency_summary(latencies, time.perf_counter() - started)
+        summary["kb_per_load"] = size / len(latencies) / 1024
+        rows.append((name, summary))
+
+    print_report(f"Home screen load ({args.groups} groups, {args.tasks_per_source} tasks per source)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""List endpoint allocation benchmark.
+
+Seeds one group with tasks and notes, then calls each list endpoint repeatedly
+and reports heap bytes allocated per request next to latency. Start the service
+with task-service.metrics.request-allocation=true to get exact per-request
+numbers. Without it, the script falls back to the JVM-wide
+jvm.gc.memory.allocated counter, which only moves at GC time and needs a large
+--requests value to be meaningful. Builds without the per-request metric can
+still be compared this way.
+
+    python -m test.benchmarks.bench_list_allocation --base-url http://localhost:8083
+"""
+import random
+import time
+
+import requests
+
+from ..conftest import ENDPOINT_GROUP_NOTES, ENDPOINT_GROUP_TASKS, ENDPOINT_NOTES
+from .common import base_parser, create_task, latency_summary, print_report, random_suffix
+
+REQUEST_ALLOCATION_METRIC = "/actuator/metrics/http.server.requests.allocated"
+JVM_ALLOCATION_METRIC = "/actuator/metrics/jvm.gc.memory.allocated"
+
+
+def measurement(session, base_url, name):
+    for stat in session.get(base_url + name).json().get("measurements", []):
+        if stat["statistic"] in ("TOTAL", "COUNT"):
+            return stat["value"]
+    return 0.0
+
+
+def allocated_bytes(session, base_url, uri_pattern):
+    response = session.get(base_url + REQUEST_ALLOCATION_METRIC, params={"tag": f"uri:{uri_pattern}"})
+    if response.status_code == 200:
+        for stat in response.json()["measurements"]:
+            if stat["statistic"] == "TOTAL":
+                return stat["value"], True
+    return measurement(session, base_url, JVM_ALLOCATION_METRIC), False
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--notes", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    group_id = random.randint(10_000_000, 20_000_000)
+    for _ in range(args.tasks):
+        create_task(session, args.base_url, group_id=group_id)
+    for _ in range(args.notes):
+        session.post(args.base_url + ENDPOINT_NOTES, json={
+            "title": "Bench Note " + random_suffix(),
+            "description": "Benchmark note description",
+            "authorId": 1,
+            "groupId": group_id,
+            "location": {"latitude": 1.0, "longitude": 2.0, "name": "Office", "remindByLocation": False}
+        }).raise_for_status()
+
+    rows = []
+    for pattern in (ENDPOINT_GROUP_TASKS, ENDPOINT_GROUP_NOTES):
+        url = args.base_url + pattern.format(groupId=group_id)
+        session.get(url).raise_for_status()
+
+        before, exact = allocated_bytes(session, args.base_url, pattern)
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(args.requests):
+            request_started = time.perf_counter()
+            session.get(url).raise_for_status()
+            latencies.append(time.perf_counter() - request_started)
+        elapsed = time.perf_counter() - started
+        after, _ = allocated_bytes(session, args.base_url, pattern)
+
+        summary = latency_summary(latencies, elapsed)
+        summary["alloc_kb_per_req"] = (after - before) / args.requests / 1024
+        summary["exact_alloc"] = exact
+        rows.append((pattern, summary))
+
+    print_report(f"List allocation ({args.tasks} tasks, {args.notes} notes per group)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Logging overhead benchmark.
+
+Starts the boot jar once with the old logging setup (synchronous plain
+console output, every INFO line, entity dumps and SQL echo) and once with
+the defaults (asynchronous JSON, sampled service logs, no dumps), then
+drives the same concurrent create/get/details mix against each and reports
+throughput and latency. Console output goes to a file so that writing it
+costs what it would on a real host. Build the jar first and stop any
+instance already listening on the service port:
+
+    ./gradlew bootJar
+    python -m test.benchmarks.bench_logging --base-url http://localhost:8083
+"""
+import os
+import random
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from ..conftest import ENDPOINT_TASK_BY_ID, ENDPOINT_TASK_DETAILS
+from .bench_startup import jar_path
+from .bench_warmup import wait_until_ready
+from .common import base_parser, create_task, latency_summary, print_report
+
+MODES = {
+    "sync-verbose": [
+        "--task-service.logging.mode=sync",
+        "--task-service.logging.format=plain",
+        "--task-service.logging.info-sample-rate=1",
+        "--task-service.logging.entity-dumps=true",
+        "--spring.jpa.show-sql=true",
+        "--spring.jpa.properties.hibernate.format_sql=true",
+    ],
+    "async-sampled": [],
+}
+
+
+def worker(base_url, deadline, latencies, lock):
+    session = requests.Session()
+    author_id = random.randint(10_000_000, 20_000_000)
+    local = []
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        task = create_task(session, base_url, author_id=author_id)
+        local.append(time.perf_counter() - started)
+        for path in (ENDPOINT_TASK_BY_ID.format(taskId=task["id"]), ENDPOINT_TASK_DETAILS.format(taskId=task["id"])):
+            started = time.perf_counter()
+            session.get(base_url + path).raise_for_status()
+            local.append(time.perf_counter() - started)
+    with lock:
+        latencies.extend(local)
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--build-dir", default="build")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--timeout", type=float, default=180)
+    args = parser.parse_args()
+
+    jar = jar_path(args.build_dir)
+    rows = []
+    for mode, flags in MODES.items():
+        with tempfile.TemporaryFile() as log_file:
+            process = subprocess.Popen(["java", "-jar", jar, *flags], stdout=log_file, stderr=subprocess.STDOUT)
+            try:
+                wait_until_ready(process, args.base_url, args.timeout)
+
+                latencies = []
+                lock = threading.Lock()
+                started = time.perf_counter()
+                deadline = started + args.duration
+                with ThreadPoolExecutor(max_workers=args.threads) as pool:
+                    for future in [pool.submit(worker, args.base_url, deadline, latencies, lock)
+                                   for _ in range(args.threads)]:
+                        future.result()
+                elapsed = time.perf_counter() - started
+            finally:
+                process.terminate()
+                process.wait()
+            log_bytes = os.fstat(log_file.fileno()).st_size
+
+        summary = latency_summary(latencies, elapsed)
+        summary["log_kb_per_req"] = log_bytes / len(latencies) / 1024 if latencies else 0.0
+        rows.append((mode, summary))
+
+    print_report(f"Logging overhead ({args.threads} threads, {args.duration:.0f}s each)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Transactional outbox benchmark.
+
+Creates --tasks tasks from --concurrency threads and reports the write
+latency, which now includes the outbox insert. Then polls the relay's
+metrics until every event it wrote has been delivered and reports the
+relay throughput and the highest lag it showed meanwhile. Start the service
+with the dev profile, which enables the outbox, and once without it to get
+the baseline write latency.
+
+    python -m test.benchmarks.bench_outbox --base-url http://localhost:8083
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .common import base_parser, create_task, latency_summary, print_report
+
+RELAYED_METRIC = "/actuator/metrics/outbox.relay.messages"
+LAG_METRIC = "/actuator/metrics/outbox.relay.lag"
+
+
+def metric(session, base_url, path):
+    response = session.get(base_url + path)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()["measurements"][0]["value"]
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--drain-timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    relayed_before = metric(session, args.base_url, RELAYED_METRIC)
+
+    def timed_create(_):
+        started = time.perf_counter()
+        create_task(requests, args.base_url)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        latencies = list(pool.map(timed_create, range(args.tasks)))
+    elapsed = time.perf_counter() - started
+    rows = [("create", latency_summary(latencies, elapsed))]
+
+    if relayed_before is None:
+        print_report("Outbox relay disabled, write latency only", rows)
+        return
+
+    max_lag = 0.0
+    relayed = relayed_before
+    deadline = time.monotonic() + args.drain_timeout
+    while relayed - relayed_before < args.tasks and time.monotonic() < deadline:
+        time.sleep(0.2)
+        relayed = metric(session, args.base_url, RELAYED_METRIC)
+        max_lag = max(max_lag, metric(session, args.base_url, LAG_METRIC))
+    drained = time.perf_counter() - started
+
+    print_report(f"Outbox with {args.concurrency} writers", rows)
+    delivered = relayed - relayed_before
+    print(f"  relayed {delivered:.0f} events in {drained:.1f}s "
+          f"({delivered / drained:.0f}/s from the first write), max lag {max_lag:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
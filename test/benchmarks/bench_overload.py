@@ -0,0 +1,106 @@
+"""Overload test for admission control.
+
+Runs increasing numbers of concurrent clients, each reading its own user's
+task list and honouring Retry-After, next to one abusive client looping on
+a single user's list without backing off. For every level it reports
+goodput (successful requests per second), shed requests and the latency of
+successful ones. The run fails when goodput at the highest level drops
+below --min-goodput-ratio of the best level, i.e. when the service
+collapses past saturation instead of shedding the excess.
+
+    python -m test.benchmarks.bench_overload --base-url http://localhost:8083
+"""
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from ..conftest import ENDPOINT_USER_TASKS
+from .common import base_parser, create_task, percentile, print_report
+
+SHED = (429, 503)
+
+
+def client(base_url, user_id, deadline, honour_retry_after, results, lock):
+    session = requests.Session()
+    endpoint = base_url + ENDPOINT_USER_TASKS.format(userId=user_id)
+    ok_latencies = []
+    shed = errors = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = session.get(endpoint, timeout=30)
+        except requests.RequestException:
+            errors += 1
+            continue
+        if response.status_code == 200:
+            ok_latencies.append(time.perf_counter() - started)
+        elif response.status_code in SHED:
+            shed += 1
+            if honour_retry_after:
+                retry_after = float(response.headers.get("Retry-After", "1"))
+                time.sleep(min(retry_after, max(0.0, deadline - time.perf_counter())))
+        else:
+            errors += 1
+    with lock:
+        results["ok"].extend(ok_latencies)
+        results["shed"] += shed
+        results["errors"] += errors
+
+
+def run_level(base_url, users, abuser, clients, duration):
+    results = {"ok": [], "shed": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    with ThreadPoolExecutor(max_workers=clients + 1) as pool:
+        futures = [pool.submit(client, base_url, users[i % len(users)], deadline, True, results, lock)
+                   for i in range(clients)]
+        futures.append(pool.submit(client, base_url, abuser, deadline, False, results, lock))
+        for future in futures:
+            future.result()
+    return results
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--levels", type=int, nargs="+", default=[4, 16, 64, 128, 256])
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--users", type=int, default=64)
+    parser.add_argument("--tasks-per-user", type=int, default=20)
+    parser.add_argument("--min-goodput-ratio", type=float, default=0.8)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    users = [random.randint(10_000_000, 20_000_000) for _ in range(args.users)]
+    for user_id in users:
+        for _ in range(args.tasks_per_user):
+            create_task(session, args.base_url, author_id=user_id)
+    abuser = users[0]
+
+    rows = []
+    goodputs = []
+    for clients in args.levels:
+        results = run_level(args.base_url, users, abuser, clients, args.duration)
+        goodput = len(results["ok"]) / args.duration
+        goodputs.append(goodput)
+        rows.append((f"clients={clients}", {
+            "goodput_rps": goodput,
+            "shed_rps": results["shed"] / args.duration,
+            "errors": results["errors"],
+            "ok_p50_ms": percentile(results["ok"], 50) * 1000,
+            "ok_p99_ms": percentile(results["ok"], 99) * 1000,
+        }))
+
+    print_report(f"Overload ({args.duration:.0f}s per level, one abusive client)", rows)
+
+    ratio = goodputs[-1] / max(goodputs) if max(goodputs) else 0.0
+    print(f"goodput at {args.levels[-1]} clients is {ratio:.0%} of the best level")
+    if ratio < args.min_goodput_ratio:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
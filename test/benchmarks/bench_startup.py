@@ -0,0 +1,94 @@
+"""Service startup benchmark.
+
+Starts the service repeatedly in each mode and measures the time from
+process launch until the first POST /tasks succeeds, which is what an
+autoscaled instance needs before it can take traffic. Build the artifacts
+first and stop any instance already listening on the service port:
+
+    ./gradlew bootJar cdsArchive
+    python -m test.benchmarks.bench_startup --base-url http://localhost:8083
+
+Modes:
+    default     java -jar with the default profile
+    fast-start  java -jar with AOT and the fast-start profile
+    cds         fast-start from build/cds with the AppCDS archive
+"""
+import glob
+import os
+import subprocess
+import time
+
+import requests
+
+from ..conftest import ENDPOINT_TASKS
+from .common import base_parser, print_report, task_payload
+
+
+def jar_path(build_dir):
+    jars = [jar for jar in glob.glob(os.path.join(build_dir, "libs", "*.jar")) if not jar.endswith("-plain.jar")
+            and not jar.endswith("-aot.jar")]
+    if not jars:
+        raise SystemExit(f"No boot jar in {build_dir}/libs, run ./gradlew bootJar first")
+    return jars[0]
+
+
+def modes(build_dir):
+    jar = jar_path(build_dir)
+    cds_dir = os.path.join(build_dir, "cds")
+    return {
+        "default": (["java", "-jar", jar], None),
+        "fast-start": (["java", "-Dspring.aot.enabled=true", "-jar", jar, "--spring.profiles.active=fast-start"],
+                       None),
+        "cds": (["java", "-XX:SharedArchiveFile=application.jsa", "-Dspring.aot.enabled=true", "-cp", "lib/*",
+                 "ru.tcai.taskservice.Main", "--spring.profiles.active=fast-start"], cds_dir),
+    }
+
+
+def time_to_first_task(command, cwd, base_url, timeout):
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise SystemExit(f"{' '.join(command)} exited with {process.returncode}")
+            try:
+                response = requests.post(base_url + ENDPOINT_TASKS, json=task_payload(), timeout=timeout)
+                if response.ok:
+                    return time.perf_counter() - started
+            except requests.ConnectionError:
+                pass
+            time.sleep(0.05)
+        raise SystemExit(f"No successful POST {ENDPOINT_TASKS} within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--build-dir", default="build")
+    parser.add_argument("--modes", default="default,fast-start,cds")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    available = modes(args.build_dir)
+    rows = []
+    for name in args.modes.split(","):
+        command, cwd = available[name]
+        # The first start also applies pending migrations and warms the OS page cache
+        time_to_first_task(command, cwd, args.base_url, args.timeout)
+
+        samples = [time_to_first_task(command, cwd, args.base_url, args.timeout) for _ in range(args.runs)]
+        rows.append((name, {
+            "runs": len(samples),
+            "min_s": min(samples),
+            "mean_s": sum(samples) / len(samples),
+            "max_s": max(samples),
+        }))
+
+    print_report(f"Time to first successful POST {ENDPOINT_TASKS} ({args.runs} runs each)", rows)
+
+
+if __name__ == "__main__":
+    main()
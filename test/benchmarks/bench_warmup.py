@@ -0,0 +1,88 @@
+"""First-minute latency benchmark, with and without the startup warmup.
+
+Starts the boot jar once per mode, waits for the readiness probe and then
+drives a create/get/details/list mix for --duration seconds. Latencies are
+reported per --bucket second window so the cold first window can be
+compared against the steady state. Build the jar first and stop any
+instance already listening on the service port:
+
+    ./gradlew bootJar
+    python -m test.benchmarks.bench_warmup --base-url http://localhost:8083
+"""
+import random
+import subprocess
+import time
+
+import requests
+
+from ..conftest import ENDPOINT_GROUP_TASKS, ENDPOINT_READINESS, ENDPOINT_TASK_BY_ID, ENDPOINT_TASK_DETAILS
+from .bench_startup import jar_path
+from .common import base_parser, create_task, latency_summary, print_report
+
+MODES = {
+    "cold": "--task-service.warmup.enabled=false",
+    "warm": "--task-service.warmup.enabled=true",
+}
+
+
+def wait_until_ready(process, base_url, timeout):
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if process.poll() is not None:
+            raise SystemExit(f"Service exited with {process.returncode}")
+        try:
+            if requests.get(base_url + ENDPOINT_READINESS, timeout=timeout).ok:
+                return time.perf_counter() - started
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.05)
+    raise SystemExit(f"Service not ready within {timeout}s")
+
+
+def drive(session, base_url, duration, bucket):
+    group_id = random.randint(10_000_000, 20_000_000)
+    buckets = {}
+    started = time.perf_counter()
+    while time.perf_counter() - started < duration:
+        request_started = time.perf_counter()
+        task = create_task(session, base_url, group_id=group_id)
+        for path in (ENDPOINT_TASK_BY_ID.format(taskId=task["id"]),
+                     ENDPOINT_TASK_DETAILS.format(taskId=task["id"]),
+                     ENDPOINT_GROUP_TASKS.format(groupId=group_id)):
+            session.get(base_url + path).raise_for_status()
+        # One sample per round of four requests, so the windows stay comparable between modes
+        latency = (time.perf_counter() - request_started) / 4
+        window = int((request_started - started) // bucket)
+        buckets.setdefault(window, []).append(latency)
+    return buckets
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--build-dir", default="build")
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--bucket", type=float, default=10)
+    parser.add_argument("--timeout", type=float, default=180)
+    args = parser.parse_args()
+
+    jar = jar_path(args.build_dir)
+    rows = []
+    for mode, flag in MODES.items():
+        process = subprocess.Popen(["java", "-jar", jar, flag], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            ready_seconds = wait_until_ready(process, args.base_url, args.timeout)
+            buckets = drive(requests.Session(), args.base_url, args.duration, args.bucket)
+        finally:
+            process.terminate()
+            process.wait()
+
+        print(f"{mode}: ready after {ready_seconds:.2f}s")
+        for window in sorted(buckets):
+            summary = latency_summary(buckets[window], args.bucket)
+            rows.append((f"{mode} {window * args.bucket:.0f}-{(window + 1) * args.bucket:.0f}s", summary))
+
+    print_report(f"Latency per request after readiness ({args.bucket:.0f}s windows)", rows)
+
+
+if __name__ == "__main__":
+    main()
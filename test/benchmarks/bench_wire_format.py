@@ -0,0 +1,87 @@
+"""JSON versus CBOR wire format benchmark.
+
+Seeds one user with tasks, then calls the list, details and create endpoints
+once with JSON and once with CBOR. It reports payload size, request latency
+and client-side encode/decode time. Server-side serialization cost shows up
+as the latency difference between the two formats.
+
+    python -m test.benchmarks.bench_wire_format --base-url http://localhost:8083
+"""
+import json
+import random
+import time
+
+import cbor2
+import requests
+
+from ..cbor_client import CBOR
+from ..conftest import ENDPOINT_TASK_DETAILS, ENDPOINT_TASKS, ENDPOINT_USER_TASKS
+from .common import base_parser, create_task, latency_summary, print_report, task_payload
+
+FORMATS = {
+    "json": ("application/json", json.dumps, json.loads),
+    "cbor": (CBOR, cbor2.dumps, cbor2.loads),
+}
+
+
+def run(session, method, url, media_type, dumps, loads, payload, requests_count):
+    latencies = []
+    body_bytes = 0
+    encode_seconds = decode_seconds = 0.0
+    started = time.perf_counter()
+    for _ in range(requests_count):
+        headers = {"Accept": media_type}
+        data = None
+        if payload is not None:
+            encode_started = time.perf_counter()
+            data = dumps(payload)
+            encode_seconds += time.perf_counter() - encode_started
+            headers["Content-Type"] = media_type
+
+        request_started = time.perf_counter()
+        response = session.request(method, url, data=data, headers=headers)
+        latencies.append(time.perf_counter() - request_started)
+        response.raise_for_status()
+
+        decode_started = time.perf_counter()
+        loads(response.content)
+        decode_seconds += time.perf_counter() - decode_started
+        body_bytes += len(response.content)
+    elapsed = time.perf_counter() - started
+
+    summary = latency_summary(latencies, elapsed)
+    summary["body_kb"] = body_bytes / requests_count / 1024
+    summary["encode_us"] = encode_seconds / requests_count * 1_000_000
+    summary["decode_us"] = decode_seconds / requests_count * 1_000_000
+    return summary
+
+
+def main():
+    parser = base_parser(__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    author_id = random.randint(10_000_000, 20_000_000)
+    tasks = [create_task(session, args.base_url, author_id=author_id) for _ in range(args.tasks)]
+
+    cases = [
+        ("list", "GET", ENDPOINT_USER_TASKS.format(userId=author_id), None),
+        ("details", "GET", ENDPOINT_TASK_DETAILS.format(taskId=tasks[0]["id"]), None),
+        ("create", "POST", ENDPOINT_TASKS, task_payload(author_id)),
+    ]
+
+    rows = []
+    for name, method, path, payload in cases:
+        for format_name, (media_type, dumps, loads) in FORMATS.items():
+            url = args.base_url + path
+            run(session, method, url, media_type, dumps, loads, payload, 5)
+            summary = run(session, method, url, media_type, dumps, loads, payload, args.requests)
+            rows.append((f"{name} {format_name}", summary))
+
+    print_report(f"Wire format ({args.tasks} tasks per user, {args.requests} requests each)", rows)
+
+
+if __name__ == "__main__":
+    main()
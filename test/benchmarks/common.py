@@ -0,0 +1,93 @@
+"""Shared helpers for the API benchmarks."""
+import argparse
+import random
+import statistics
+import string
+import time
+
+import requests
+
+from ..conftest import ENDPOINT_TASKS
+
+
+def base_parser(description):
+    """Returns an argument parser with the options every benchmark accepts"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--base-url", default="http://localhost:8083")
+    return parser
+
+
+def random_suffix(length=6):
+    return ''.join(random.choices(string.ascii_letters, k=length))
+
+
+def task_payload(author_id=None, group_id=None):
+    """Builds a task creation payload shaped like the valid_task_data fixture"""
+    payload = {
+        "title": "Bench Task " + random_suffix(),
+        "description": "Benchmark task description",
+        "authorId": author_id if author_id is not None else random.randint(1, 100000),
+        "location": {
+            "latitude": 40.7128,
+            "longitude": -74.0060,
+            "name": "New York City",
+            "remindByLocation": True
+        },
+        "deadline": {
+            "time": "2030-01-01T12:00:00Z",
+            "remindByTime": True
+        }
+    }
+    if group_id is not None:
+        payload["groupId"] = group_id
+    return payload
+
+
+def create_task(session, base_url, author_id=None, group_id=None):
+    response = session.post(base_url + ENDPOINT_TASKS, json=task_payload(author_id, group_id))
+    response.raise_for_status()
+    return response.json()
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def latency_summary(latencies, elapsed):
+    """Summarizes request latencies (seconds) measured over elapsed wall time"""
+    return {
+        "requests": len(latencies),
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.mean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+def print_report(title, rows):
+    """Prints a list of (label, summary dict) rows as an aligned table"""
+    print(title)
+    if not rows:
+        return
+    keys = list(rows[0][1].keys())
+    print("  " + "label".ljust(24) + "".join(k.rjust(16) for k in keys))
+    for label, summary in rows:
+        cells = []
+        for key in keys:
+            value = summary[key]
+            cells.append((f"{value:.2f}" if isinstance(value, float) else str(value)).rjust(16))
+        print("  " + str(label).ljust(24) + "".join(cells))
+
+
+def timed(fn, *args, **kwargs):
+    """Calls fn and returns (result, elapsed seconds)"""
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
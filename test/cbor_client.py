@@ -0,0 +1,51 @@
+"""Minimal CBOR client for the task service API.
+
+Requests and responses carry the same field names as the JSON API, encoded as
+CBOR maps with keys in alphabetical order. Timestamps are ISO-8601 strings.
+"""
+import cbor2
+import requests
+
+CBOR = "application/cbor"
+
+
+def encode(payload):
+    return cbor2.dumps(payload)
+
+
+def decode(response):
+    """Decodes a CBOR response body, returning None for empty bodies"""
+    if not response.content:
+        return None
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.startswith(CBOR):
+        raise ValueError(f"Expected {CBOR} response, got {content_type!r}")
+    return cbor2.loads(response.content)
+
+
+class CborClient:
+    """Sends CBOR request bodies and asks for CBOR responses"""
+
+    def __init__(self, base_url, session=None):
+        self.base_url = base_url
+        self.session = session or requests.Session()
+
+    def request(self, method, endpoint, payload=None, **kwargs):
+        headers = {"Accept": CBOR, **kwargs.pop("headers", {})}
+        data = None
+        if payload is not None:
+            headers["Content-Type"] = CBOR
+            data = encode(payload)
+        return self.session.request(method, self.base_url + endpoint, data=data, headers=headers, **kwargs)
+
+    def get(self, endpoint, **kwargs):
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, payload=None, **kwargs):
+        return self.request("POST", endpoint, payload, **kwargs)
+
+    def put(self, endpoint, payload=None, **kwargs):
+        return self.request("PUT", endpoint, payload, **kwargs)
+
+    def delete(self, endpoint, **kwargs):
+        return self.request("DELETE", endpoint, **kwargs)
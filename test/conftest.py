@@ -7,15 +7,28 @@ from datetime import datetime, timedelta
 # API Endpoints
 ENDPOINT_TASKS = '/tasks'
 ENDPOINT_TASK_BY_ID = '/tasks/{taskId}'
+ENDPOINT_TASKS_BATCH = '/tasks/batch'
 ENDPOINT_TASK_COMMENT = '/tasks/{taskId}/comment'
 ENDPOINT_COMMENT_DELETE = '/tasks/comment/{commentId}'
 ENDPOINT_PERSONAL_TASKS = '/tasks/personal/{userId}'
 ENDPOINT_USER_TASKS = '/tasks/user/{userId}'
 ENDPOINT_DOER_TASKS = '/tasks/doer/{doerId}'
 ENDPOINT_GROUP_TASKS = '/tasks/group/{groupId}'
+ENDPOINT_INBOX = '/tasks/inbox/{userId}'
 ENDPOINT_TASK_DETAILS = '/tasks/details/{taskId}'
 ENDPOINT_ADD_SUBTASK = '/tasks/{taskId}/subtask'
 ENDPOINT_UPDATE_SUBTASK_STATUS = '/tasks/subtasks/{subtaskId}/status'
+ENDPOINT_SUBTASK_BY_ID = '/tasks/subtasks/{subtaskId}'
+ENDPOINT_EXPORT_GROUP = '/tasks/export/group/{groupId}'
+ENDPOINT_EXPORT_USER = '/tasks/export/user/{userId}'
+ENDPOINT_IMPORT = '/tasks/import'
+ENDPOINT_GROUP_EVENTS = '/tasks/events/group/{groupId}'
+ENDPOINT_USER_EVENTS = '/tasks/events/user/{userId}'
+ENDPOINT_GROUP_STATS = '/tasks/stats/group/{groupId}'
+ENDPOINT_USER_STATS = '/tasks/stats/user/{userId}'
+ENDPOINT_STATS_REBUILD = '/tasks/stats/rebuild'
+ENDPOINT_READINESS = '/actuator/health/readiness'
+ENDPOINT_LIVENESS = '/actuator/health/liveness'
 
 # Note Endpoints (for completeness based on OpenAPI spec)
 ENDPOINT_NOTES = '/tasks/note'
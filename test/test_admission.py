@@ -0,0 +1,78 @@
+import random
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from .conftest import ENDPOINT_USER_TASKS, ENDPOINT_GROUP_TASKS
+
+USER_ID_HEADER = "X-User-Id"
+
+
+class TestAdmissionControl:
+    """Tests for per-user rate limiting on user-scoped endpoints"""
+
+    def test_user_endpoint_reports_rate_limit(self, base_url):
+        """Test that user-scoped responses carry the user's rate limit headers"""
+        user_id = random.randint(5000000, 6000000)
+        endpoint = base_url + ENDPOINT_USER_TASKS.format(userId=user_id)
+
+        first = requests.get(endpoint)
+        second = requests.get(endpoint)
+
+        assert first.status_code == 200
+        assert int(first.headers["X-RateLimit-Limit"]) > 0
+        assert int(second.headers["X-RateLimit-Remaining"]) <= int(first.headers["X-RateLimit-Remaining"])
+
+    def test_user_header_selects_bucket(self, base_url):
+        """Test that requests without a user in the path are limited by the X-User-Id header"""
+        group_id = random.randint(5000000, 6000000)
+        response = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id),
+                                headers={USER_ID_HEADER: str(random.randint(5000000, 6000000))})
+
+        assert response.status_code == 200
+        assert "X-RateLimit-Remaining" in response.headers
+
+    def test_flooding_user_is_rejected_with_retry_after(self, base_url):
+        """Test that a user looping on their task list gets 429 with Retry-After"""
+        user_id = random.randint(5000000, 6000000)
+        endpoint = base_url + ENDPOINT_USER_TASKS.format(userId=user_id)
+        limit = int(requests.get(endpoint).headers["X-RateLimit-Limit"])
+
+        def flood(_):
+            with requests.Session() as session:
+                return [session.get(endpoint) for _ in range(limit // 8)]
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            responses = [response for batch in pool.map(flood, range(32)) for response in batch]
+
+        rejected = [response for response in responses if response.status_code == 429]
+        assert rejected
+        assert int(rejected[0].headers["Retry-After"]) >= 1
+        assert rejected[0].json()["status"] == 429
+
+    def test_other_users_are_not_affected(self, base_url):
+        """Test that one user's exhausted bucket does not limit another user"""
+        flooded = random.randint(5000000, 6000000)
+        endpoint = base_url + ENDPOINT_USER_TASKS.format(userId=flooded)
+        limit = int(requests.get(endpoint).headers["X-RateLimit-Limit"])
+        with requests.Session() as session:
+            for _ in range(limit):
+                session.get(endpoint)
+
+        other = requests.get(base_url + ENDPOINT_USER_TASKS.format(userId=flooded + 1))
+
+        assert other.status_code == 200
+
+    def test_user_header_does_not_override_path_user(self, base_url):
+        """Test that a changing X-User-Id header does not escape the limit of the user in the path"""
+        user_id = random.randint(5000000, 6000000)
+        endpoint = base_url + ENDPOINT_USER_TASKS.format(userId=user_id)
+        limit = int(requests.get(endpoint).headers["X-RateLimit-Limit"])
+
+        def flood(_):
+            with requests.Session() as session:
+                return [session.get(endpoint, headers={USER_ID_HEADER: str(random.randint(6000001, 9000000))})
+                        for _ in range(limit // 8)]
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            responses = [response for batch in pool.map(flood, range(32)) for response in batch]
+
+        assert any(response.status_code == 429 for response in responses)
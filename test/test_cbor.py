@@ -0,0 +1,64 @@
+import requests
+from .cbor_client import CborClient, decode
+from .conftest import (
+    ENDPOINT_TASKS,
+    ENDPOINT_TASK_BY_ID,
+    ENDPOINT_TASK_COMMENT,
+    ENDPOINT_TASK_DETAILS,
+    ENDPOINT_USER_TASKS
+)
+
+
+class TestCbor:
+    """Tests for the content-negotiated CBOR wire format"""
+
+    def test_create_and_get_task(self, base_url, valid_task_data):
+        """Test creating a task from a CBOR body and reading it back as CBOR"""
+        client = CborClient(base_url)
+        response = client.post(ENDPOINT_TASKS, valid_task_data)
+
+        assert response.status_code == 201
+        created = decode(response)
+        assert created["title"] == valid_task_data["title"]
+        assert created["location"]["name"] == valid_task_data["location"]["name"]
+
+        fetched = decode(client.get(ENDPOINT_TASK_BY_ID.format(taskId=created["id"])))
+        assert fetched == created
+
+    def test_cbor_matches_json(self, base_url, created_task):
+        """Test that CBOR and JSON responses carry the same fields and values"""
+        endpoint = ENDPOINT_TASK_DETAILS.format(taskId=created_task["id"])
+        as_json = requests.get(base_url + endpoint).json()
+        as_cbor = decode(CborClient(base_url).get(endpoint))
+
+        assert as_cbor == as_json
+
+    def test_cbor_keys_are_sorted(self, base_url, created_task):
+        """Test that CBOR maps are written with a stable alphabetical key order"""
+        task = decode(CborClient(base_url).get(ENDPOINT_TASK_BY_ID.format(taskId=created_task["id"])))
+
+        assert list(task.keys()) == sorted(task.keys())
+
+    def test_list_and_comment(self, base_url, created_task):
+        """Test list responses and comment requests over CBOR"""
+        client = CborClient(base_url)
+        response = client.put(ENDPOINT_TASK_COMMENT.format(taskId=created_task["id"]),
+                              {"authorId": created_task["authorId"], "text": "CBOR comment"})
+        assert response.status_code == 200
+        assert decode(response)["text"] == "CBOR comment"
+
+        tasks = decode(client.get(ENDPOINT_USER_TASKS.format(userId=created_task["authorId"])))
+        assert created_task["id"] in [task["id"] for task in tasks]
+
+    def test_json_stays_default(self, base_url, created_task):
+        """Test that clients without an Accept header still get JSON"""
+        response = requests.get(base_url + ENDPOINT_TASK_BY_ID.format(taskId=created_task["id"]))
+
+        assert response.headers["Content-Type"].startswith("application/json")
+
+    def test_error_response_as_cbor(self, base_url):
+        """Test that errors are negotiated to CBOR as well"""
+        response = CborClient(base_url).get(ENDPOINT_TASK_BY_ID.format(taskId=99999999))
+
+        assert response.status_code == 404
+        assert decode(response)["status"] == 404
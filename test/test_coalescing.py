@@ -0,0 +1,69 @@
+import random
+import threading
+
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from .conftest import ENDPOINT_TASKS, ENDPOINT_GROUP_TASKS, ENDPOINT_TASK_BY_ID, ENDPOINT_TASK_DETAILS
+
+
+class TestRequestCoalescing:
+    """Tests that concurrent identical reads still return complete, current results"""
+
+    def test_concurrent_group_reads_return_same_list(self, base_url, valid_task_data):
+        """Test that concurrent reads of one group all get every task of the group"""
+        group_id = random.randint(7000000, 8000000)
+        created = set()
+        for _ in range(5):
+            response = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "groupId": group_id})
+            assert response.status_code == 201
+            created.add(response.json()["id"])
+
+        endpoint = base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id)
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            responses = list(pool.map(lambda _: requests.get(endpoint), range(32)))
+
+        for response in responses:
+            assert response.status_code == 200
+            assert {task["id"] for task in response.json()} == created
+
+    def test_concurrent_reads_of_missing_task_all_fail(self, base_url):
+        """Test that a not-found error is delivered to every coalesced caller"""
+        endpoint = base_url + ENDPOINT_TASK_DETAILS.format(taskId=999999999)
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            responses = list(pool.map(lambda _: requests.get(endpoint), range(16)))
+
+        assert all(response.status_code == 404 for response in responses)
+
+    def test_read_after_update_sees_the_update(self, base_url, valid_task_data):
+        """Test that a read issued after an update returns the updated task"""
+        task_id = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data).json()["id"]
+        requests.get(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id))
+
+        update = requests.put(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id), json={"title": "Coalesced"})
+        response = requests.get(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id))
+
+        assert update.status_code == 200
+        assert response.json()["title"] == "Coalesced"
+
+    def test_read_after_update_under_concurrent_reads(self, base_url, valid_task_data):
+        """Test that a client's read after its update is not served by a flight that started before the update"""
+        task_id = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data).json()["id"]
+        endpoint = base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id)
+        stop = threading.Event()
+
+        def read_continuously(_):
+            with requests.Session() as session:
+                while not stop.is_set():
+                    session.get(endpoint)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            readers = [pool.submit(read_continuously, i) for i in range(8)]
+            try:
+                for i in range(20):
+                    title = f"Coalesced {i}"
+                    assert requests.put(endpoint, json={"title": title}).status_code == 200
+                    assert requests.get(endpoint).json()["title"] == title
+            finally:
+                stop.set()
+            for reader in readers:
+                reader.result()
@@ -0,0 +1,53 @@
+import random
+import requests
+from .conftest import ENDPOINT_TASKS, ENDPOINT_GROUP_TASKS, ENDPOINT_TASK_BY_ID
+
+
+class TestCompression:
+    """Tests for Accept-Encoding negotiated response compression"""
+
+    def _group_with_tasks(self, base_url, valid_task_data, count=10):
+        group_id = random.randint(3000000, 4000000)
+        for _ in range(count):
+            response = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "groupId": group_id})
+            assert response.status_code == 201
+        return group_id
+
+    def test_large_list_is_gzipped(self, base_url, valid_task_data):
+        """Test that a list above the size threshold is gzip-compressed"""
+        group_id = self._group_with_tasks(base_url, valid_task_data)
+        response = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id),
+                                headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert len(response.json()) == 10
+
+    def test_streamed_list_is_gzipped(self, base_url, valid_task_data):
+        """Test that a streamed NDJSON list is compressed and decodes completely"""
+        group_id = self._group_with_tasks(base_url, valid_task_data)
+        response = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id),
+                                headers={"Accept": "application/x-ndjson", "Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert len([line for line in response.text.splitlines() if line.strip()]) == 10
+
+    def test_identity_is_not_compressed(self, base_url, valid_task_data):
+        """Test that clients not accepting compression get a plain body"""
+        group_id = self._group_with_tasks(base_url, valid_task_data)
+        response = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id),
+                                headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert len(response.json()) == 10
+
+    def test_small_response_is_not_compressed(self, base_url):
+        """Test that responses below the threshold are sent uncompressed"""
+        response = requests.get(base_url + ENDPOINT_TASK_BY_ID.format(taskId=99999999),
+                                headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 404
+        assert "Content-Encoding" not in response.headers
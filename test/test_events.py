@@ -0,0 +1,100 @@
+import json
+import random
+import threading
+import time
+
+import requests
+from .conftest import (ENDPOINT_TASKS, ENDPOINT_TASK_BY_ID, ENDPOINT_TASK_COMMENT, ENDPOINT_GROUP_EVENTS,
+                       ENDPOINT_USER_EVENTS)
+
+
+class EventStream:
+    """Reads named events from an SSE subscription on a background thread"""
+
+    def __init__(self, url):
+        self.response = requests.get(url, stream=True, headers={"Accept": "text/event-stream"}, timeout=30)
+        self.events = []
+        self.received = threading.Condition()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        name = None
+        try:
+            for line in self.response.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    name = line[len("event:"):].strip()
+                elif line.startswith("data:") and name:
+                    with self.received:
+                        self.events.append((name, json.loads(line[len("data:"):])))
+                        self.received.notify_all()
+                    name = None
+        except (requests.RequestException, AttributeError):
+            pass
+
+    def wait_for(self, predicate, timeout=10):
+        deadline = time.monotonic() + timeout
+        with self.received:
+            while True:
+                for event in self.events:
+                    if predicate(*event):
+                        return event
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self.received.wait(remaining)
+
+    def close(self):
+        self.response.close()
+
+
+class TestTaskEvents:
+    """Tests for the server-sent task event streams"""
+
+    def test_group_stream_receives_created_and_deleted(self, base_url, valid_task_data):
+        """Test that a group subscriber is told about tasks created and deleted in the group"""
+        group_id = random.randint(13000000, 14000000)
+        stream = EventStream(base_url + ENDPOINT_GROUP_EVENTS.format(groupId=group_id))
+        try:
+            task_id = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "groupId": group_id}).json()["id"]
+            requests.delete(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id))
+
+            created = stream.wait_for(lambda name, data: name == "CREATED" and data["taskId"] == task_id)
+            deleted = stream.wait_for(lambda name, data: name == "DELETED" and data["taskId"] == task_id)
+
+            assert created is not None
+            assert created[1]["groupId"] == group_id
+            assert deleted is not None
+        finally:
+            stream.close()
+
+    def test_user_stream_receives_comments_on_assigned_task(self, base_url, valid_task_data):
+        """Test that the doer of a task hears about comments on it"""
+        doer_id = random.randint(13000000, 14000000)
+        task_id = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "doerId": doer_id}).json()["id"]
+        stream = EventStream(base_url + ENDPOINT_USER_EVENTS.format(userId=doer_id))
+        try:
+            requests.put(base_url + ENDPOINT_TASK_COMMENT.format(taskId=task_id),
+                         json={"authorId": doer_id, "text": "Event comment"})
+
+            commented = stream.wait_for(lambda name, data: name == "COMMENTED" and data["taskId"] == task_id)
+
+            assert commented is not None
+            assert commented[1]["doerId"] == doer_id
+        finally:
+            stream.close()
+
+    def test_task_moved_out_of_group_notifies_old_group(self, base_url, valid_task_data):
+        """Test that subscribers of the previous group learn that a task left it"""
+        group_id = random.randint(13000000, 14000000)
+        task_id = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "groupId": group_id}).json()["id"]
+        stream = EventStream(base_url + ENDPOINT_GROUP_EVENTS.format(groupId=group_id))
+        try:
+            requests.put(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id), json={"groupId": group_id + 1})
+
+            updated = stream.wait_for(lambda name, data: name == "UPDATED" and data["taskId"] == task_id)
+
+            assert updated is not None
+            assert updated[1]["groupId"] == group_id + 1
+            assert updated[1]["previousGroupId"] == group_id
+        finally:
+            stream.close()
@@ -0,0 +1,166 @@
+import json
+import random
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from .conftest import (ENDPOINT_TASKS, ENDPOINT_NOTES, ENDPOINT_TASK_COMMENT, ENDPOINT_TASK_DETAILS,
+                       ENDPOINT_GROUP_TASKS, ENDPOINT_IMPORT)
+
+KEY_HEADER = "Idempotency-Key"
+USER_ID_HEADER = "X-User-Id"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def new_key():
+    return str(uuid.uuid4())
+
+
+class TestIdempotency:
+    """Tests for Idempotency-Key handling on create endpoints"""
+
+    def test_retried_create_returns_stored_task(self, base_url, valid_task_data):
+        """Test that a retried task create returns the first response and creates one task"""
+        group_id = random.randint(17000000, 18000000)
+        data = {**valid_task_data, "groupId": group_id}
+        headers = {KEY_HEADER: new_key()}
+
+        first = requests.post(base_url + ENDPOINT_TASKS, json=data, headers=headers)
+        retry = requests.post(base_url + ENDPOINT_TASKS, json=data, headers=headers)
+
+        assert first.status_code == 201
+        assert REPLAYED_HEADER not in first.headers
+        assert retry.status_code == 201
+        assert retry.headers[REPLAYED_HEADER] == "true"
+        assert retry.json() == first.json()
+        tasks = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id)).json()
+        assert [task["id"] for task in tasks] == [first.json()["id"]]
+
+    def test_different_keys_create_different_notes(self, base_url, valid_note_data):
+        """Test that requests with distinct keys are all executed"""
+        first = requests.post(base_url + ENDPOINT_NOTES, json=valid_note_data, headers={KEY_HEADER: new_key()})
+        second = requests.post(base_url + ENDPOINT_NOTES, json=valid_note_data, headers={KEY_HEADER: new_key()})
+
+        assert first.status_code == 201
+        assert second.status_code == 201
+        assert first.json()["id"] != second.json()["id"]
+
+    def test_requests_without_key_are_not_deduplicated(self, base_url, valid_task_data):
+        """Test that creates without a key behave as before"""
+        first = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data)
+        second = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data)
+
+        assert first.json()["id"] != second.json()["id"]
+
+    def test_retried_comment_is_added_once(self, base_url, created_task):
+        """Test that retrying a comment with the same key adds it once"""
+        endpoint = ENDPOINT_TASK_COMMENT.format(taskId=created_task["id"])
+        comment = {"authorId": created_task["authorId"], "text": "Idempotent comment"}
+        headers = {KEY_HEADER: new_key()}
+
+        for _ in range(3):
+            response = requests.put(base_url + endpoint, json=comment, headers=headers)
+            assert response.status_code == 200
+
+        details = requests.get(base_url + ENDPOINT_TASK_DETAILS.format(taskId=created_task["id"])).json()
+        assert [c["text"] for c in details["comments"]].count("Idempotent comment") == 1
+
+    def test_key_is_scoped_by_endpoint(self, base_url, valid_task_data, valid_note_data):
+        """Test that a key used for a task create is a separate request on the note create"""
+        headers = {KEY_HEADER: new_key()}
+        task = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data, headers=headers)
+
+        note = requests.post(base_url + ENDPOINT_NOTES, json=valid_note_data, headers=headers)
+
+        assert task.status_code == 201
+        assert note.status_code == 201
+        assert REPLAYED_HEADER not in note.headers
+        assert note.json()["id"] != task.json()["id"]
+
+    def test_key_is_scoped_by_user(self, base_url, valid_task_data):
+        """Test that two users sending the same key do not get each other's responses"""
+        key = new_key()
+        first = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data,
+                              headers={KEY_HEADER: key, USER_ID_HEADER: str(random.randint(5000000, 6000000))})
+        second = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data,
+                               headers={KEY_HEADER: key, USER_ID_HEADER: str(random.randint(6000001, 7000000))})
+
+        assert first.status_code == 201
+        assert second.status_code == 201
+        assert REPLAYED_HEADER not in second.headers
+        assert second.json()["id"] != first.json()["id"]
+
+    def test_key_reused_with_other_body_is_rejected(self, base_url, valid_task_data):
+        """Test that a key cannot be replayed for a create with a different body"""
+        headers = {KEY_HEADER: new_key()}
+        requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data, headers=headers)
+
+        response = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "title": "Other title"},
+                                 headers=headers)
+
+        assert response.status_code == 422
+
+    def test_large_bodies_are_compared_whole(self, base_url, valid_task_data):
+        """Test that bodies differing only past their first 64 KB are not replayed for each other"""
+        headers = {KEY_HEADER: new_key()}
+        padded = {"padding": "x" * (128 * 1024), **valid_task_data}
+        first = requests.post(base_url + ENDPOINT_TASKS, json=padded, headers=headers)
+
+        response = requests.post(base_url + ENDPOINT_TASKS, json={**padded, "title": "Other title"}, headers=headers)
+
+        assert first.status_code == 201
+        assert response.status_code == 422
+
+    def test_oversized_key_is_rejected(self, base_url, valid_task_data):
+        """Test that a key longer than allowed is a 400"""
+        response = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data, headers={KEY_HEADER: "k" * 256})
+
+        assert response.status_code == 400
+
+    def test_concurrent_retries_create_one_task(self, base_url, valid_task_data):
+        """Test that simultaneous requests with one key execute once"""
+        group_id = random.randint(17000000, 18000000)
+        data = {**valid_task_data, "groupId": group_id}
+        headers = {KEY_HEADER: new_key()}
+
+        with ThreadPoolExecutor(8) as pool:
+            responses = list(pool.map(
+                lambda _: requests.post(base_url + ENDPOINT_TASKS, json=data, headers=headers), range(8)))
+
+        assert all(response.status_code in (201, 409) for response in responses)
+        ids = {response.json()["id"] for response in responses if response.status_code == 201}
+        assert len(ids) == 1
+        tasks = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id)).json()
+        assert len(tasks) == 1
+
+    def test_retried_import_is_not_applied_twice(self, base_url, random_user_id):
+        """Test that a retried bulk import replays its events instead of importing again"""
+        group_id = random.randint(17000000, 18000000)
+        body = "\n".join(json.dumps({"title": f"Idempotent import {i}", "description": "Imported task",
+                                     "authorId": random_user_id, "groupId": group_id}) for i in range(3))
+        headers = {"Content-Type": "application/x-ndjson", KEY_HEADER: new_key()}
+
+        first = requests.post(base_url + ENDPOINT_IMPORT, data=body, headers=headers)
+        retry = requests.post(base_url + ENDPOINT_IMPORT, data=body, headers=headers)
+
+        assert first.status_code == 200
+        assert retry.headers[REPLAYED_HEADER] == "true"
+        assert retry.text == first.text
+        assert len(requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id)).json()) == 3
+
+    def test_key_reused_for_other_import_is_rejected(self, base_url, random_user_id):
+        """Test that an import retried with a different body is rejected instead of replayed"""
+        group_id = random.randint(17000000, 18000000)
+        headers = {"Content-Type": "application/x-ndjson", KEY_HEADER: new_key()}
+
+        def body(title):
+            return json.dumps({"title": title, "description": "Imported task",
+                               "authorId": random_user_id, "groupId": group_id})
+
+        first = requests.post(base_url + ENDPOINT_IMPORT, data=body("First import"), headers=headers)
+        retry = requests.post(base_url + ENDPOINT_IMPORT, data=body("Second import"), headers=headers)
+
+        assert first.status_code == 200
+        assert retry.status_code == 422
+        tasks = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id)).json()
+        assert [task["title"] for task in tasks] == ["First import"]
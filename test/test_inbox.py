@@ -0,0 +1,76 @@
+import random
+import requests
+from .conftest import ENDPOINT_TASKS, ENDPOINT_INBOX, ENDPOINT_NOTES
+
+
+def deadline(day):
+    return {"time": f"2031-01-{day:02d}T12:00:00Z", "remindByTime": True}
+
+
+class TestInbox:
+    """Tests for the unified inbox of authored, assigned and group tasks"""
+
+    def create(self, base_url, data):
+        response = requests.post(base_url + ENDPOINT_TASKS, json=data)
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    def test_inbox_merges_and_deduplicates(self, base_url, valid_task_data, valid_note_data):
+        """Test that authored, assigned and group tasks appear once each, notes not at all"""
+        user_id = random.randint(11000000, 12000000)
+        group_id = random.randint(11000000, 12000000)
+        authored = self.create(base_url, {**valid_task_data, "authorId": user_id})
+        assigned = self.create(base_url, {**valid_task_data, "doerId": user_id})
+        in_group = self.create(base_url, {**valid_task_data, "groupId": group_id})
+        everywhere = self.create(base_url, {**valid_task_data, "authorId": user_id, "doerId": user_id,
+                                            "groupId": group_id})
+        self.create(base_url, {**valid_task_data, "groupId": group_id + 1})
+        requests.post(base_url + ENDPOINT_NOTES, json={**valid_note_data, "authorId": user_id})
+
+        response = requests.get(base_url + ENDPOINT_INBOX.format(userId=user_id), params={"groupIds": group_id})
+
+        assert response.status_code == 200
+        ids = [task["id"] for task in response.json()["items"]]
+        assert sorted(ids) == sorted([authored, assigned, in_group, everywhere])
+        assert response.json()["hasMore"] is False
+
+    def test_inbox_sorted_by_deadline(self, base_url, valid_task_data):
+        """Test that the default order is by deadline, tasks without one last"""
+        user_id = random.randint(11000000, 12000000)
+        no_deadline = self.create(base_url, {**valid_task_data, "authorId": user_id, "deadline": None})
+        late = self.create(base_url, {**valid_task_data, "authorId": user_id, "deadline": deadline(20)})
+        early = self.create(base_url, {**valid_task_data, "authorId": user_id, "deadline": deadline(5)})
+
+        response = requests.get(base_url + ENDPOINT_INBOX.format(userId=user_id))
+
+        assert [task["id"] for task in response.json()["items"]] == [early, late, no_deadline]
+
+    def test_inbox_sorted_by_priority(self, base_url, valid_task_data):
+        """Test that priority order puts HIGH first and breaks ties by deadline"""
+        user_id = random.randint(11000000, 12000000)
+        low = self.create(base_url, {**valid_task_data, "authorId": user_id, "priority": "LOW",
+                                     "deadline": deadline(1)})
+        high_late = self.create(base_url, {**valid_task_data, "authorId": user_id, "priority": "HIGH",
+                                           "deadline": deadline(20)})
+        high_early = self.create(base_url, {**valid_task_data, "authorId": user_id, "priority": "HIGH",
+                                            "deadline": deadline(2)})
+        middle = self.create(base_url, {**valid_task_data, "authorId": user_id})
+
+        response = requests.get(base_url + ENDPOINT_INBOX.format(userId=user_id), params={"sort": "PRIORITY"})
+
+        assert [task["id"] for task in response.json()["items"]] == [high_early, high_late, middle, low]
+
+    def test_inbox_pages_cover_all_tasks(self, base_url, valid_task_data):
+        """Test that consecutive pages are disjoint and together hold the whole inbox"""
+        user_id = random.randint(11000000, 12000000)
+        created = {self.create(base_url, {**valid_task_data, "authorId": user_id}) for _ in range(5)}
+
+        endpoint = base_url + ENDPOINT_INBOX.format(userId=user_id)
+        first = requests.get(endpoint, params={"size": 2, "page": 0}).json()
+        second = requests.get(endpoint, params={"size": 2, "page": 1}).json()
+        third = requests.get(endpoint, params={"size": 2, "page": 2}).json()
+
+        assert first["hasMore"] and second["hasMore"] and not third["hasMore"]
+        seen = [task["id"] for page in (first, second, third) for task in page["items"]]
+        assert len(seen) == 5
+        assert set(seen) == created
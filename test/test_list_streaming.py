@@ -0,0 +1,83 @@
+import json
+import pytest
+import requests
+from .conftest import (
+    ENDPOINT_TASKS,
+    ENDPOINT_NOTES,
+    ENDPOINT_GROUP_TASKS,
+    ENDPOINT_GROUP_NOTES,
+    ENDPOINT_USER_TASKS
+)
+
+NDJSON = "application/x-ndjson"
+
+
+@pytest.fixture
+def group_with_tasks(base_url, valid_group_task_data):
+    """Creates several tasks in one group and returns their IDs"""
+    task_ids = []
+    for i in range(3):
+        task_data = valid_group_task_data.copy()
+        task_data["title"] = f"Streamed task {i}"
+        response = requests.post(base_url + ENDPOINT_TASKS, json=task_data)
+        assert response.status_code == 201
+        task_ids.append(response.json()["id"])
+    return {"groupId": valid_group_task_data["groupId"], "taskIds": task_ids}
+
+
+class TestListStreaming:
+    """Tests for streamed NDJSON and JSON array list responses"""
+
+    def test_group_tasks_as_ndjson(self, base_url, group_with_tasks):
+        """Test streaming group tasks as newline-delimited JSON"""
+        endpoint = ENDPOINT_GROUP_TASKS.format(groupId=group_with_tasks["groupId"])
+        response = requests.get(base_url + endpoint, headers={"Accept": NDJSON})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith(NDJSON)
+        tasks = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+        streamed_ids = [task["id"] for task in tasks]
+        for task_id in group_with_tasks["taskIds"]:
+            assert task_id in streamed_ids
+
+    def test_streamed_array_matches_buffered_list(self, base_url, group_with_tasks):
+        """Test that the streamed JSON array contains the same tasks as the regular list"""
+        endpoint = ENDPOINT_GROUP_TASKS.format(groupId=group_with_tasks["groupId"])
+        buffered = requests.get(base_url + endpoint)
+        streamed = requests.get(base_url + endpoint, params={"stream": "true"})
+
+        assert buffered.status_code == 200
+        assert streamed.status_code == 200
+        assert sorted(t["id"] for t in streamed.json()) == sorted(t["id"] for t in buffered.json())
+
+    def test_user_tasks_as_ndjson(self, base_url, created_task):
+        """Test streaming a user's tasks as NDJSON"""
+        endpoint = ENDPOINT_USER_TASKS.format(userId=created_task["authorId"])
+        response = requests.get(base_url + endpoint, headers={"Accept": NDJSON})
+
+        assert response.status_code == 200
+        tasks = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+        assert created_task["id"] in [task["id"] for task in tasks]
+
+    def test_empty_group_streams_nothing(self, base_url):
+        """Test that streaming an empty group returns no rows"""
+        endpoint = ENDPOINT_GROUP_TASKS.format(groupId=987654321)
+        ndjson_response = requests.get(base_url + endpoint, headers={"Accept": NDJSON})
+        array_response = requests.get(base_url + endpoint, params={"stream": "true"})
+
+        assert ndjson_response.status_code == 200
+        assert ndjson_response.text.strip() == ""
+        assert array_response.status_code == 200
+        assert array_response.json() == []
+
+    def test_group_notes_as_ndjson(self, base_url, valid_group_note_data):
+        """Test streaming group notes as NDJSON"""
+        created = requests.post(base_url + ENDPOINT_NOTES, json=valid_group_note_data)
+        assert created.status_code == 201
+
+        endpoint = ENDPOINT_GROUP_NOTES.format(groupId=valid_group_note_data["groupId"])
+        response = requests.get(base_url + endpoint, headers={"Accept": NDJSON})
+
+        assert response.status_code == 200
+        notes = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+        assert created.json()["id"] in [note["id"] for note in notes]
@@ -0,0 +1,71 @@
+import json
+import random
+import requests
+from .conftest import ENDPOINT_TASKS, ENDPOINT_TASK_BY_ID, ENDPOINT_NOTES, ENDPOINT_NOTE_BY_ID, ENDPOINT_IMPORT
+
+
+def shared_location():
+    return {"latitude": 55.751244, "longitude": 37.618423, "name": "Office " + str(random.randint(1, 10 ** 9)),
+            "remindByLocation": True}
+
+
+class TestSharedLocationPoints:
+    """Tests for tasks and notes sharing deduplicated location points"""
+
+    def test_tasks_at_same_place_keep_their_own_settings(self, base_url, valid_task_data):
+        """Test that tasks sharing a point keep their own remindByLocation flag"""
+        location = shared_location()
+        first = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "location": location}).json()
+        second = requests.post(base_url + ENDPOINT_TASKS, json={
+            **valid_task_data, "location": {**location, "remindByLocation": False}}).json()
+
+        assert first["location"]["name"] == second["location"]["name"] == location["name"]
+        assert first["location"]["remindByLocation"] is True
+        assert second["location"]["remindByLocation"] is False
+
+    def test_updating_one_task_location_leaves_the_other(self, base_url, valid_task_data):
+        """Test that moving one task does not move another task at the same place"""
+        location = shared_location()
+        first = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "location": location}).json()
+        second = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "location": location}).json()
+
+        moved = {**location, "latitude": 59.938630, "longitude": 30.314130, "name": "Branch"}
+        response = requests.put(base_url + ENDPOINT_TASK_BY_ID.format(taskId=first["id"]), json={"location": moved})
+        assert response.status_code == 200
+
+        untouched = requests.get(base_url + ENDPOINT_TASK_BY_ID.format(taskId=second["id"])).json()
+        assert untouched["location"]["name"] == location["name"]
+        assert untouched["location"]["latitude"] == location["latitude"]
+
+    def test_deleting_task_keeps_shared_point(self, base_url, valid_task_data, valid_note_data):
+        """Test that deleting a task does not remove the point a note still uses"""
+        location = shared_location()
+        task = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "location": location}).json()
+        note = requests.post(base_url + ENDPOINT_NOTES, json={**valid_note_data, "location": location}).json()
+
+        assert requests.delete(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task["id"])).status_code == 204
+
+        response = requests.get(base_url + ENDPOINT_NOTE_BY_ID.format(noteId=note["id"]))
+        assert response.status_code == 200
+        assert response.json()["location"]["name"] == location["name"]
+
+    def test_nearby_coordinates_share_a_point(self, base_url, valid_task_data):
+        """Test that coordinates equal to six decimals resolve to the first point written"""
+        location = shared_location()
+        first = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "location": location}).json()
+        nearby = {**location, "latitude": location["latitude"] + 0.0000001}
+        second = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "location": nearby}).json()
+
+        assert second["location"]["latitude"] == first["location"]["latitude"]
+
+    def test_import_with_repeated_location(self, base_url, random_user_id):
+        """Test that an import chunk full of one place is stored"""
+        location = shared_location()
+        body = "\n".join(json.dumps({"title": f"Import at office {i}", "description": "Imported task",
+                                     "authorId": random_user_id, "location": location}) for i in range(50))
+
+        response = requests.post(base_url + ENDPOINT_IMPORT, data=body, headers={"Content-Type": "application/x-ndjson"})
+
+        assert response.status_code == 200
+        summary = json.loads(response.text.splitlines()[-1])
+        assert summary["imported"] == 50
@@ -0,0 +1,50 @@
+import requests
+from .conftest import ENDPOINT_TASKS, ENDPOINT_TASKS_BATCH, ENDPOINT_NOTES
+
+MISSING_ID = 999999999
+
+
+class TestMultiGet:
+    """Tests for fetching several tasks and notes by ID in one request"""
+
+    def test_get_returns_items_in_request_order(self, base_url, valid_task_data, valid_note_data):
+        """Test that tasks and notes come back in request order with not-found markers"""
+        task = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data).json()
+        note = requests.post(base_url + ENDPOINT_NOTES, json=valid_note_data).json()
+
+        response = requests.get(base_url + ENDPOINT_TASKS,
+                                params={"ids": f"{note['id']},{MISSING_ID},{task['id']}"})
+
+        assert response.status_code == 200
+        items = response.json()
+        assert [item["id"] for item in items] == [note["id"], MISSING_ID, task["id"]]
+        assert items[0]["found"] is True
+        assert items[0]["note"]["title"] == valid_note_data["title"]
+        assert items[0]["task"] is None
+        assert items[1] == {"id": MISSING_ID, "found": False, "task": None, "note": None}
+        assert items[2]["task"]["title"] == valid_task_data["title"]
+        assert items[2]["task"]["location"]["name"] == valid_task_data["location"]["name"]
+        assert items[2]["task"]["deadline"]["time"] == valid_task_data["deadline"]["time"]
+
+    def test_post_variant_matches_get(self, base_url, valid_task_data):
+        """Test that the POST variant returns the same items, duplicates included"""
+        task_id = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data).json()["id"]
+
+        response = requests.post(base_url + ENDPOINT_TASKS_BATCH, json={"ids": [task_id, task_id]})
+        by_get = requests.get(base_url + ENDPOINT_TASKS, params={"ids": f"{task_id},{task_id}"})
+
+        assert response.status_code == 200
+        assert response.json() == by_get.json()
+        assert len(response.json()) == 2
+
+    def test_too_many_ids_rejected(self, base_url):
+        """Test that requests above the configured maximum are rejected"""
+        response = requests.post(base_url + ENDPOINT_TASKS_BATCH, json={"ids": list(range(1, 1002))})
+
+        assert response.status_code == 400
+
+    def test_missing_ids_rejected(self, base_url):
+        """Test that a POST body without ids fails validation"""
+        response = requests.post(base_url + ENDPOINT_TASKS_BATCH, json={})
+
+        assert response.status_code == 400
@@ -3,7 +3,8 @@ import requests
 from .conftest import (
     ENDPOINT_NOTE_COMMENT,
     ENDPOINT_NOTE_COMMENT_DELETE,
-    ENDPOINT_NOTE_DETAILS
+    ENDPOINT_NOTE_DETAILS,
+    ENDPOINT_NOTE_BY_ID
 )
 
 
@@ -144,4 +145,19 @@ class TestNoteComments:
 
         assert response.status_code == 200
         comment = response.json()
-        assert len(comment["text"]) == text_length
\ No newline at end of file
+        assert len(comment["text"]) == text_length
+
+    def test_note_comment_count_tracks_add_and_delete(self, base_url, note_with_comment):
+        """Test that commentCount on a note follows comment additions and deletions"""
+        note_endpoint = ENDPOINT_NOTE_BY_ID.format(noteId=note_with_comment["note"]["id"])
+        note = requests.get(base_url + note_endpoint).json()
+        assert note["commentCount"] == 1
+        assert note["lastCommentAt"] is not None
+
+        comment_id = note_with_comment["comment"]["id"]
+        delete_endpoint = ENDPOINT_NOTE_COMMENT_DELETE.format(commentId=comment_id)
+        assert requests.delete(base_url + delete_endpoint).status_code == 204
+
+        note = requests.get(base_url + note_endpoint).json()
+        assert note["commentCount"] == 0
+        assert note.get("lastCommentAt") is None
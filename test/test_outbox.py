@@ -0,0 +1,114 @@
+import json
+import os
+import random
+import time
+
+import pytest
+import requests
+from .conftest import (ENDPOINT_TASKS, ENDPOINT_TASK_BY_ID, ENDPOINT_TASK_COMMENT, ENDPOINT_NOTES,
+                       ENDPOINT_NOTE_BY_ID, ENDPOINT_ADD_SUBTASK, ENDPOINT_UPDATE_SUBTASK_STATUS,
+                       ENDPOINT_SUBTASK_BY_ID)
+
+# Written by the file sink of the dev profile, relative to the service's working directory
+OUTBOX_FILE = os.environ.get("OUTBOX_FILE", "outbox/task-events.ndjson")
+RELAYED_METRIC = "/actuator/metrics/outbox.relay.messages"
+LAG_METRIC = "/actuator/metrics/outbox.relay.lag"
+
+
+def relayed_events(task_id, count, timeout=10):
+    """Waits until the file sink holds count events for the task and returns them in file order"""
+    deadline = time.monotonic() + timeout
+    events = []
+    while time.monotonic() < deadline:
+        with open(OUTBOX_FILE) as outbox:
+            events = [message for message in map(json.loads, outbox)
+                      if message["event"]["taskId"] == task_id]
+        if len(events) >= count:
+            break
+        time.sleep(0.2)
+    return events
+
+
+@pytest.fixture
+def outbox_file():
+    if not os.path.exists(OUTBOX_FILE):
+        pytest.skip(f"No file sink output at {OUTBOX_FILE}; run the service with the dev profile "
+                    "or set OUTBOX_FILE to its sink path")
+    return OUTBOX_FILE
+
+
+class TestOutbox:
+    """Tests for the transactional outbox and its relay"""
+
+    def test_lifecycle_is_relayed_in_order(self, base_url, valid_task_data, outbox_file):
+        """Test that create, comment, update and delete of a task reach the sink in that order"""
+        group_id = random.randint(15000000, 16000000)
+        task_id = requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "groupId": group_id}).json()["id"]
+        requests.put(base_url + ENDPOINT_TASK_COMMENT.format(taskId=task_id),
+                     json={"authorId": valid_task_data["authorId"], "text": "Outbox comment"})
+        requests.put(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id), json={"groupId": group_id + 1})
+        requests.delete(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id))
+
+        events = relayed_events(task_id, 4)
+
+        assert [message["event"]["type"] for message in events] == ["CREATED", "COMMENTED", "UPDATED", "DELETED"]
+        assert [message["id"] for message in events] == sorted(message["id"] for message in events)
+        assert events[0]["event"]["groupId"] == group_id
+        assert events[2]["event"]["previousGroupId"] == group_id
+
+    def test_note_lifecycle_is_relayed(self, base_url, valid_note_data, outbox_file):
+        """Test that create, update and delete of a note reach the sink in that order"""
+        group_id = random.randint(15000000, 16000000)
+        note_id = requests.post(base_url + ENDPOINT_NOTES, json=valid_note_data).json()["id"]
+        requests.put(base_url + ENDPOINT_NOTE_BY_ID.format(noteId=note_id), json={"groupId": group_id})
+        requests.delete(base_url + ENDPOINT_NOTE_BY_ID.format(noteId=note_id))
+
+        events = relayed_events(note_id, 3)
+
+        assert [message["event"]["type"] for message in events] == ["CREATED", "UPDATED", "DELETED"]
+        assert events[0]["event"]["taskType"] == 1
+        assert events[1]["event"]["groupId"] == group_id
+
+    def test_subtask_changes_are_relayed_as_task_updates(self, base_url, valid_task_data, outbox_file):
+        """Test that adding, completing and deleting a subtask each relay an update of its task"""
+        task_id = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data).json()["id"]
+        subtask_id = requests.post(base_url + ENDPOINT_ADD_SUBTASK.format(taskId=task_id),
+                                   json={"text": "Outbox subtask"}).json()["id"]
+        requests.put(base_url + ENDPOINT_UPDATE_SUBTASK_STATUS.format(subtaskId=subtask_id), json={"status": "DONE"})
+        requests.delete(base_url + ENDPOINT_SUBTASK_BY_ID.format(subtaskId=subtask_id))
+
+        events = relayed_events(task_id, 4)
+
+        assert [message["event"]["type"] for message in events] == ["CREATED", "UPDATED", "UPDATED", "UPDATED"]
+
+    def test_failed_write_is_not_relayed(self, base_url, valid_task_data, outbox_file):
+        """Test that a delete rejected with 404 adds no event"""
+        task_id = requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data).json()["id"]
+        requests.delete(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id))
+
+        response = requests.delete(base_url + ENDPOINT_TASK_BY_ID.format(taskId=task_id))
+        assert response.status_code == 404
+
+        relayed_events(task_id, 2)
+        events = relayed_events(task_id, 3, timeout=2)
+        assert [message["event"]["type"] for message in events] == ["CREATED", "DELETED"]
+
+    def test_relay_metrics(self, base_url, valid_task_data):
+        """Test that the relay reports delivered messages and its lag"""
+        before = requests.get(base_url + RELAYED_METRIC)
+        if before.status_code == 404:
+            pytest.skip("Outbox relay is disabled")
+        relayed_before = before.json()["measurements"][0]["value"]
+
+        requests.post(base_url + ENDPOINT_TASKS, json=valid_task_data)
+
+        deadline = time.monotonic() + 10
+        relayed = relayed_before
+        while relayed <= relayed_before and time.monotonic() < deadline:
+            time.sleep(0.2)
+            relayed = requests.get(base_url + RELAYED_METRIC).json()["measurements"][0]["value"]
+        assert relayed > relayed_before
+
+        lag = requests.get(base_url + LAG_METRIC)
+        assert lag.status_code == 200
+        assert lag.json()["measurements"][0]["value"] >= 0
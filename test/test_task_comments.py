@@ -3,7 +3,8 @@ import requests
 from .conftest import (
     ENDPOINT_TASK_COMMENT,
     ENDPOINT_COMMENT_DELETE,
-    ENDPOINT_TASK_DETAILS
+    ENDPOINT_TASK_DETAILS,
+    ENDPOINT_TASK_BY_ID
 )
 
 class TestTaskComments:
@@ -130,4 +131,33 @@ class TestTaskComments:
         response = requests.put(base_url + endpoint, json=comment_data)
 
         # Should either accept empty text or return 400
-        assert response.status_code in [200, 400]
\ No newline at end of file
+        assert response.status_code in [200, 400]
+
+    def test_new_task_has_zero_comment_count(self, created_task):
+        """Test that a newly created task reports no comments"""
+        assert created_task["commentCount"] == 0
+        assert created_task.get("lastCommentAt") is None
+
+    def test_comment_count_tracks_add_and_delete(self, base_url, created_task, registered_authorized_user):
+        """Test that commentCount and lastCommentAt follow comment additions and deletions"""
+        endpoint = ENDPOINT_TASK_COMMENT.format(taskId=created_task["id"])
+        comments = []
+        for text in ["First comment", "Second comment"]:
+            response = requests.put(base_url + endpoint, json={
+                "authorId": registered_authorized_user.get("userId"),
+                "text": text
+            })
+            assert response.status_code == 200
+            comments.append(response.json())
+
+        task_endpoint = ENDPOINT_TASK_BY_ID.format(taskId=created_task["id"])
+        task = requests.get(base_url + task_endpoint).json()
+        assert task["commentCount"] == 2
+        assert task["lastCommentAt"] is not None
+
+        delete_endpoint = ENDPOINT_COMMENT_DELETE.format(commentId=comments[1]["id"])
+        assert requests.delete(base_url + delete_endpoint).status_code == 204
+
+        task = requests.get(base_url + task_endpoint).json()
+        assert task["commentCount"] == 1
+        assert task["lastCommentAt"] is not None
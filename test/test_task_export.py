@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+import requests
+from .conftest import ENDPOINT_EXPORT_GROUP, ENDPOINT_EXPORT_USER
+
+
+class TestTaskExport:
+    """Tests for streaming CSV and NDJSON exports"""
+
+    def test_export_group_as_ndjson(self, base_url, created_group_task):
+        """Test exporting a group's tasks as NDJSON"""
+        endpoint = ENDPOINT_EXPORT_GROUP.format(groupId=created_group_task["groupId"])
+        response = requests.get(base_url + endpoint)
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+        exported = {row["id"]: row for row in rows}
+        assert created_group_task["id"] in exported
+        row = exported[created_group_task["id"]]
+        assert row["title"] == created_group_task["title"]
+        assert row["groupId"] == created_group_task["groupId"]
+        assert row["locationName"] == created_group_task["location"]["name"]
+
+    def test_export_group_as_csv(self, base_url, created_group_task):
+        """Test exporting a group's tasks as CSV with a header row"""
+        endpoint = ENDPOINT_EXPORT_GROUP.format(groupId=created_group_task["groupId"])
+        response = requests.get(base_url + endpoint, params={"format": "CSV"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert str(created_group_task["id"]) in [row["id"] for row in rows]
+        assert "title" in rows[0]
+
+    def test_export_user_with_comments(self, base_url, task_with_comment):
+        """Test exporting a user's tasks including comments"""
+        task = task_with_comment["task"]
+        endpoint = ENDPOINT_EXPORT_USER.format(userId=task["authorId"])
+        response = requests.get(base_url + endpoint, params={"comments": "true"})
+
+        assert response.status_code == 200
+        rows = {row["id"]: row for row in map(json.loads, filter(str.strip, response.text.splitlines()))}
+        comments = rows[task["id"]]["comments"]
+        assert task_with_comment["comment"]["id"] in [comment["id"] for comment in comments]
+
+    def test_export_without_comments_omits_them(self, base_url, task_with_comment):
+        """Test that comments are not exported unless requested"""
+        task = task_with_comment["task"]
+        endpoint = ENDPOINT_EXPORT_USER.format(userId=task["authorId"])
+        response = requests.get(base_url + endpoint)
+
+        assert response.status_code == 200
+        for line in filter(str.strip, response.text.splitlines()):
+            assert "comments" not in json.loads(line)
+
+    def test_export_invalid_format(self, base_url):
+        """Test exporting with an unsupported format"""
+        endpoint = ENDPOINT_EXPORT_GROUP.format(groupId=1)
+        response = requests.get(base_url + endpoint, params={"format": "XML"})
+
+        assert response.status_code == 400
@@ -0,0 +1,123 @@
+import json
+import random
+import requests
+from .conftest import (
+    ENDPOINT_IMPORT,
+    ENDPOINT_EXPORT_GROUP,
+    ENDPOINT_GROUP_TASKS,
+    ENDPOINT_GROUP_NOTES
+)
+
+
+def parse_events(response):
+    return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+
+class TestTaskImport:
+    """Tests for the streaming bulk import endpoint"""
+
+    def test_import_tasks_as_ndjson(self, base_url, random_user_id, valid_location_data, valid_deadline_data):
+        """Test importing tasks with per-line errors for invalid records"""
+        group_id = random.randint(1000000, 2000000)
+        records = [
+            {"title": "Imported 1", "description": "First", "authorId": random_user_id, "groupId": group_id,
+             "location": valid_location_data, "deadline": valid_deadline_data, "priority": "HIGH"},
+            {"title": "", "description": "Missing title", "authorId": random_user_id, "groupId": group_id},
+            {"title": "Imported 2", "description": "Second", "authorId": random_user_id, "groupId": group_id},
+        ]
+        body = "\n".join(json.dumps(record) for record in records) + "\n{not json\n"
+
+        response = requests.post(base_url + ENDPOINT_IMPORT, data=body,
+                                 headers={"Content-Type": "application/x-ndjson"})
+
+        assert response.status_code == 200
+        events = parse_events(response)
+        errors = [event for event in events if event["event"] == "error"]
+        assert [error["line"] for error in errors] == [2, 4]
+        summary = events[-1]
+        assert summary["event"] == "summary"
+        assert summary["processed"] == 4
+        assert summary["imported"] == 2
+        assert summary["failed"] == 2
+
+        tasks = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id)).json()
+        by_title = {task["title"]: task for task in tasks}
+        assert set(by_title) == {"Imported 1", "Imported 2"}
+        assert by_title["Imported 1"]["priority"] == "HIGH"
+        assert by_title["Imported 1"]["location"]["name"] == valid_location_data["name"]
+        assert by_title["Imported 2"]["priority"] == "MIDDLE"
+        assert by_title["Imported 2"]["status"] == "UNDONE"
+
+    def test_import_notes_as_csv(self, base_url, random_user_id):
+        """Test importing notes from CSV"""
+        group_id = random.randint(1000000, 2000000)
+        body = ("title,description,authorId,groupId\n"
+                f"CSV note 1,First note,{random_user_id},{group_id}\n"
+                f"CSV note 2,Second note,{random_user_id},{group_id}\n"
+                f"CSV note 3,,{random_user_id},{group_id}\n")
+
+        response = requests.post(base_url + ENDPOINT_IMPORT, params={"type": "NOTE", "format": "CSV"},
+                                 data=body, headers={"Content-Type": "text/csv"})
+
+        assert response.status_code == 200
+        events = parse_events(response)
+        assert [event["line"] for event in events if event["event"] == "error"] == [4]
+        assert events[-1]["imported"] == 2
+
+        notes = requests.get(base_url + ENDPOINT_GROUP_NOTES.format(groupId=group_id)).json()
+        assert sorted(note["title"] for note in notes) == ["CSV note 1", "CSV note 2"]
+
+    def test_import_csv_export(self, base_url, created_group_task):
+        """Test that a CSV export can be imported back"""
+        group_id = created_group_task["groupId"]
+        exported = requests.get(base_url + ENDPOINT_EXPORT_GROUP.format(groupId=group_id),
+                                params={"format": "CSV"})
+        assert exported.status_code == 200
+        exported_rows = len(exported.text.strip().splitlines()) - 1
+
+        response = requests.post(base_url + ENDPOINT_IMPORT, params={"format": "CSV"},
+                                 data=exported.content, headers={"Content-Type": "text/csv"})
+
+        assert response.status_code == 200
+        summary = parse_events(response)[-1]
+        assert summary["failed"] == 0
+        assert summary["imported"] == exported_rows
+
+    def test_oversized_record_is_rejected_alone(self, base_url, random_user_id):
+        """Test that a record longer than the limit fails its own line and the rest is imported"""
+        group_id = random.randint(1000000, 2000000)
+        record = {"authorId": random_user_id, "groupId": group_id, "description": "Around an oversized line"}
+        body = "\n".join([
+            json.dumps({**record, "title": "Before oversized"}),
+            json.dumps({**record, "title": "Oversized", "description": "x" * (4 * 1024 * 1024)}),
+            json.dumps({**record, "title": "After oversized"}),
+        ])
+
+        response = requests.post(base_url + ENDPOINT_IMPORT, data=body,
+                                 headers={"Content-Type": "application/x-ndjson"})
+
+        assert response.status_code == 200
+        events = parse_events(response)
+        errors = [event for event in events if event["event"] == "error"]
+        assert [error["line"] for error in errors] == [2]
+        assert "longer than" in errors[0]["message"]
+        assert events[-1]["imported"] == 2
+        tasks = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=group_id)).json()
+        assert sorted(task["title"] for task in tasks) == ["After oversized", "Before oversized"]
+
+    def test_oversized_csv_record_is_rejected_alone(self, base_url, random_user_id):
+        """Test that an oversized quoted CSV value spanning lines fails one record"""
+        group_id = random.randint(1000000, 2000000)
+        oversized = "\n".join(["y" * 1024] * 4096)
+        body = ("title,description,authorId,groupId\n"
+                f"CSV before,First,{random_user_id},{group_id}\n"
+                f"CSV oversized,\"{oversized}\",{random_user_id},{group_id}\n"
+                f"CSV after,Last,{random_user_id},{group_id}\n")
+
+        response = requests.post(base_url + ENDPOINT_IMPORT, params={"type": "NOTE", "format": "CSV"},
+                                 data=body, headers={"Content-Type": "text/csv"})
+
+        assert response.status_code == 200
+        events = parse_events(response)
+        assert [event["line"] for event in events if event["event"] == "error"] == [3]
+        assert events[-1]["imported"] == 2
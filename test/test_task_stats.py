@@ -0,0 +1,87 @@
+import random
+import requests
+from datetime import datetime, timedelta
+from .conftest import (ENDPOINT_TASKS, ENDPOINT_TASK_BY_ID, ENDPOINT_NOTES, ENDPOINT_GROUP_STATS,
+                       ENDPOINT_USER_STATS, ENDPOINT_STATS_REBUILD)
+
+
+def group_stats(base_url, group_id):
+    response = requests.get(base_url + ENDPOINT_GROUP_STATS.format(groupId=group_id))
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestTaskStats:
+    """Tests for the group and user dashboard counters"""
+
+    def test_empty_group_has_zero_counts(self, base_url):
+        """Test that a group without tasks reports zeros for every bucket"""
+        stats = group_stats(base_url, random.randint(9000000, 10000000))
+
+        assert stats["total"] == 0
+        assert stats["overdue"] == 0
+        assert stats["byStatus"] == {"UNDONE": 0, "DONE": 0}
+        assert stats["byPriority"] == {"LOW": 0, "MIDDLE": 0, "HIGH": 0}
+
+    def test_create_update_delete_adjust_counts(self, base_url, valid_task_data):
+        """Test that the counters follow task creation, status changes and deletion"""
+        group_id = random.randint(9000000, 10000000)
+        data = {**valid_task_data, "groupId": group_id, "priority": "HIGH"}
+        first = requests.post(base_url + ENDPOINT_TASKS, json=data).json()["id"]
+        second = requests.post(base_url + ENDPOINT_TASKS, json=data).json()["id"]
+
+        stats = group_stats(base_url, group_id)
+        assert stats["total"] == 2
+        assert stats["byStatus"]["UNDONE"] == 2
+        assert stats["byPriority"]["HIGH"] == 2
+
+        requests.put(base_url + ENDPOINT_TASK_BY_ID.format(taskId=first), json={"status": "DONE", "priority": "LOW"})
+        stats = group_stats(base_url, group_id)
+        assert stats["byStatus"] == {"UNDONE": 1, "DONE": 1}
+        assert stats["byPriority"]["LOW"] == 1
+        assert stats["byPriority"]["HIGH"] == 1
+
+        requests.delete(base_url + ENDPOINT_TASK_BY_ID.format(taskId=second))
+        stats = group_stats(base_url, group_id)
+        assert stats["total"] == 1
+        assert stats["byStatus"]["UNDONE"] == 0
+
+    def test_overdue_counts_open_tasks_past_deadline(self, base_url, valid_task_data):
+        """Test that only open tasks whose deadline has passed are overdue"""
+        group_id = random.randint(9000000, 10000000)
+        past = (datetime.utcnow() - timedelta(days=1)).isoformat() + "Z"
+        data = {**valid_task_data, "groupId": group_id, "deadline": {"time": past, "remindByTime": False}}
+        late = requests.post(base_url + ENDPOINT_TASKS, json=data).json()["id"]
+        requests.post(base_url + ENDPOINT_TASKS, json=data)
+        requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "groupId": group_id})
+
+        assert group_stats(base_url, group_id)["overdue"] == 2
+
+        requests.put(base_url + ENDPOINT_TASK_BY_ID.format(taskId=late), json={"status": "DONE"})
+        assert group_stats(base_url, group_id)["overdue"] == 1
+
+    def test_user_stats_ignore_notes(self, base_url, valid_task_data, valid_note_data):
+        """Test that user counters cover authored tasks but not notes"""
+        user_id = random.randint(9000000, 10000000)
+        requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "authorId": user_id})
+        requests.post(base_url + ENDPOINT_NOTES, json={**valid_note_data, "authorId": user_id})
+
+        response = requests.get(base_url + ENDPOINT_USER_STATS.format(userId=user_id))
+
+        assert response.status_code == 200
+        assert response.json()["scopeType"] == "USER"
+        assert response.json()["total"] == 1
+
+    def test_rebuild_matches_incremental_counts(self, base_url, valid_task_data):
+        """Test that a full rebuild yields the counters maintained incrementally"""
+        group_id = random.randint(9000000, 10000000)
+        for priority in ("LOW", "MIDDLE", "HIGH"):
+            requests.post(base_url + ENDPOINT_TASKS, json={**valid_task_data, "groupId": group_id,
+                                                           "priority": priority})
+        before = group_stats(base_url, group_id)
+
+        response = requests.post(base_url + ENDPOINT_STATS_REBUILD)
+
+        assert response.status_code == 200
+        assert response.json()["rows"] > 0
+        assert group_stats(base_url, group_id) == before
@@ -0,0 +1,123 @@
+import pytest
+import requests
+from .conftest import (
+    ENDPOINT_ADD_SUBTASK,
+    ENDPOINT_UPDATE_SUBTASK_STATUS,
+    ENDPOINT_SUBTASK_BY_ID,
+    ENDPOINT_TASK_BY_ID,
+    ENDPOINT_TASK_DETAILS
+)
+
+
+class TestTaskSubtasks:
+    """Tests for subtask operations and parent progress counters"""
+
+    def test_add_subtask_success(self, task_with_subtask):
+        """Test adding a subtask to a task"""
+        subtask = task_with_subtask["subtask"]
+
+        assert "id" in subtask
+        assert subtask["taskId"] == task_with_subtask["task"]["id"]
+        assert subtask["text"] == "Test subtask description"
+        assert subtask["status"] == "UNDONE"
+        assert "createdAt" in subtask
+
+    def test_new_task_has_empty_progress(self, created_task):
+        """Test that a newly created task has no subtask progress"""
+        assert created_task["subtasksTotal"] == 0
+        assert created_task["subtasksDone"] == 0
+
+    def test_add_subtask_to_nonexistent_task(self, base_url):
+        """Test adding a subtask to a non-existent task"""
+        endpoint = ENDPOINT_ADD_SUBTASK.format(taskId=99999)
+        response = requests.post(base_url + endpoint, json={"text": "Orphan subtask"})
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("text", ["", None])
+    def test_add_subtask_invalid_text(self, base_url, created_task, text):
+        """Test adding a subtask without text"""
+        endpoint = ENDPOINT_ADD_SUBTASK.format(taskId=created_task["id"])
+        response = requests.post(base_url + endpoint, json={"text": text})
+
+        assert response.status_code == 400
+
+    def test_progress_counters_follow_status_changes(self, base_url, task_with_subtask):
+        """Test that parent progress counters are updated on subtask status changes"""
+        task_id = task_with_subtask["task"]["id"]
+        second = requests.post(base_url + ENDPOINT_ADD_SUBTASK.format(taskId=task_id),
+                               json={"text": "Second subtask"})
+        assert second.status_code == 201
+
+        task_endpoint = ENDPOINT_TASK_BY_ID.format(taskId=task_id)
+        task = requests.get(base_url + task_endpoint).json()
+        assert task["subtasksTotal"] == 2
+        assert task["subtasksDone"] == 0
+
+        status_endpoint = ENDPOINT_UPDATE_SUBTASK_STATUS.format(subtaskId=task_with_subtask["subtask"]["id"])
+        response = requests.put(base_url + status_endpoint, json={"status": "DONE"})
+        assert response.status_code == 200
+        assert response.json()["status"] == "DONE"
+
+        # Repeating the same transition must not be counted twice
+        response = requests.put(base_url + status_endpoint, json={"status": "DONE"})
+        assert response.status_code == 200
+
+        task = requests.get(base_url + task_endpoint).json()
+        assert task["subtasksTotal"] == 2
+        assert task["subtasksDone"] == 1
+
+        response = requests.put(base_url + status_endpoint, json={"status": "UNDONE"})
+        assert response.status_code == 200
+
+        task = requests.get(base_url + task_endpoint).json()
+        assert task["subtasksDone"] == 0
+
+    @pytest.mark.parametrize("invalid_status", ["COMPLETED", "done", "", None])
+    def test_update_subtask_invalid_status(self, base_url, task_with_subtask, invalid_status):
+        """Test updating a subtask with an invalid status"""
+        endpoint = ENDPOINT_UPDATE_SUBTASK_STATUS.format(subtaskId=task_with_subtask["subtask"]["id"])
+        response = requests.put(base_url + endpoint, json={"status": invalid_status})
+
+        assert response.status_code == 400
+
+    def test_update_nonexistent_subtask_status(self, base_url):
+        """Test updating the status of a non-existent subtask"""
+        endpoint = ENDPOINT_UPDATE_SUBTASK_STATUS.format(subtaskId=99999999)
+        response = requests.put(base_url + endpoint, json={"status": "DONE"})
+
+        assert response.status_code == 404
+
+    def test_subtasks_in_task_details(self, base_url, task_with_subtask):
+        """Test that task details include subtasks and progress"""
+        endpoint = ENDPOINT_TASK_DETAILS.format(taskId=task_with_subtask["task"]["id"])
+        response = requests.get(base_url + endpoint)
+
+        assert response.status_code == 200
+        task_details = response.json()
+        subtask_ids = [s["id"] for s in task_details["subtasks"]]
+        assert subtask_ids == [task_with_subtask["subtask"]["id"]]
+        assert task_details["subtasksTotal"] == 1
+        assert task_details["subtasksDone"] == 0
+
+    def test_delete_subtask_updates_progress(self, base_url, task_with_subtask):
+        """Test that deleting a done subtask decrements both counters"""
+        subtask_id = task_with_subtask["subtask"]["id"]
+        status_endpoint = ENDPOINT_UPDATE_SUBTASK_STATUS.format(subtaskId=subtask_id)
+        assert requests.put(base_url + status_endpoint, json={"status": "DONE"}).status_code == 200
+
+        response = requests.delete(base_url + ENDPOINT_SUBTASK_BY_ID.format(subtaskId=subtask_id))
+        assert response.status_code == 204
+
+        task_endpoint = ENDPOINT_TASK_BY_ID.format(taskId=task_with_subtask["task"]["id"])
+        task = requests.get(base_url + task_endpoint).json()
+        assert task["subtasksTotal"] == 0
+        assert task["subtasksDone"] == 0
+
+    def test_delete_task_with_subtasks(self, base_url, task_with_subtask):
+        """Test that a task with subtasks can be deleted"""
+        endpoint = ENDPOINT_TASK_BY_ID.format(taskId=task_with_subtask["task"]["id"])
+        response = requests.delete(base_url + endpoint)
+
+        assert response.status_code == 204
+        assert requests.get(base_url + endpoint).status_code == 404
@@ -0,0 +1,33 @@
+import requests
+from .conftest import ENDPOINT_GROUP_TASKS, ENDPOINT_GROUP_NOTES, ENDPOINT_LIVENESS, ENDPOINT_READINESS
+
+# Scratch group the warmup runs against, see task-service.warmup.group-id
+WARMUP_GROUP_ID = -1
+
+
+class TestWarmup:
+    """Tests for the startup warmup and the health probes gated by it"""
+
+    def test_readiness_probe_is_up(self, base_url):
+        """Test that a started instance reports ready once warmup is done"""
+        response = requests.get(base_url + ENDPOINT_READINESS)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "UP"
+
+    def test_liveness_probe_is_up(self, base_url):
+        """Test that the liveness probe is exposed"""
+        response = requests.get(base_url + ENDPOINT_LIVENESS)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "UP"
+
+    def test_warmup_leaves_no_tasks_behind(self, base_url):
+        """Test that tasks and notes created during warmup were rolled back"""
+        tasks = requests.get(base_url + ENDPOINT_GROUP_TASKS.format(groupId=WARMUP_GROUP_ID))
+        notes = requests.get(base_url + ENDPOINT_GROUP_NOTES.format(groupId=WARMUP_GROUP_ID))
+
+        assert tasks.status_code == 200
+        assert tasks.json() == []
+        assert notes.status_code == 200
+        assert notes.json() == []